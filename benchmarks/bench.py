@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""Benchmark suite for the Bridge GAD generation pipeline.
+
+Times every stage of the pipeline over the ``inputs/`` workbooks and
+synthetic 1/10/50/200-span bridges, stores the results as JSON and
+compares two result files for regressions.
+
+Benchmarks:
+  parse.read_variables_from_excel   3-column workbook → variables
+  parse.smart_input                 SmartInputProcessor.read_input
+  stage.<draw_*>                    each BridgeGADGenerator.DRAW_STAGES entry
+  generate.bytes                    full uncached generate_bytes (also peak memory)
+  generate.stream                   stream_dxf into a file (also peak memory)
+  save.dxf                          doc.saveas
+  export.pdf / .svg / .png / .html  MultiFormatExporter
+  calc.recalculate                  CalcEngine.with_bridge_defaults().recalculate
+  calc.recalculate_large            the defaults plus 500 chained derived formulas
+  calc.sweep                        CalcEngine.sweep over a 100×10×10 SPAN1/NSPAN/SLBTHE grid
+
+Usage:
+    python benchmarks/bench.py run                       # full suite
+    python benchmarks/bench.py run --quick -k stage.     # subset
+    python benchmarks/bench.py run -k generate. --no-inputs --spans 10 100 500
+    python benchmarks/bench.py compare                   # two latest results
+    python benchmarks/bench.py compare base.json new.json --threshold 0.15
+    python benchmarks/bench.py list
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from cases import ROOT, Case, load_cases  # noqa: E402
+
+from bridge_gad import __version__  # noqa: E402
+from bridge_gad.bridge_generator import BridgeGADGenerator  # noqa: E402
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# A benchmark factory returns the zero-argument callable that is timed.
+Factory = Callable[[Case, "Context"], Callable[[], Any]]
+
+
+@dataclass
+class Benchmark:
+    name: str
+    factory: Factory
+    fresh: bool = False  # call the factory before every round (state is consumed)
+    memory: bool = False  # also record the peak traced allocation of one call
+
+
+class Context:
+    """Per-run scratch space shared by benchmarks (temp dir, rendered docs)."""
+
+    def __init__(self, tmp: Path) -> None:
+        self.tmp = tmp
+        self._generators: Dict[str, BridgeGADGenerator] = {}
+        self._files: Dict[str, Path] = {}
+
+    def rendered(self, case: Case) -> BridgeGADGenerator:
+        """Generator holding the fully drawn document for ``case``."""
+        if case.name not in self._generators:
+            gen = BridgeGADGenerator(use_cache=False)
+            gen.generate_bytes(dict(case.params))
+            self._generators[case.name] = gen
+        return self._generators[case.name]
+
+    def workbook(self, case: Case) -> Path:
+        """``case`` workbook written to disk (for path-only readers)."""
+        if case.name not in self._files:
+            path = self.tmp / f"{case.name}.xlsx"
+            path.write_bytes(case.excel_bytes)
+            self._files[case.name] = path
+        return self._files[case.name]
+
+
+# ── Benchmark definitions ─────────────────────────────────────────────────────
+
+def _read_variables(case: Case, ctx: Context):
+    gen = BridgeGADGenerator(use_cache=False)
+    return lambda: gen.read_variables_from_excel(case.excel_bytes)
+
+
+def _smart_input(case: Case, ctx: Context):
+    from bridge_gad.enhanced_io_utils import SmartInputProcessor
+
+    path = ctx.workbook(case)
+    return lambda: SmartInputProcessor().read_input(path)
+
+
+def _stage(stage: str) -> Factory:
+    def factory(case: Case, ctx: Context):
+        gen = BridgeGADGenerator(use_cache=False)
+        gen.load_variables(dict(case.params))
+        gen.setup_document()
+        return getattr(gen, stage)
+    return factory
+
+
+def _generate(case: Case, ctx: Context):
+    gen = BridgeGADGenerator(use_cache=False)
+    return lambda: gen.generate_bytes(dict(case.params))
+
+
+def _stream(case: Case, ctx: Context):
+    gen = BridgeGADGenerator(use_cache=False)
+    out = ctx.tmp / f"{case.name}.stream.dxf"
+
+    def run():
+        with open(out, "wb") as fh:
+            return gen.stream_dxf(dict(case.params), fh)
+    return run
+
+
+def _save_dxf(case: Case, ctx: Context):
+    doc = ctx.rendered(case).doc
+    out = ctx.tmp / f"{case.name}.dxf"
+    return lambda: doc.saveas(out)
+
+
+def _export(fmt: str) -> Factory:
+    def factory(case: Case, ctx: Context):
+        from bridge_gad.output_formats import MultiFormatExporter
+
+        exporter = MultiFormatExporter(ctx.rendered(case))
+        out = ctx.tmp / f"{case.name}.{fmt}"
+        return lambda: exporter.export(out, fmt)
+    return factory
+
+
+def _recalculate(case: Case, ctx: Context):
+    from bridge_gad.calc_engine import CalcEngine
+
+    engine = CalcEngine.with_bridge_defaults()
+    engine.load(case.params)
+    return lambda: engine.recalculate(force=True)
+
+
+def _recalculate_large(case: Case, ctx: Context):
+    from bridge_gad.calc_engine import CalcEngine
+
+    engine = CalcEngine.with_bridge_defaults()
+    engine.load(case.params)
+    for i in range(500):
+        prev = f"D{i - 1}" if i else "LBRIDGE"
+        engine.register_formula(f"D{i}", f"max({prev}, SPAN1) * 0.5 + sqrt(abs(TOPRL - SOFL)) + {i}")
+    return lambda: engine.recalculate(force=True)
+
+
+def _sweep(case: Case, ctx: Context):
+    import numpy as np
+
+    from bridge_gad.calc_engine import CalcEngine
+
+    engine = CalcEngine.with_bridge_defaults()
+    engine.load(case.params)
+    grid = {
+        "SPAN1": np.linspace(8.0, 40.0, 100),
+        "NSPAN": np.arange(1, 11),
+        "SLBTHE": np.linspace(0.6, 1.2, 10),
+    }
+    return lambda: engine.sweep(grid, grid=True)
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark("parse.read_variables_from_excel", _read_variables),
+    Benchmark("parse.smart_input", _smart_input),
+    *[Benchmark(f"stage.{s}", _stage(s), fresh=True) for s in BridgeGADGenerator.DRAW_STAGES],
+    Benchmark("generate.bytes", _generate, memory=True),
+    Benchmark("generate.stream", _stream, memory=True),
+    Benchmark("save.dxf", _save_dxf),
+    *[Benchmark(f"export.{fmt}", _export(fmt)) for fmt in ("pdf", "svg", "png", "html")],
+    Benchmark("calc.recalculate", _recalculate),
+    Benchmark("calc.recalculate_large", _recalculate_large),
+    Benchmark("calc.sweep", _sweep),
+]
+
+
+# ── Timing ────────────────────────────────────────────────────────────────────
+
+def _time_benchmark(bench: Benchmark, case: Case, ctx: Context, rounds: int, min_time: float) -> Dict[str, Any]:
+    """Run ``rounds`` timed rounds; fast callables loop until ``min_time``."""
+    fn = bench.factory(case, ctx)
+    fn()  # warm-up
+    number = 1
+    if not bench.fresh:
+        t0 = time.perf_counter()
+        fn()
+        once = time.perf_counter() - t0
+        if once < min_time:
+            number = min(1000, max(1, int(min_time / max(once, 1e-7))))
+
+    samples: List[float] = []
+    for _ in range(rounds):
+        if bench.fresh:
+            fn = bench.factory(case, ctx)
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - t0) / number * 1000)
+
+    stats: Dict[str, Any] = {
+        "median_ms": round(statistics.median(samples), 4),
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "min_ms": round(min(samples), 4),
+        "stdev_ms": round(statistics.stdev(samples), 4) if len(samples) > 1 else 0.0,
+        "rounds": rounds,
+        "iterations": number,
+    }
+    if bench.memory:
+        stats["peak_kb"] = round(_peak_kb(bench.factory(case, ctx)), 1)
+    return stats
+
+
+def _peak_kb(fn: Callable[[], Any]) -> float:
+    """Peak traced allocation of one ``fn()`` call, in KiB."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=10
+        )
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def run(args: argparse.Namespace) -> int:
+    spans = (1, 10) if args.quick else tuple(args.spans)
+    cases = load_cases(include_inputs=not args.quick and not args.no_inputs, spans=spans)
+    if args.cases:
+        cases = [c for c in cases if fnmatch.fnmatch(c.name, args.cases)]
+    benches = [b for b in BENCHMARKS if not args.filter or args.filter in b.name]
+    rounds = args.rounds or (3 if args.quick else 5)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        ctx = Context(Path(tmp))
+        for bench in benches:
+            for case in cases:
+                key = f"{bench.name}[{case.name}]"
+                try:
+                    stats = _time_benchmark(bench, case, ctx, rounds, args.min_time)
+                except Exception as exc:
+                    stats = {"error": str(exc)}
+                results[key] = stats
+                if "error" in stats:
+                    print(f"{key:<70} ERROR {stats['error']}")
+                else:
+                    peak = f"  peak {stats['peak_kb']:,.0f} KiB" if "peak_kb" in stats else ""
+                    print(f"{key:<70} {stats['median_ms']:>11.3f} ms  ±{stats['stdev_ms']:.3f}{peak}")
+
+    payload = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "package_version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "rounds": rounds,
+        },
+        "results": results,
+    }
+    out = Path(args.output) if args.output else RESULTS_DIR / (
+        f"{datetime.now():%Y%m%d-%H%M%S}_{payload['meta']['commit'] or 'nogit'}.json"
+    )
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(payload, indent=2))
+    print(f"\nResults saved to {out}")
+    return 0
+
+
+# ── Comparison ────────────────────────────────────────────────────────────────
+
+def compare(args: argparse.Namespace) -> int:
+    if args.base and args.new:
+        base_path, new_path = Path(args.base), Path(args.new)
+    else:
+        found = sorted(RESULTS_DIR.glob("*.json"))
+        if len(found) < 2:
+            print(f"Need two result files in {RESULTS_DIR} (or pass BASE NEW)")
+            return 2
+        base_path, new_path = found[-2], found[-1]
+
+    base = json.loads(base_path.read_text())["results"]
+    new = json.loads(new_path.read_text())["results"]
+    print(f"Base: {base_path.name}\nNew:  {new_path.name}\n")
+    print(f"{'benchmark':<70} {'base ms':>11} {'new ms':>11} {'ratio':>7}")
+
+    regressions = 0
+    for key in sorted(set(base) & set(new)):
+        b, n = base[key].get("median_ms"), new[key].get("median_ms")
+        if b is None or n is None:
+            continue
+        ratio = n / b if b else float("inf")
+        flag = ""
+        if ratio > 1 + args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif ratio < 1 - args.threshold:
+            flag = "  improved"
+        print(f"{key:<70} {b:>11.3f} {n:>11.3f} {ratio:>7.2f}{flag}")
+
+    only_base = sorted(set(base) - set(new))
+    only_new = sorted(set(new) - set(base))
+    if only_base:
+        print(f"\nMissing from new run: {len(only_base)} benchmark(s)")
+    if only_new:
+        print(f"New benchmarks: {len(only_new)}")
+    print(f"\n{regressions} regression(s) above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def list_benchmarks(args: argparse.Namespace) -> int:
+    for bench in BENCHMARKS:
+        print(bench.name)
+    print("\nCases:")
+    for case in load_cases():
+        print(f"  {case.name} (NSPAN={case.params.get('NSPAN')})")
+    return 0
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.WARNING)
+    parser = argparse.ArgumentParser(description="Bridge GAD benchmark suite")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="Run benchmarks and store JSON results")
+    p_run.add_argument("-k", "--filter", help="Only benchmarks whose name contains this text")
+    p_run.add_argument("--cases", help="Glob over case names, e.g. 'synthetic_*'")
+    p_run.add_argument("--spans", type=int, nargs="+", default=[1, 10, 50, 200])
+    p_run.add_argument("--no-inputs", action="store_true", help="Skip the inputs/ workbooks")
+    p_run.add_argument("--quick", action="store_true", help="1/10-span synthetic cases, 3 rounds")
+    p_run.add_argument("--rounds", type=int, default=0)
+    p_run.add_argument("--min-time", type=float, default=0.02, help="Min seconds per round for fast benchmarks")
+    p_run.add_argument("-o", "--output", help="Result file (default: benchmarks/results/<time>_<commit>.json)")
+    p_run.set_defaults(func=run)
+
+    p_cmp = sub.add_parser("compare", help="Compare two result files")
+    p_cmp.add_argument("base", nargs="?")
+    p_cmp.add_argument("new", nargs="?")
+    p_cmp.add_argument("--threshold", type=float, default=0.10, help="Relative change flagged (default 0.10)")
+    p_cmp.set_defaults(func=compare)
+
+    p_list = sub.add_parser("list", help="List benchmarks and cases")
+    p_list.set_defaults(func=list_benchmarks)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
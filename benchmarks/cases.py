@@ -0,0 +1,78 @@
+"""Benchmark input cases.
+
+Every workbook in ``inputs/`` that the 3-column reader accepts, plus
+synthetic 1/10/50/200-span bridges derived from ``inputs/sample_input.xlsx``.
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+INPUTS = ROOT / "inputs"
+sys.path.insert(0, str(ROOT / "src"))
+
+SYNTHETIC_SPANS = (1, 10, 50, 200)
+_BASE_SPAN = 10.8  # SPAN1 of sample_input.xlsx
+
+
+@dataclass
+class Case:
+    """One benchmark input: workbook bytes and its parsed parameters."""
+
+    name: str
+    excel_bytes: bytes
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+def _parse(excel_bytes: bytes) -> Dict[str, Any]:
+    from bridge_gad.bridge_generator import BridgeGADGenerator
+
+    gen = BridgeGADGenerator(use_cache=False)
+    if not gen.read_variables_from_excel(excel_bytes):
+        return {}
+    return dict(gen.variables)
+
+
+def synthetic_params(nspan: int) -> Dict[str, Any]:
+    """Sample bridge stretched to ``nspan`` spans of the sample span length."""
+    params = _parse((INPUTS / "sample_input.xlsx").read_bytes())
+    lbridge = round(nspan * _BASE_SPAN, 3)
+    left = float(params.get("LEFT", 0.0))
+    params.update({
+        "NSPAN": nspan,
+        "SPAN1": _BASE_SPAN,
+        "LBRIDGE": lbridge,
+        "RIGHT": left + lbridge,
+        "NOCH": int(lbridge // float(params.get("XINCR", 10) or 10)) + 1,
+    })
+    return params
+
+
+def params_to_excel(params: Dict[str, Any]) -> bytes:
+    """3-column (Value, Variable, Description) workbook for ``params``."""
+    import pandas as pd
+
+    df = pd.DataFrame([[v, k, k] for k, v in params.items()], columns=["Value", "Variable", "Description"])
+    buf = io.BytesIO()
+    df.to_excel(buf, index=False, header=False, engine="openpyxl")
+    return buf.getvalue()
+
+
+def load_cases(include_inputs: bool = True, spans=SYNTHETIC_SPANS) -> List[Case]:
+    """Build the case list; unreadable workbooks are skipped."""
+    cases: List[Case] = []
+    if include_inputs:
+        for path in sorted(INPUTS.glob("*.xlsx")):
+            data = path.read_bytes()
+            params = _parse(data)
+            if params:
+                cases.append(Case(path.stem, data, params))
+    for nspan in spans:
+        params = synthetic_params(nspan)
+        cases.append(Case(f"synthetic_{nspan}span", params_to_excel(params), params))
+    return cases
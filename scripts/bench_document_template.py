@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Benchmark the prototype DXF document factory.
+
+Compares building the styled base document from scratch
+(``ezdxf.new(setup=True)`` + styles) against copying the per-process
+prototype, and reports the end-to-end effect on one uncached drawing and
+one four-sheet detail package.
+
+Usage:
+    python scripts/bench_document_template.py
+    python scripts/bench_document_template.py --repeat 50 --input inputs/sample_input.xlsx
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import ezdxf
+
+from bridge_gad.bridge_generator import BridgeGADGenerator
+from bridge_gad.doc_factory import add_gad_styles, new_gad_document, new_sheet_document
+
+
+def _time_ms(fn, repeat: int) -> float:
+    """Median wall time of ``fn`` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def _build_from_scratch(version: str):
+    doc = ezdxf.new(version, setup=True)
+    add_gad_styles(doc)
+    return doc
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="DXF document template benchmark")
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--version", default="R2010")
+    parser.add_argument("--input", default=str(Path(__file__).parent.parent / "inputs" / "sample_input.xlsx"))
+    args = parser.parse_args()
+
+    new_gad_document(args.version)  # build the prototype outside the timing
+    new_sheet_document(args.version)
+
+    scratch = _time_ms(lambda: _build_from_scratch(args.version), args.repeat)
+    copied = _time_ms(lambda: new_gad_document(args.version), args.repeat)
+    sheet_scratch = _time_ms(lambda: ezdxf.new(args.version), args.repeat)
+    sheet_copied = _time_ms(lambda: new_sheet_document(args.version), args.repeat)
+
+    print(f"GAD base document   : new {scratch:7.2f} ms | prototype copy {copied:7.2f} ms "
+          f"| saved {scratch - copied:6.2f} ms/drawing")
+    print(f"Detail sheet (x4)   : new {4 * sheet_scratch:7.2f} ms | prototype copy {4 * sheet_copied:7.2f} ms "
+          f"| saved {4 * (sheet_scratch - sheet_copied):6.2f} ms/package")
+
+    excel = Path(args.input)
+    if excel.exists():
+        data = excel.read_bytes()
+        gen = BridgeGADGenerator(args.version, use_cache=False)
+        gen.generate_bytes(data)
+        total = _time_ms(lambda: gen.generate_bytes(data), max(3, args.repeat // 3))
+        print(f"Full drawing        : {total:7.2f} ms ({excel.name}, render cache off)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -65,9 +65,12 @@ def generate(
     config: Path = typer.Option(None, "--config", "-c", help="Configuration YAML file"),
     formats: Optional[str] = typer.Option(None, "--formats", help="Comma-separated list of output formats (dxf,pdf,html,svg,png)"),
     show_canvas: bool = typer.Option(False, "--canvas", help="Also create and open HTML canvas visualization"),
+    stream: bool = typer.Option(False, "--stream", help="Stream entities to the DXF while drawing (bounded memory for long viaducts; DXF only)"),
 ):
     """Generate complete bridge GAD from Excel parameters with multiple format support."""
     try:
+        if stream and (formats or show_canvas):
+            raise ValueError("--stream writes the DXF only; drop --formats/--canvas")
         if output is None:
             output = excel_file.parent / f"{excel_file.stem}_bridge_gad.dxf"
         
@@ -75,7 +78,7 @@ def generate(
         from .bridge_generator import BridgeGADGenerator
         generator = BridgeGADGenerator()
         
-        if not generator.generate_complete_drawing(excel_file, output):
+        if not generator.generate_complete_drawing(excel_file, output, streaming=stream):
             raise RuntimeError("Failed to generate bridge drawing")
         
         typer.echo(f"✅ Primary output generated: {output}")
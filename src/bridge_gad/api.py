@@ -2,10 +2,23 @@
 
 Phase 7 upgrades:
   - ARQ job queue integration (async, non-blocking)
-  - SSE real-time job status endpoint
+  - SSE real-time job status endpoint (event-driven, stage-level progress)
   - Rate limiting (slowapi)
   - Structured request tracing middleware
-  - /health and /metrics endpoints
+  - /health (with Redis ping) and /metrics endpoints
+  - One Redis pool per process (lifespan) behind a circuit breaker
+  - Content-addressed render cache shared by /predict and /jobs
+  - Per-stage Server-Timing headers on /predict, stage histograms on /metrics
+  - /bundle streams a multi-format ZIP in chunks (no temp files)
+  - Pluggable job store (memory or SQLite + blob dir) with TTL/size eviction
+  - GET /jobs/{id}/result streams raw bytes (ETag, Range); polling stays metadata-only
+  - Bounded render process pool: 429 + Retry-After when saturated,
+    per-render timeouts, DELETE /jobs/{id} cancellation
+  - Render workers are spawned and warmed at startup (warmup.py)
+  - /jobs/batch: many workbooks (multipart or ZIP) per request, aggregate
+    progress and one streamed ZIP of results
+  - /predict/params and /jobs/params: JSON parameter dicts or named
+    templates rendered directly, without a workbook
   - Pydantic v2 response models
 
 Security fixes (retained):
@@ -17,23 +30,38 @@ Security fixes (retained):
 from __future__ import annotations
 
 import asyncio
+import io
+import json
 import logging
 import os
+import re
 import time
 import uuid
+import zipfile
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 
 from fastapi import FastAPI, HTTPException, Request, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, StreamingResponse
-import tempfile
-import shutil
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
 
 from . import __version__
 from .config import Settings, load_settings
-from .core import generate_bridge_drawing
+from .job_events import (
+    TERMINAL_STATUSES, RedisEventRelay, get_job_events, progress_reporter,
+)
+from .job_store import get_job_store
 from .logger_config import configure_logging
+from .parse_cache import get_parse_cache
+from .profiling import get_stage_histograms
+from .redis_pool import get_redis_broker
+from .render_cache import get_render_cache
+from .render_pool import (
+    PoolSaturated, RenderCancelled, RenderInputError, RenderResult, RenderTask, RenderTimeout, get_render_pool,
+)
+from .zip_stream import stream_zip
 
 configure_logging()
 logger = logging.getLogger(__name__)
@@ -50,14 +78,150 @@ _MIME_TYPES = {
     "html":  "text/html",
 }
 
-# ── In-memory job store (replace with Redis in production) ────────────────────
-_jobs: dict[str, dict] = {}
+# ── Job store (metadata + result blobs; see job_store.py) ────────────────────
+_jobs = get_job_store()
+_events = get_job_events()
+
+
+def _publish(job_id: str, **fields) -> None:
+    """Record a status change in the job store and notify SSE subscribers.
+
+    Thread-safe: called from the generation executor thread.
+    """
+    _jobs.update(job_id, **{k: v for k, v in fields.items() if k not in ("label", "ms", "result_url")})
+    _events.publish(job_id, fields)
+
+
+async def _fetch_arq_result(job_id: str) -> Dict[str, Any]:
+    """Stored ARQ result of a finished job (raises if it cannot be fetched)."""
+    redis = await _broker.client()
+    if redis is None:
+        raise RuntimeError("Redis unavailable")
+    from arq.jobs import Job
+
+    result = await Job(job_id, redis).result(timeout=30)
+    if not isinstance(result, dict):
+        raise TypeError(f"unexpected job result type {type(result).__name__}")
+    return result
+
+
+async def _on_worker_event(job_id: str, event: dict) -> Optional[dict]:
+    """Mirror an ARQ worker event into the job store (result fetched on completion).
+
+    Runs in its own task (see ``RedisEventRelay``). A completed job whose
+    result cannot be fetched is recorded — and relayed — as failed.
+    """
+    fields = {k: v for k, v in event.items() if k in ("status", "progress", "stage", "error")}
+    if event.get("status") != "complete":
+        _jobs.update(job_id, **fields)
+        return None
+    try:
+        result = await _fetch_arq_result(job_id)
+    except Exception as exc:
+        error = f"Result could not be fetched: {type(exc).__name__}: {exc}"
+    else:
+        if result.get("success") and result.get("output_bytes"):
+            _jobs.set_result(
+                job_id,
+                result["output_bytes"],
+                output_format=result.get("output_format", "dxf"),
+                timings=result.get("timings"),
+                **fields,
+            )
+            return None
+        error = str(result.get("error") or "Job finished without output")
+    logger.warning("Job %s failed after completion event: %s", job_id, error)
+    _jobs.update(job_id, status="failed", error=error)
+    return {**event, "status": "failed", "error": error}
+
+
+_relay = RedisEventRelay(_events, on_event=_on_worker_event)
+
+# ── Redis (one pooled ARQ client, circuit breaker; see redis_pool.py) ─────────
+_broker = get_redis_broker()
+
+
+# Workbook bytes, or a parameter dict rendered without a workbook
+Source = Union[bytes, Dict[str, Any]]
+
+
+async def _enqueue_arq(job_id: str, source: Source, filename: str,
+                       acad_version: str, output_format: str) -> bool:
+    """Hand a job to the ARQ worker; False if Redis is unavailable (breaker open)."""
+    redis = await _broker.client()
+    if redis is None:
+        return False
+    payload = {"parameters": source, "excel_bytes": b""} if isinstance(source, dict) else {"excel_bytes": source}
+    try:
+        await redis.enqueue_job(
+            "generate_drawing_job",
+            filename=filename,
+            acad_version=acad_version,
+            output_format=output_format,
+            _job_id=job_id,
+            **payload,
+        )
+    except Exception as exc:
+        _broker.record_failure(exc)
+        return False
+    _broker.record_success()
+    _jobs.update(job_id, backend="arq")
+    if not _relay.running:
+        _relay.start(redis)
+    return True
+
+# ── Render pool (admission control) ───────────────────────────────────────────
+_pool = get_render_pool()
+_render_tasks: dict[str, RenderTask] = {}  # asyncio-backend job_id → pooled render
+_background: set[asyncio.Task] = set()      # strong refs so tasks are not GC'd mid-run
+
+
+def _spawn(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+    return task
+
+
+def _submit_local(job_id: str, source: Source, acad_version: str, output_format: str) -> asyncio.Task:
+    """Admit a job to the local render pool (raises ``PoolSaturated``)."""
+    from .bridge_generator import BridgeGADGenerator
+
+    on_stage = progress_reporter(
+        lambda event: _publish(job_id, **event), BridgeGADGenerator.PIPELINE_STAGES
+    )
+    task = _pool.submit(source, acad_version, on_stage=on_stage)
+    _render_tasks[job_id] = task
+    _jobs.update(job_id, backend="asyncio")
+    return _spawn(_run_job_background(job_id, task, output_format))
+
+
+def _too_busy(exc: PoolSaturated) -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail="Render capacity exhausted, retry later",
+        headers={"Retry-After": str(exc.retry_after)},
+    )
 
 # ── App ───────────────────────────────────────────────────────────────────────
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if _pool.warm:
+        _pool.start()  # first request finds warm workers
+    redis = await _broker.client()  # connect once; a failure just opens the breaker
+    if redis is not None:
+        _relay.start(redis)
+    yield
+    await _relay.stop()
+    await _broker.close()
+    _pool.shutdown()
+
+
 app = FastAPI(
     title="Bridge GAD Generator API",
     description="REST API for generating Bridge General Arrangement Drawings",
     version=__version__,
+    lifespan=lifespan,
 )
 
 # KERO-001: wildcard origin + no credentials
@@ -93,9 +257,17 @@ async def root():
         "version": __version__,
         "endpoints": [
             {"path": "/predict",        "method": "POST", "description": "Sync: generate drawing (blocks until done)"},
+            {"path": "/predict/params", "method": "POST", "description": "Sync: generate from JSON parameters/template"},
+            {"path": "/bundle",         "method": "POST", "description": "Sync: multi-format ZIP, streamed"},
             {"path": "/jobs",           "method": "POST", "description": "Async: enqueue generation job"},
+            {"path": "/jobs/params",    "method": "POST", "description": "Async: enqueue from JSON parameters/template"},
+            {"path": "/jobs/batch",     "method": "POST", "description": "Async: enqueue many workbooks (files or ZIP)"},
+            {"path": "/jobs/batch/{batch_id}", "method": "GET", "description": "Batch progress"},
+            {"path": "/jobs/batch/{batch_id}/results", "method": "GET", "description": "Batch results as one streamed ZIP"},
             {"path": "/jobs/{job_id}",  "method": "GET",  "description": "Poll job status"},
+            {"path": "/jobs/{job_id}/result", "method": "GET", "description": "Download job result (Range, ETag)"},
             {"path": "/jobs/{job_id}/stream", "method": "GET", "description": "SSE: stream job status"},
+            {"path": "/jobs/{job_id}",  "method": "DELETE", "description": "Cancel a queued or running job"},
             {"path": "/health",         "method": "GET",  "description": "Health check"},
             {"path": "/metrics",        "method": "GET",  "description": "Basic metrics"},
         ],
@@ -108,45 +280,149 @@ async def predict(
     config_file: Optional[UploadFile] = None,
     output_format: str = "dxf",
 ):
-    """Synchronous generation — blocks until the drawing is ready.
+    """Synchronous generation — the response waits until the drawing is ready.
     For large files prefer POST /jobs (async).
-    """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_dir_path = Path(temp_dir)
 
-        # KERO-003: strip directory components
-        safe_name = Path(excel_file.filename).name
-        excel_path = temp_dir_path / safe_name
-        with open(excel_path, "wb") as f:
-            shutil.copyfileobj(excel_file.file, f)
+    Draws with ``core.BridgeDrawing`` (the ``generate_bridge_drawing``
+    engine), configured by the optional YAML ``config_file``, in the
+    bounded process pool and entirely in memory. A full pool answers 429
+    with ``Retry-After``, a render over the time budget 504, an invalid
+    config file or a workbook whose parameters cannot be read 422.
+    Per-stage timings are returned in the ``Server-Timing`` header.
+    """
+    settings: Optional[Settings] = None
+    if config_file is not None:
+        try:
+            settings = Settings.from_yaml_text(await config_file.read())
+        except Exception as exc:
+            raise HTTPException(status_code=422, detail=f"Invalid config_file: {exc}")
+    # KERO-003: strip directory components
+    safe_name = Path(excel_file.filename).name
+    excel_bytes = await excel_file.read()
+    return await _render_response(excel_bytes, safe_name, "R2010", output_format, engine="core", settings=settings)
 
-        config_path: Optional[Path] = None
-        if config_file:
-            config_path = temp_dir_path / "config.yaml"
-            with open(config_path, "wb") as f:
-                shutil.copyfileobj(config_file.file, f)
 
-        output_path = temp_dir_path / f"output.{output_format}"
+async def _pooled_render(source: Source, name: str, acad_version: str, **submit_kwargs: Any) -> RenderResult:
+    """Render ``source`` in the pool; pool errors become 429/504/422/500."""
+    try:
+        task = _pool.submit(source, acad_version, **submit_kwargs)
+    except PoolSaturated as exc:
+        raise _too_busy(exc)
 
-        try:
-            result_path = generate_bridge_drawing(
-                excel_file=excel_path,
-                config_file=config_path,
-                output_path=output_path,
-            )
-            if not result_path.exists():
-                raise HTTPException(status_code=500, detail="No output file created")
-
-            mime = _MIME_TYPES.get(output_format.lower(), "application/octet-stream")
-            return FileResponse(
-                result_path,
-                media_type=mime,
-                filename=f"bridge_drawing.{output_format}",
+    try:
+        result = await _pool.wait(task)
+    except RenderTimeout as exc:
+        raise HTTPException(status_code=504, detail=str(exc))
+    except RenderInputError:
+        raise HTTPException(status_code=422, detail=f"Could not read drawing parameters from {name}")
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc))
+    if not result.dxf_bytes:
+        raise HTTPException(status_code=500, detail=f"No output generated for {name}")
+    return result
+
+
+async def _render_response(source: Source, name: str, acad_version: str, output_format: str,
+                           **submit_kwargs: Any) -> Response:
+    """Render ``source`` in the pool and answer with the drawing (shared by /predict*)."""
+    result = await _pooled_render(source, name, acad_version, **submit_kwargs)
+    mime = _MIME_TYPES.get(output_format.lower(), "application/octet-stream")
+    return Response(
+        content=result.dxf_bytes,
+        media_type=mime,
+        headers={
+            "Content-Disposition": f'attachment; filename="bridge_drawing.{output_format}"',
+            "Server-Timing": result.profile.server_timing(),
+        },
+    )
+
+
+# ── JSON parameter bodies (no workbook) ───────────────────────────────────────
+
+class ParamsRequest(BaseModel):
+    """Drawing parameters as JSON; ``template`` values are overridden by ``parameters``."""
+
+    parameters: Dict[str, Any] = Field(default_factory=dict)
+    template: Optional[str] = None
+    output_format: str = "dxf"
+    acad_version: str = "R2010"
+
+
+def _request_params(body: ParamsRequest) -> Dict[str, Any]:
+    """Merge the named template (if any) with the explicit parameters."""
+    params: Dict[str, Any] = {}
+    if body.template:
+        from .bridge_canvas_features import BRIDGE_TEMPLATES
+
+        template = BRIDGE_TEMPLATES.get(body.template)
+        if template is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown template {body.template!r}; choose from {', '.join(BRIDGE_TEMPLATES)}",
             )
-        except HTTPException:
-            raise
-        except Exception as exc:
-            raise HTTPException(status_code=500, detail=str(exc))
+        params.update(template["parameters"])
+    params.update({str(k).strip().upper(): v for k, v in body.parameters.items() if v is not None})
+    if not params:
+        raise HTTPException(status_code=400, detail="Provide parameters and/or a template")
+    return params
+
+
+@app.post("/predict/params")
+async def predict_params(body: ParamsRequest):
+    """``/predict`` for a JSON parameter dict or template — no workbook round-trip."""
+    name = body.template or "parameters"
+    return await _render_response(_request_params(body), name, body.acad_version, body.output_format)
+
+
+_BUNDLE_FORMATS = ("dxf", "pdf", "svg", "png", "html", "json")
+
+
+@app.post("/bundle")
+async def bundle(
+    excel_file: UploadFile = File(...),
+    formats: str = ",".join(_BUNDLE_FORMATS),
+    acad_version: str = "R2010",
+    compresslevel: Optional[int] = None,
+):
+    """Generate the drawing and stream every requested format as one ZIP.
+
+    The drawing is rendered in the bounded process pool like /predict
+    (429 when full, 504 over the time budget); the exporter then works
+    from the pooled DXF. Formats are rendered one at a time as the
+    archive is written, so the response starts before the last format
+    exists and memory stays around one output file.
+    """
+    requested = list(dict.fromkeys(f.strip().lower() for f in formats.split(",") if f.strip()))
+    unknown = sorted(set(requested) - set(_BUNDLE_FORMATS))
+    if unknown or not requested:
+        raise HTTPException(status_code=400, detail=f"Unsupported formats: {', '.join(unknown) or repr(formats)}")
+    if compresslevel is not None and not 0 <= compresslevel <= 9:
+        raise HTTPException(status_code=400, detail="compresslevel must be between 0 and 9")
+
+    # KERO-003: strip directory components
+    safe_name = Path(excel_file.filename).name
+    excel_bytes = await excel_file.read()
+
+    result = await _pooled_render(excel_bytes, safe_name, acad_version)
+    exporter = await asyncio.to_thread(_bundle_exporter, excel_bytes, result.dxf_bytes, acad_version)
+    return StreamingResponse(
+        exporter.iter_zip_bundle("bridge_drawing", requested, compresslevel=compresslevel),
+        media_type="application/zip",
+        headers={"Content-Disposition": 'attachment; filename="bridge_drawing.zip"'},
+    )
+
+
+def _bundle_exporter(excel_bytes: bytes, dxf_bytes: bytes, acad_version: str):
+    """Exporter over a pooled render: the workbook parameters (parse-cached) and the parsed DXF."""
+    import ezdxf
+
+    from .bridge_generator import BridgeGADGenerator
+    from .ultimate_exporter import UltimateExporter
+
+    gen = BridgeGADGenerator(acad_version=acad_version)
+    gen.read_variables_from_excel(excel_bytes)
+    gen.doc = ezdxf.read(io.StringIO(dxf_bytes.decode("utf-8", errors="replace")))
+    return UltimateExporter(gen)
 
 
 @app.post("/jobs", status_code=202)
@@ -158,82 +434,279 @@ async def enqueue_job(
     """Async generation — returns a job_id immediately.
     Poll GET /jobs/{job_id} or stream GET /jobs/{job_id}/stream for status.
     """
-    job_id = str(uuid.uuid4())
     excel_bytes = await excel_file.read()
     safe_name = Path(excel_file.filename).name
+    return await _enqueue(excel_bytes, safe_name, acad_version, output_format)
 
-    _jobs[job_id] = {"status": "queued", "progress": 0, "result": None, "error": None}
 
-    # Try ARQ if available, else run in asyncio background task
-    try:
-        from arq.connections import ArqRedis, RedisSettings
-        redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379")
-        redis: ArqRedis = await ArqRedis.from_url(redis_url)
-        await redis.enqueue_job(
-            "generate_drawing_job",
-            excel_bytes=excel_bytes,
-            filename=safe_name,
-            acad_version=acad_version,
-            output_format=output_format,
-            _job_id=job_id,
-        )
-        _jobs[job_id]["backend"] = "arq"
-    except Exception:
-        # Fallback: asyncio background task (single-server, no Redis needed)
-        asyncio.create_task(
-            _run_job_background(job_id, excel_bytes, safe_name, acad_version, output_format)
-        )
-        _jobs[job_id]["backend"] = "asyncio"
+@app.post("/jobs/params", status_code=202)
+async def enqueue_params_job(body: ParamsRequest):
+    """``/jobs`` for a JSON parameter dict or template — no workbook round-trip."""
+    name = body.template or "parameters"
+    return await _enqueue(_request_params(body), name, body.acad_version, body.output_format)
+
 
-    logger.info("Job enqueued: %s (%s)", job_id, safe_name)
+async def _enqueue(source: Source, name: str, acad_version: str, output_format: str) -> dict:
+    job_id = str(uuid.uuid4())
+    _jobs.create(job_id, status="queued", filename=name, output_format=output_format)
+
+    # Try ARQ if available, else the local render pool (single-server, no Redis needed)
+    if not await _enqueue_arq(job_id, source, name, acad_version, output_format):
+        try:
+            _submit_local(job_id, source, acad_version, output_format)
+        except PoolSaturated as exc:
+            _jobs.delete(job_id)
+            raise _too_busy(exc)
+
+    logger.info("Job enqueued: %s (%s)", job_id, name)
     return {"job_id": job_id, "status": "queued"}
 
 
-async def _run_job_background(
-    job_id: str,
-    excel_bytes: bytes,
-    filename: str,
-    acad_version: str,
-    output_format: str,
-) -> None:
-    """Asyncio fallback: run generation in a thread pool to avoid blocking."""
-    import asyncio
-    from .bridge_generator import BridgeGADGenerator
+# ── Batches ───────────────────────────────────────────────────────────────────
+_BATCH_MAX_FILES = int(os.environ.get("BRIDGE_GAD_BATCH_MAX_FILES", "200"))
+_BATCH_MAX_BYTES = int(float(os.environ.get("BRIDGE_GAD_BATCH_MAX_MB", "200")) * 1024 * 1024)
+_WORKBOOK_SUFFIXES = (".xlsx", ".xlsm", ".xls")
+
+
+def _expand_uploads(uploads: List[Tuple[str, bytes]]) -> List[Tuple[str, bytes]]:
+    """Flatten uploaded workbooks and ZIPs of workbooks into (name, bytes) pairs."""
+    workbooks: List[Tuple[str, bytes]] = []
+    total = 0
+
+    def _add(name: str, data: bytes) -> None:
+        nonlocal total
+        total += len(data)
+        if len(workbooks) >= _BATCH_MAX_FILES:
+            raise HTTPException(status_code=413, detail=f"Batch exceeds {_BATCH_MAX_FILES} workbooks")
+        if total > _BATCH_MAX_BYTES:
+            raise HTTPException(status_code=413, detail="Batch exceeds the size limit")
+        workbooks.append((name, data))
+
+    for name, data in uploads:
+        if name.lower().endswith(".zip"):
+            try:
+                archive = zipfile.ZipFile(io.BytesIO(data))
+            except zipfile.BadZipFile:
+                raise HTTPException(status_code=400, detail=f"{name} is not a valid ZIP")
+            with archive:
+                for info in archive.infolist():
+                    member = Path(info.filename)
+                    if (info.is_dir() or member.name.startswith(".") or "__MACOSX" in member.parts
+                            or member.suffix.lower() not in _WORKBOOK_SUFFIXES):
+                        continue
+                    # Checked before decompressing (zip bombs)
+                    if total + info.file_size > _BATCH_MAX_BYTES:
+                        raise HTTPException(status_code=413, detail="Batch exceeds the size limit")
+                    _add(member.name, archive.read(info))  # KERO-003: Path.name only
+        elif name.lower().endswith(_WORKBOOK_SUFFIXES):
+            _add(name, data)
+        else:
+            raise HTTPException(status_code=400, detail=f"Unsupported file in batch: {name}")
+    if not workbooks:
+        raise HTTPException(status_code=400, detail="No workbooks found in upload")
+    return workbooks
+
+
+async def _feed_batch(items: List[Tuple[str, bytes]], acad_version: str, output_format: str) -> None:
+    """Submit a batch to the local pool as capacity frees up.
+
+    At most ``workers`` renders of one batch run at once, leaving the
+    admission queue for interactive requests; a full pool delays the
+    batch instead of failing it.
+    """
+    running: set = set()
+    items.reverse()
+    while items:
+        job_id, data = items.pop()
+        job = _jobs.get(job_id)
+        if not job or job["status"] in TERMINAL_STATUSES:  # cancelled while waiting
+            continue
+        while len(running) >= _pool.workers:
+            _, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        while True:
+            try:
+                running.add(_submit_local(job_id, data, acad_version, output_format))
+                break
+            except PoolSaturated:
+                await asyncio.sleep(0.25)
+    if running:
+        await asyncio.wait(running)
+
+
+@app.post("/jobs/batch", status_code=202)
+async def enqueue_batch(
+    files: List[UploadFile] = File(...),
+    output_format: str = "dxf",
+    acad_version: str = "R2010",
+):
+    """Enqueue many workbooks at once — uploaded individually or as ZIP archives.
+
+    Every workbook becomes a regular job (pollable, streamable,
+    cancellable). Returns the batch id; GET /jobs/batch/{batch_id} gives
+    aggregate progress and /results streams every finished drawing as one ZIP.
+    """
+    uploads = [(Path(f.filename or "upload").name, await f.read()) for f in files]
+    workbooks = _expand_uploads(uploads)
+    del uploads
+
+    batch_id = str(uuid.uuid4())
+    job_ids = [str(uuid.uuid4()) for _ in workbooks]
+    for job_id, (name, _) in zip(job_ids, workbooks):
+        _jobs.create(job_id, status="queued", filename=name, output_format=output_format, batch_id=batch_id)
+    _jobs.create_batch(batch_id, job_ids, output_format=output_format, acad_version=acad_version)
+
+    local: List[Tuple[str, bytes]] = []
+    use_arq = True
+    for job_id, (name, data) in zip(job_ids, workbooks):
+        if use_arq and await _enqueue_arq(job_id, data, name, acad_version, output_format):
+            continue
+        use_arq = False  # Redis is down — don't retry it for every workbook
+        local.append((job_id, data))
+    if local:
+        _spawn(_feed_batch(local, acad_version, output_format))
+
+    logger.info("Batch enqueued: %s (%d workbooks, %d local)", batch_id, len(job_ids), len(local))
+    return {
+        "batch_id": batch_id,
+        "status_url": f"/jobs/batch/{batch_id}",
+        "jobs": [{"job_id": j, "filename": name} for j, (name, _) in zip(job_ids, workbooks)],
+    }
 
-    _jobs[job_id]["status"] = "running"
-    _jobs[job_id]["progress"] = 10
-
-    def _sync_generate():
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            excel_path = tmp_path / filename
-            excel_path.write_bytes(excel_bytes)
-            output_path = tmp_path / f"output.{output_format}"
-            gen = BridgeGADGenerator(acad_version=acad_version)
-            ok = gen.generate_complete_drawing(excel_path, output_path)
-            if ok and output_path.exists():
-                return output_path.read_bytes()
-            return None
 
+def _batch_jobs(batch_id: str) -> Tuple[dict, List[dict]]:
+    batch = _jobs.get_batch(batch_id)
+    if not batch:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    jobs = []
+    for job_id in batch["job_ids"]:
+        job = _jobs.get(job_id)
+        jobs.append(job if job is not None else {"job_id": job_id, "status": "evicted", "progress": 0})
+    return batch, jobs
+
+
+@app.get("/jobs/batch/{batch_id}")
+async def get_batch(batch_id: str):
+    """Aggregate batch status: counts per status, overall progress and per-job summary."""
+    batch, jobs = _batch_jobs(batch_id)
+    by_status: dict[str, int] = {}
+    for job in jobs:
+        by_status[job["status"]] = by_status.get(job["status"], 0) + 1
+    finished = sum(1 for job in jobs if job["status"] in TERMINAL_STATUSES + ("evicted",))
+    progress = sum(100 if job["status"] in TERMINAL_STATUSES else job.get("progress", 0) for job in jobs)
+    response = {
+        "batch_id": batch_id,
+        "status": "complete" if finished == len(jobs) else "running",
+        "total": len(jobs),
+        "by_status": by_status,
+        "progress": round(progress / max(1, len(jobs))),
+        "jobs": [
+            {k: job.get(k) for k in ("job_id", "filename", "status", "progress", "error") if job.get(k) is not None}
+            for job in jobs
+        ],
+    }
+    if by_status.get("complete"):
+        response["results_url"] = f"/jobs/batch/{batch_id}/results"
+    return response
+
+
+def _read_blob(fh: BinaryIO) -> Iterator[bytes]:
+    with fh:
+        yield from iter(lambda: fh.read(_RESULT_CHUNK), b"")
+
+
+@app.get("/jobs/batch/{batch_id}/results")
+async def get_batch_results(batch_id: str, partial: bool = False):
+    """Stream every completed result of a batch as one ZIP (plus ``manifest.json``).
+
+    Results are read from the job store one at a time while the archive
+    is written. Until every job has finished, ``partial=true`` is required.
+    """
+    batch, jobs = _batch_jobs(batch_id)
+    pending = [j["job_id"] for j in jobs if j["status"] not in TERMINAL_STATUSES + ("evicted",)]
+    if pending and not partial:
+        raise HTTPException(status_code=409, detail=f"{len(pending)} job(s) still running; pass partial=true")
+
+    def _entries():
+        used: set = set()
+        manifest = []
+        for job in jobs:
+            record = {"job_id": job["job_id"], "filename": job.get("filename"), "status": job["status"]}
+            fh = _jobs.open_result(job["job_id"]) if job["status"] == "complete" else None
+            if fh is not None:
+                stem = Path(job.get("filename") or job["job_id"]).stem
+                name, n = f"{stem}.{job.get('output_format', 'dxf')}", 1
+                while name in used:
+                    n += 1
+                    name = f"{stem}_{n}.{job.get('output_format', 'dxf')}"
+                used.add(name)
+                record["file"] = name
+                yield name, _read_blob(fh)
+            elif job.get("error"):
+                record["error"] = job["error"]
+            manifest.append(record)
+        yield "manifest.json", json.dumps({"batch_id": batch_id, "jobs": manifest}, indent=2).encode()
+
+    return StreamingResponse(
+        stream_zip(_entries()),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="batch_{batch_id[:8]}.zip"'},
+    )
+
+
+async def _run_job_background(job_id: str, task: RenderTask, output_format: str) -> None:
+    """Asyncio fallback: await a render admitted to the process pool."""
+    _publish(job_id, status="running", progress=5, stage="start", label="Generation started")
     try:
-        loop = asyncio.get_event_loop()
-        result_bytes = await loop.run_in_executor(None, _sync_generate)
+        result = await _pool.wait(task)
+        result_bytes, profile = result.dxf_bytes, result.profile
         if result_bytes:
-            _jobs[job_id].update({
-                "status": "complete",
-                "progress": 100,
-                "result": result_bytes,
-                "output_format": output_format,
-            })
+            _jobs.set_result(
+                job_id,
+                result_bytes,
+                output_format=output_format,
+                timings=profile.as_dicts(),
+            )
+            _publish(job_id, status="complete", progress=100, stage="exported",
+                     label="Result ready", result_url=f"/jobs/{job_id}/result")
         else:
-            _jobs[job_id].update({"status": "failed", "error": "Generation produced no output"})
+            _publish(job_id, status="failed", error="Generation produced no output")
+    except RenderCancelled:
+        _publish(job_id, status="cancelled", error="Job cancelled")
     except Exception as exc:
-        _jobs[job_id].update({"status": "failed", "error": str(exc)})
+        _publish(job_id, status="failed", error=str(exc))
+    finally:
+        _render_tasks.pop(job_id, None)
+
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    """Cancel a queued or running job.
+
+    Queued renders are dropped; running ones stop at their next pipeline
+    stage. ARQ-backed jobs are aborted through the worker.
+    """
+    job = _jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job["status"] in TERMINAL_STATUSES:
+        raise HTTPException(status_code=409, detail=f"Job already {job['status']}")
+
+    task = _render_tasks.get(job_id)
+    if task is not None:
+        _pool.cancel(task)
+    elif job.get("backend") == "arq" and (redis := await _broker.client()) is not None:
+        from arq.jobs import Job
+        try:
+            await Job(job_id, redis).abort(timeout=5)
+        except asyncio.TimeoutError:
+            logger.warning("ARQ job %s did not confirm abort", job_id)
+    _publish(job_id, status="cancelled", error="Job cancelled")
+    return {"job_id": job_id, "status": "cancelled"}
 
 
 @app.get("/jobs/{job_id}")
 async def get_job(job_id: str):
-    """Poll job status. Returns result bytes as base64 when complete."""
+    """Poll job status. Metadata only — download the result from ``result_url``."""
     job = _jobs.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -243,48 +716,218 @@ async def get_job(job_id: str):
         "status": job["status"],
         "progress": job.get("progress", 0),
     }
-    if job["status"] == "complete" and job.get("result"):
-        import base64
-        response["result_b64"] = base64.b64encode(job["result"]).decode()
+    if job["status"] == "complete" and job.get("result_size"):
+        response["result_url"] = f"/jobs/{job_id}/result"
+        response["result_size"] = job["result_size"]
+        response["etag"] = _etag(job)
         response["output_format"] = job.get("output_format", "dxf")
+    if job.get("timings"):
+        response["timings"] = job["timings"]
     if job.get("error"):
         response["error"] = job["error"]
     return response
 
 
+_RESULT_CHUNK = 64 * 1024
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _etag(job: dict) -> str:
+    return f'"{job.get("result_sha256", "")}"'
+
+
+def _parse_range(header: str, size: int) -> Optional[tuple[int, int]]:
+    """Single ``bytes=`` range → (start, end) inclusive; None = serve whole body.
+
+    Raises 416 for a syntactically valid range outside the result.
+    Multi-range requests are answered with the whole body (RFC 9110 allows it).
+    """
+    m = _RANGE_RE.match(header.strip())
+    if not m or m.group(1) == m.group(2) == "":
+        return None
+    first, last = m.group(1), m.group(2)
+    if first == "":                      # suffix range: last N bytes
+        length = int(last)
+        if length == 0:
+            raise HTTPException(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        raise HTTPException(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+    return start, end
+
+
+def _iter_blob(fh: BinaryIO, start: int, length: int) -> Iterator[bytes]:
+    with fh:
+        fh.seek(start)
+        while length > 0:
+            chunk = fh.read(min(_RESULT_CHUNK, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+@app.api_route("/jobs/{job_id}/result", methods=["GET", "HEAD"])
+async def get_job_result(job_id: str, request: Request):
+    """Raw job result with the format's MIME type.
+
+    Supports ``If-None-Match`` (304), single-range ``Range`` requests (206)
+    and ``If-Range``; the ETag is the SHA-256 of the result bytes.
+    """
+    job = _jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job["status"] != "complete":
+        raise HTTPException(status_code=409, detail=f"Job is {job['status']}")
+
+    output_format = job.get("output_format", "dxf")
+    size = int(job.get("result_size") or 0)
+    etag = _etag(job)
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "private, max-age=3600",
+        "Content-Disposition": f'attachment; filename="bridge_drawing.{output_format}"',
+    }
+    if etag in (t.strip() for t in request.headers.get("if-none-match", "").split(",")):
+        return Response(status_code=304, headers=headers)
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    if range_header and request.headers.get("if-range", etag) == etag:
+        byte_range = _parse_range(range_header, size)
+
+    fh = _jobs.open_result(job_id)
+    if fh is None:
+        raise HTTPException(status_code=410, detail="Job result has been evicted")
+
+    status_code = 200
+    start, length = 0, size
+    if byte_range is not None:
+        start, end = byte_range
+        length = end - start + 1
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(length)
+
+    media_type = _MIME_TYPES.get(output_format.lower(), "application/octet-stream")
+    if request.method == "HEAD":
+        fh.close()
+        return Response(status_code=status_code, headers=headers, media_type=media_type)
+    return StreamingResponse(
+        _iter_blob(fh, start, length), status_code=status_code, headers=headers, media_type=media_type
+    )
+
+
+_SSE_KEEPALIVE_SECONDS = 15
+_SSE_MAX_SECONDS = 600
+
+
+def _sse(event: dict) -> str:
+    return f"data: {json.dumps(event)}\n\n"
+
+
+def _job_snapshot(job: dict) -> dict:
+    snapshot = {"status": job["status"], "progress": job.get("progress", 0)}
+    for key in ("stage", "error"):
+        if job.get(key):
+            snapshot[key] = job[key]
+    if job["status"] == "complete" and job.get("result_size"):
+        snapshot["result_url"] = f"/jobs/{job['job_id']}/result"
+    return snapshot
+
+
 @app.get("/jobs/{job_id}/stream")
 async def stream_job(job_id: str):
-    """SSE endpoint — streams job status updates until complete or failed."""
+    """SSE endpoint — pushes each progress event as it is published.
+
+    Sends the current state first, then one event per finished pipeline
+    stage until the job completes or fails. Idle periods get a keep-alive
+    comment (and a store re-check) every 15 s; no per-client polling.
+    """
     async def _event_generator() -> AsyncGenerator[str, None]:
-        for _ in range(120):  # max 120 × 1s = 2 min
+        deadline = time.monotonic() + _SSE_MAX_SECONDS
+        # Subscribe before reading the snapshot so no event falls in between
+        async with _events.listen(job_id) as queue:
             job = _jobs.get(job_id)
             if not job:
-                yield f"data: {{\"error\": \"job not found\"}}\n\n"
+                yield _sse({"error": "job not found"})
                 return
-            payload = f'{{"status": "{job["status"]}", "progress": {job.get("progress", 0)}}}'
-            yield f"data: {payload}\n\n"
-            if job["status"] in ("complete", "failed"):
+            yield _sse(_job_snapshot(job))
+            if job["status"] in TERMINAL_STATUSES:
                 return
-            await asyncio.sleep(1)
-        yield 'data: {"status": "timeout"}\n\n'
-
-    return StreamingResponse(_event_generator(), media_type="text/event-stream")
+            while time.monotonic() < deadline:
+                try:
+                    event = await asyncio.wait_for(queue.get(), _SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    job = _jobs.get(job_id)
+                    if not job or job["status"] in TERMINAL_STATUSES:
+                        yield _sse(_job_snapshot(job) if job else {"error": "job not found"})
+                        return
+                    yield ": keep-alive\n\n"
+                    continue
+                yield _sse({k: v for k, v in event.items() if k != "job_id"})
+                if event.get("status") in TERMINAL_STATUSES:
+                    return
+        yield _sse({"status": "timeout"})
+
+    return StreamingResponse(
+        _event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "version": __version__}
+    """Liveness plus dependency status.
+
+    "degraded" when Redis is configured but unreachable — jobs still run
+    on the local render pool.
+    """
+    redis = await _broker.health()
+    return {
+        "status": "degraded" if redis["status"] == "down" else "healthy",
+        "version": __version__,
+        "redis": redis,
+        "render_pool": {"workers": _pool.workers, "in_flight": _pool.in_flight},
+    }
+
+
+def _with_worker_counts(local: Dict[str, Any], worker: Dict[str, int]) -> Dict[str, Any]:
+    """Cache stats of this process plus the lookups made in render-pool workers.
+
+    Hits/misses cover every process; entries and bytes are this process's
+    memory tier only (each worker keeps its own).
+    """
+    merged = dict(local)
+    for counter, value in worker.items():
+        merged[counter] = merged.get(counter, 0) + value
+    lookups = merged["hits"] + merged["misses"]
+    merged["hit_ratio"] = round(merged["hits"] / lookups, 4) if lookups else 0.0
+    merged["workers"] = dict(worker)
+    return merged
 
 
 @app.get("/metrics")
 async def metrics():
-    """Basic job metrics."""
-    total = len(_jobs)
-    by_status: dict[str, int] = {}
-    for j in _jobs.values():
-        s = j.get("status", "unknown")
-        by_status[s] = by_status.get(s, 0) + 1
-    return {"total_jobs": total, "by_status": by_status, "version": __version__}
+    """Basic job, render/parse-cache and per-stage latency metrics."""
+    job_stats = _jobs.stats()
+    pool_stats = _pool.stats()
+    worker_caches = pool_stats["worker_caches"]
+    return {
+        "total_jobs": job_stats["total_jobs"],
+        "by_status": job_stats["by_status"],
+        "job_store": job_stats,
+        "job_events": _events.stats(),
+        "render_pool": pool_stats,
+        "render_cache": _with_worker_counts(get_render_cache().stats(), worker_caches["render_cache"]),
+        "parse_cache": _with_worker_counts(get_parse_cache().stats(), worker_caches["parse_cache"]),
+        "stage_histograms": get_stage_histograms().snapshot(),
+        "version": __version__,
+    }
 
 
 if __name__ == "__main__":
@@ -0,0 +1,234 @@
+"""Process-pool batch engine for multi-workbook DXF generation.
+
+Fans ``(filename, bytes)`` pairs out to worker processes in chunks and
+yields the same result dicts as ``bridge_canvas_features.generate_single``
+(keys: filename, success, dxf_bytes, error).
+
+Features:
+  - Configurable worker count (BRIDGE_GAD_BATCH_WORKERS or CPU count)
+  - Chunking — several small workbooks per task to amortise IPC cost
+  - Per-file timeout — a hung workbook is reported as failed, its worker
+    slot is written off and the pool is recycled once no slots remain
+  - Ordered (input order) or as-completed result delivery
+  - Lazy on both ends: input files are pulled a chunk at a time as worker
+    slots free up (a nightly run of hundreds of workbooks never sits in
+    memory at once), and results are yielded as they arrive, so callers
+    such as ``batch_results_to_zip`` can consume them while later files
+    are still rendering
+
+Usage:
+    for result in iter_batch_generate(files, max_workers=8, timeout=60):
+        ...
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 0 / unset → one worker per CPU
+DEFAULT_MAX_WORKERS: int = int(os.environ.get("BRIDGE_GAD_BATCH_WORKERS", "0")) or (os.cpu_count() or 1)
+
+_Chunk = List[Tuple[int, str, bytes]]
+
+
+# ── Worker side ───────────────────────────────────────────────────────────────
+
+def _register_worker(pids: "multiprocessing.Queue[int]") -> None:
+    """Pool initializer: report this worker's PID so a hung one can be killed."""
+    pids.put(os.getpid())
+
+
+def _render_chunk(chunk: _Chunk, acad_version: str) -> List[Tuple[int, Dict[str, Any]]]:
+    """Render every file of a chunk in the worker process."""
+    from .bridge_canvas_features import generate_single
+    return [(idx, generate_single(name, data, acad_version)) for idx, name, data in chunk]
+
+
+# ── Helpers ───────────────────────────────────────────────────────────────────
+
+def _failure(filename: str, error: str) -> Dict[str, Any]:
+    from pathlib import Path
+    return {
+        "filename": Path(filename).name,
+        "success":  False,
+        "dxf_bytes": None,
+        "error":    error,
+    }
+
+
+def _chunked(files: Iterable[Tuple[str, bytes]], chunksize: int) -> Iterator[_Chunk]:
+    chunk: _Chunk = []
+    for idx, (name, data) in enumerate(files):
+        chunk.append((idx, name, data))
+        if len(chunk) >= chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class _WorkerPool:
+    """A ProcessPoolExecutor plus the PIDs its workers reported on start-up."""
+
+    def __init__(self, workers: int) -> None:
+        self._pids: "multiprocessing.Queue[int]" = multiprocessing.Queue()
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=_register_worker, initargs=(self._pids,)
+        )
+
+    def worker_pids(self) -> List[int]:
+        pids = []
+        while True:
+            try:
+                pids.append(self._pids.get_nowait())
+            except (queue.Empty, OSError, ValueError):
+                return pids
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True)
+        self._pids.close()
+
+    def terminate(self) -> None:
+        """Shut down without waiting for hung workers."""
+        pids = self.worker_pids()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass  # already exited
+        self._pids.close()
+
+
+# ── Engine ────────────────────────────────────────────────────────────────────
+
+def iter_batch_generate(
+    files: Iterable[Tuple[str, bytes]],
+    acad_version: str = "R2010",
+    max_workers: Optional[int] = None,
+    chunksize: int = 1,
+    timeout: Optional[float] = None,
+    ordered: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """Yield one result dict per input file, rendering in a process pool.
+
+    Args:
+        files:        Iterable of (filename, bytes) tuples.
+        acad_version: AutoCAD version string.
+        max_workers:  Worker processes (default: DEFAULT_MAX_WORKERS).
+                      1 renders serially in the calling process.
+        chunksize:    Files handed to a worker per task.
+        timeout:      Per-file timeout in seconds; a chunk gets
+                      ``timeout * len(chunk)``. Ignored in serial mode.
+        ordered:      Yield in input order (else as each chunk completes).
+    """
+    chunksize = max(1, int(chunksize))
+    workers = max(1, int(max_workers or DEFAULT_MAX_WORKERS))
+    chunks = _chunked(files, chunksize)
+
+    # Pull at most one chunk per worker before deciding the pool size, so a
+    # short batch does not start idle workers and a long one is not read
+    # ahead; the rest of ``files`` is consumed as slots free up.
+    pending: List[_Chunk] = []
+    if workers > 1:
+        for chunk in chunks:
+            pending.append(chunk)
+            if len(pending) >= workers:
+                break
+        workers = max(1, len(pending))
+
+    if workers == 1:
+        from .bridge_canvas_features import generate_single
+        for chunk in itertools.chain(pending, chunks):
+            for _, name, data in chunk:
+                yield generate_single(name, data, acad_version)
+        return
+
+    pool = _WorkerPool(workers)
+    slots = workers  # worker slots not occupied by a timed-out task
+    in_flight: Dict[Future, Tuple[_Chunk, Optional[float]]] = {}
+    buffered: Dict[int, Dict[str, Any]] = {}
+    next_idx = 0
+
+    def _submit_chunk(chunk: _Chunk) -> None:
+        fut = pool.executor.submit(_render_chunk, chunk, acad_version)
+        deadline = time.monotonic() + timeout * len(chunk) if timeout else None
+        in_flight[fut] = (chunk, deadline)
+
+    def _submit() -> bool:
+        chunk = pending.pop(0) if pending else next(chunks, None)
+        if chunk is None:
+            return False
+        _submit_chunk(chunk)
+        return True
+
+    logger.info("Batch engine: %d worker(s), chunksize %d", workers, chunksize)
+    try:
+        while len(in_flight) < slots and _submit():
+            pass
+
+        while in_flight:
+            wait_for = None
+            deadlines = [d for _, d in in_flight.values() if d is not None]
+            if deadlines:
+                wait_for = max(0.0, min(deadlines) - time.monotonic())
+            done, _ = wait(list(in_flight), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            finished: List[Tuple[int, Dict[str, Any]]] = []
+            for fut in done:
+                chunk, _ = in_flight.pop(fut)
+                try:
+                    finished.extend(fut.result())
+                except Exception as exc:  # BrokenProcessPool, pickling errors, …
+                    logger.error("Batch worker failed: %s", exc)
+                    finished.extend((idx, _failure(name, str(exc))) for idx, name, _ in chunk)
+
+            now = time.monotonic()
+            for fut, (chunk, deadline) in list(in_flight.items()):
+                if deadline is not None and now >= deadline and not fut.done():
+                    del in_flight[fut]
+                    if not fut.cancel():
+                        slots -= 1  # the worker is stuck on this chunk
+                    logger.warning("Batch chunk timed out: %s", [name for _, name, _ in chunk])
+                    finished.extend(
+                        (idx, _failure(name, f"Timed out after {timeout:g}s")) for idx, name, _ in chunk
+                    )
+
+            if slots <= 0:
+                # Every worker is hung — recycle the pool and resubmit
+                # whatever was still queued behind the hung tasks.
+                pool.terminate()
+                pool = _WorkerPool(workers)
+                slots = workers
+                requeued = [chunk for chunk, _ in in_flight.values()]
+                in_flight.clear()
+                for chunk in requeued:
+                    _submit_chunk(chunk)
+
+            while len(in_flight) < slots and _submit():
+                pass
+
+            if not ordered:
+                for _, result in finished:
+                    yield result
+                continue
+            for idx, result in finished:
+                buffered[idx] = result
+            while next_idx in buffered:
+                yield buffered.pop(next_idx)
+                next_idx += 1
+    finally:
+        if slots < workers or in_flight:
+            pool.terminate()
+        else:
+            pool.shutdown()
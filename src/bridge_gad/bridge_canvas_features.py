@@ -5,7 +5,7 @@ Integrated features:
   - IRC/IS parameter validation with compliance scoring
   - DXF entity cleanup (orphan points, degenerate entities)
   - 5 standard bridge templates (simple, continuous, girder, culvert, arch)
-  - Batch processing helper
+  - Batch processing helper (process-pool backed, see batch_engine)
   - Smart title block recentering utility
 """
 
@@ -15,9 +15,7 @@ import logging
 import os
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
-import pandas as pd
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -267,7 +265,12 @@ BRIDGE_TEMPLATES: Dict[str, Dict[str, Any]] = {
 
 
 def make_template_excel(params: Dict[str, Any]) -> bytes:
-    """Return Excel bytes for a template parameter dict."""
+    """Return Excel bytes for a template parameter dict (for download/editing).
+
+    To draw a template use ``generate_template`` — no workbook involved.
+    """
+    import pandas as pd
+
     data = [[v, k, k] for k, v in params.items()]
     df = pd.DataFrame(data, columns=["Value", "Variable", "Description"])
     buf = BytesIO()
@@ -277,73 +280,129 @@ def make_template_excel(params: Dict[str, Any]) -> bytes:
     return buf.getvalue()
 
 
+def generate_template(template_id: str, acad_version: str = "R2010") -> Optional[bytes]:
+    """Render a ``BRIDGE_TEMPLATES`` entry straight to DXF bytes."""
+    from .bridge_generator import BridgeGADGenerator
+
+    template = BRIDGE_TEMPLATES[template_id]
+    return BridgeGADGenerator(acad_version=acad_version).generate_from_params(template["parameters"])
+
+
 # ── Batch Processing ──────────────────────────────────────────────────────────
 
+def generate_single(
+    filename: str,
+    file_bytes: Union[bytes, Dict[str, Any]],
+    acad_version: str = "R2010",
+) -> Dict[str, Any]:
+    """Generate DXF for one Excel file (or parameter dict, e.g. a template).
+
+    Never raises — failures are reported in the returned dict so that the
+    serial loop and the process-pool engine produce identical results.
+
+    Returns:
+        Result dict with keys: filename, success, dxf_bytes, error.
+    """
+    from .bridge_generator import BridgeGADGenerator
+
+    safe_name = Path(filename).name
+    try:
+        gen = BridgeGADGenerator(acad_version=acad_version)
+        if isinstance(file_bytes, dict):
+            dxf_bytes = gen.generate_from_params(file_bytes)
+        else:
+            dxf_bytes = gen.generate_bytes(file_bytes)
+
+        if dxf_bytes:
+            return {
+                "filename": safe_name,
+                "success":  True,
+                "dxf_bytes": dxf_bytes,
+                "error":    None,
+            }
+        return {
+            "filename": safe_name,
+            "success":  False,
+            "dxf_bytes": None,
+            "error":    "Generation returned no output",
+        }
+    except Exception as exc:
+        logger.exception("Batch generation failed for %s", safe_name)
+        return {
+            "filename": safe_name,
+            "success":  False,
+            "dxf_bytes": None,
+            "error":    str(exc),
+        }
+
+
 def batch_generate(
     files: List[Tuple[str, bytes]],
     acad_version: str = "R2010",
+    max_workers: Optional[int] = None,
+    chunksize: int = 1,
+    timeout: Optional[float] = None,
+    ordered: bool = True,
 ) -> List[Dict[str, Any]]:
     """Generate DXF for multiple Excel files.
 
+    Files are rendered in a process pool (see ``batch_engine``); pass
+    ``max_workers=1`` to render serially in the calling process.
+
     Args:
         files: List of (filename, bytes) tuples.
         acad_version: AutoCAD version string.
+        max_workers: Worker processes (default: CPU count).
+        chunksize: Files handed to a worker per task.
+        timeout: Per-file timeout in seconds (None = no limit).
+        ordered: Return results in input order (else completion order).
 
     Returns:
         List of result dicts with keys: filename, success, dxf_bytes, error.
     """
-    import tempfile
-    from .bridge_generator import BridgeGADGenerator
-
-    results = []
-    for filename, file_bytes in files:
-        safe_name = Path(filename).name
-        try:
-            with tempfile.TemporaryDirectory() as tmp:
-                tmp_path = Path(tmp)
-                excel_path = tmp_path / safe_name
-                excel_path.write_bytes(file_bytes)
-                output_path = tmp_path / f"{excel_path.stem}.dxf"
-
-                gen = BridgeGADGenerator(acad_version=acad_version)
-                ok = gen.generate_complete_drawing(excel_path, output_path)
-
-                if ok and output_path.exists():
-                    results.append({
-                        "filename": safe_name,
-                        "success":  True,
-                        "dxf_bytes": output_path.read_bytes(),
-                        "error":    None,
-                    })
-                else:
-                    results.append({
-                        "filename": safe_name,
-                        "success":  False,
-                        "dxf_bytes": None,
-                        "error":    "Generation returned no output",
-                    })
-        except Exception as exc:
-            logger.exception("Batch generation failed for %s", safe_name)
-            results.append({
-                "filename": safe_name,
-                "success":  False,
-                "dxf_bytes": None,
-                "error":    str(exc),
-            })
-    return results
-
-
-def batch_results_to_zip(results: List[Dict[str, Any]]) -> bytes:
-    """Bundle successful batch results into a ZIP archive."""
-    import zipfile, io
-    buf = io.BytesIO()
-    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-        for r in results:
-            if r["success"] and r.get("dxf_bytes"):
-                stem = Path(r["filename"]).stem
-                zf.writestr(f"{stem}.dxf", r["dxf_bytes"])
-    buf.seek(0)
-    return buf.getvalue()
+    from .batch_engine import iter_batch_generate
+
+    return list(iter_batch_generate(
+        files,
+        acad_version=acad_version,
+        max_workers=max_workers,
+        chunksize=chunksize,
+        timeout=timeout,
+        ordered=ordered,
+    ))
+
+
+def iter_batch_results_zip(
+    results: Iterable[Dict[str, Any]],
+    compresslevel: Optional[int] = None,
+) -> Iterator[bytes]:
+    """Stream successful batch results as ZIP chunks.
+
+    Each DXF is written into the archive as soon as its result arrives and
+    can be released straight after, so peak memory is about one drawing.
+    """
+    from .zip_stream import stream_zip
+
+    entries = (
+        (f"{Path(r['filename']).stem}.dxf", r["dxf_bytes"])
+        for r in results
+        if r["success"] and r.get("dxf_bytes")
+    )
+    return stream_zip(entries, compresslevel)
+
+
+def batch_results_to_zip(
+    results: Iterable[Dict[str, Any]],
+    compresslevel: Optional[int] = None,
+) -> bytes:
+    """Bundle successful batch results into a ZIP archive.
+
+    ``results`` may be a list or the lazy iterator returned by
+    ``batch_engine.iter_batch_generate`` — each DXF is compressed as soon
+    as its result arrives. Use ``iter_batch_results_zip`` to stream the
+    archive instead of building it in memory.
+    """
+    return b"".join(iter_batch_results_zip(results, compresslevel))
 
 
 # ── Smart Title Recentering ───────────────────────────────────────────────────
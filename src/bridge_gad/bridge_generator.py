@@ -3,30 +3,69 @@ Comprehensive Bridge GAD Generator
 Incorporating all engineering logic from existing Python and LISP implementations
 """
 
+import io
 import math
 import os
-import pandas as pd
 import ezdxf
 from ezdxf.math import Vec2, Vec3
-from math import atan2, degrees, sqrt, cos, sin, tan, radians, pi
+from math import atan2, degrees, sqrt, tan, pi
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Any, BinaryIO, Callable, Dict, List, Tuple, Optional, Union
 import logging
 
+from .bridge_params import BridgeParams
+from .doc_factory import add_gad_styles, new_gad_document
+from .dxf_stream import DXFStreamWriter
+from .excel_reader import ExcelSource
+from .geometry_model import invalidate_geometry
+from .parse_cache import cached_parameters
+from .profiling import StageProfile, StageTiming, get_stage_histograms
+from .render_cache import get_render_cache
+
 logger = logging.getLogger(__name__)
 
+# Workbook source or an already-parsed parameter dict
+DrawingSource = Union[ExcelSource, Dict[str, Any]]
+
 class BridgeGADGenerator:
     """Main class for generating comprehensive bridge general arrangement drawings."""
     
-    def __init__(self, acad_version: str = "R2010"):
+    # Drawing stages in execution order: border first (underneath), main
+    # drawing elements, then title block and footer.
+    DRAW_STAGES: Tuple[str, ...] = (
+        "draw_a4_border",
+        "draw_layout_and_axes",
+        "draw_cross_section_profile",
+        "draw_bridge_superstructure",
+        "draw_piers_elevation",
+        "draw_abutments",
+        "draw_plan_view",
+        "draw_side_elevation",
+        "add_dimensions_and_labels",
+        "add_title_block",
+        "add_project_name_footer",
+    )
+    # Every stage recorded by generate_bytes, in order (progress reporting)
+    PIPELINE_STAGES: Tuple[str, ...] = ("read", "setup_document", *DRAW_STAGES, "serialize")
+
+    def __init__(self, acad_version: str = "R2010", use_cache: bool = True,
+                 profile_memory: Optional[bool] = None):
         """Initialize with optional AutoCAD version selection.
         
         Args:
             acad_version: AutoCAD version format (R2006, R2010, etc.)
+            use_cache: Serve repeat renders from the shared render cache.
+            profile_memory: Trace peak memory per stage (default:
+                BRIDGE_GAD_PROFILE_MEMORY).
         """
-        self.doc = None
-        self.msp = None
+        self._doc = None
+        self._msp = None
+        self._cached_dxf: Optional[bytes] = None
+        self.use_cache = use_cache
+        self.profile_memory = profile_memory
+        self.profile: Optional[StageProfile] = None  # stage timings of the last run
         self.variables = {}
+        self.params = BridgeParams()  # typed view of self.variables
         self.scale1 = 186
         self.scale2 = 100
         self.skew = 0
@@ -37,6 +76,29 @@ class BridgeGADGenerator:
         self.sc = 1.86     # scale ratio
         self.acad_version = self._validate_acad_version(acad_version)
         
+    @property
+    def doc(self):
+        """DXF document; re-parsed lazily from cached bytes after a cache hit."""
+        if self._doc is None and self._cached_dxf is not None:
+            self._doc = ezdxf.read(io.StringIO(self._cached_dxf.decode("utf-8", errors="replace")))
+            self._msp = None
+        return self._doc
+
+    @doc.setter
+    def doc(self, value):
+        self._doc = value
+        self._cached_dxf = None
+
+    @property
+    def msp(self):
+        if self._msp is None and self.doc is not None:
+            self._msp = self.doc.modelspace()
+        return self._msp
+
+    @msp.setter
+    def msp(self, value):
+        self._msp = value
+
     def _validate_acad_version(self, version: str) -> str:
         """Validate and normalize AutoCAD version format.
         
@@ -61,87 +123,76 @@ class BridgeGADGenerator:
             return "R2010"
         
     def setup_document(self):
-        """Initialize DXF document with proper setup."""
-        self.doc = ezdxf.new(self.acad_version, setup=True)
+        """Initialize DXF document with proper setup.
+
+        The styled base document comes from the per-process prototype
+        factory, so the linetype/style/dimstyle tables are built once.
+        """
+        self.doc = new_gad_document(self.acad_version)
         self.msp = self.doc.modelspace()
-        self.setup_styles()
         logger.info(f"Document setup completed - Format: {self.acad_version}")
         
     def setup_styles(self):
         """Set up text and dimension styles."""
-        # Create Arial text style
-        if "Arial" not in self.doc.styles:
-            self.doc.styles.new("Arial", dxfattribs={'font': 'Arial.ttf'})
-            
-        # Set up dimension style
-        if "PMB100" not in self.doc.dimstyles:
-            dimstyle = self.doc.dimstyles.new('PMB100')
-            dimstyle.dxf.dimasz = 150
-            dimstyle.dxf.dimtdec = 0
-            dimstyle.dxf.dimexe = 400
-            dimstyle.dxf.dimexo = 400
-            dimstyle.dxf.dimlfac = 1
-            dimstyle.dxf.dimtxsty = "Arial"
-            dimstyle.dxf.dimtxt = 400
-            dimstyle.dxf.dimtad = 0
-            
-    def read_variables_from_excel(self, file_path: Path) -> bool:
+        add_gad_styles(self.doc)
+            
+    def read_variables_from_excel(self, file_path: ExcelSource) -> bool:
         """Read bridge parameters from Excel file.
 
         FIX GENSPARK-002: validates column count before assignment.
         Accepts exactly 3-column (Value, Variable, Description) format.
         Files with other column counts (e.g. span-data tables) are rejected
         gracefully so the caller can fall back to SmartInputProcessor.
+
+        ``file_path`` may also be raw workbook bytes or a binary file-like
+        object (e.g. an upload stream) — nothing is written to disk.
+        Parsing goes through ``excel_reader`` (no pandas import) and the
+        shared parse cache, so a workbook already seen is not parsed again.
         """
         try:
-            df = pd.read_excel(file_path, header=None)
-
-            # Skip header row if first cell is 'Value' or 'Variable'
-            if str(df.iloc[0, 0]).strip().lower() in ("value", "variable"):
-                df = df.iloc[1:].reset_index(drop=True)
-
-            if df.shape[1] < 3:
-                logger.error(
-                    "Excel file must have at least 3 columns (Value, Variable, Description), "
-                    "got %d: %s", df.shape[1], file_path
-                )
+            var_dict = cached_parameters(file_path)
+            if var_dict is None:
                 return False
+            return self.load_variables(var_dict)
+            
+        except Exception as e:
+            logger.error(f"Error reading Excel file: {e}")
+            return False
 
-            if df.shape[1] > 3:
-                # More than 3 columns — not the standard parameter format.
-                # Try using only the first 3 columns; if they don't look like
-                # Value/Variable/Description, reject cleanly.
-                df = df.iloc[:, :3]
+    def load_variables(self, var_dict: Dict[str, Any]) -> bool:
+        """Load bridge parameters from a dict and compute derived values.
 
-            df.columns = ['Value', 'Variable', 'Description']
-            
-            # Create a dictionary for easy access
-            var_dict = df.set_index('Variable')['Value'].to_dict()
-            self.variables = var_dict
-            
-            # Extract key variables
-            self.scale1 = float(var_dict.get('SCALE1', 186))
-            self.scale2 = float(var_dict.get('SCALE2', 100))
-            self.skew = float(var_dict.get('SKEW', 0))
-            self.datum = float(var_dict.get('DATUM', 100))
-            self.left = float(var_dict.get('LEFT', 0))
-            
-            # Calculate derived values
-            self.sc = self.scale1 / self.scale2
+        Values are converted once into ``self.params`` (``BridgeParams``);
+        a value that is not a number fails the load with the variable named.
+        """
+        try:
+            self.variables = dict(var_dict)
+            # Parsed and validated once; the draw stages read self.params
+            self.params = BridgeParams.from_variables(self.variables)
+            p = self.params
+            
+            # Scalars used by the coordinate helpers (draw_layout_and_axes
+            # snaps self.left, so these stay mutable attributes)
+            self.scale1 = p.scale1
+            self.scale2 = p.scale2
+            self.skew = p.skew
+            self.datum = p.datum
+            self.left = p.left
+            self.sc = p.sc
             self.hhs = 1000.0
             self.vvs = 1000.0
             
-            # Trigonometric calculations for skew
-            self.skew1 = self.skew * 0.0174532  # Convert to radians
-            self.s = sin(self.skew1)
-            self.c = cos(self.skew1)
-            self.tn = self.s / self.c if self.c != 0 else 0
+            # Trigonometric values for skew (precomputed by BridgeParams)
+            self.skew1 = p.skew1
+            self.s = p.s
+            self.c = p.c
+            self.tn = p.tn
             
             logger.info(f"Variables loaded successfully. Scale: {self.sc}, Skew: {self.skew}°")
             return True
             
         except Exception as e:
-            logger.error(f"Error reading Excel file: {e}")
+            logger.error(f"Error loading variables: {e}")
             return False
     
     def hpos(self, a: float) -> float:
@@ -170,10 +221,10 @@ class BridgeGADGenerator:
     
     def draw_layout_and_axes(self):
         """Draw the main layout with axes and grid."""
-        right = float(self.variables.get('RIGHT', 50))
-        toprl = float(self.variables.get('TOPRL', 115))
-        xincr = float(self.variables.get('XINCR', 10))
-        yincr = float(self.variables.get('YINCR', 1))
+        right = self.params.right
+        toprl = self.params.toprl
+        xincr = self.params.xincr
+        yincr = self.params.yincr
         
         # Adjust left to nearest integer
         self.left = self.left - (self.left % 1.0)
@@ -273,15 +324,15 @@ class BridgeGADGenerator:
     def draw_bridge_superstructure(self):
         """Draw bridge deck and superstructure elements."""
         try:
-            nspan = int(self.variables.get('NSPAN', 3))
-            span1 = float(self.variables.get('SPAN1', 12))
-            abtl = float(self.variables.get('ABTL', 0))
-            rtl = float(self.variables.get('RTL', 110))
-            sofl = float(self.variables.get('SOFL', 109))
-            lbridge = float(self.variables.get('LBRIDGE', 36))
-            laslab = float(self.variables.get('LASLAB', 3.5))
-            apthk = float(self.variables.get('APTHK', 0.38))
-            wcth = float(self.variables.get('WCTH', 0.08))
+            nspan = self.params.nspan
+            span1 = self.params.span1
+            abtl = self.params.abtl
+            rtl = self.params.deck_rtl
+            sofl = self.params.sofl
+            lbridge = self.params.lbridge
+            laslab = self.params.laslab
+            apthk = self.params.apthk
+            wcth = self.params.wcth
             
             # Draw deck slabs for each span
             for i in range(nspan):
@@ -363,17 +414,17 @@ class BridgeGADGenerator:
     def draw_piers_elevation(self):
         """Draw piers in elevation view."""
         try:
-            nspan = int(self.variables.get('NSPAN', 3))
-            span1 = float(self.variables.get('SPAN1', 12))
-            abtl = float(self.variables.get('ABTL', 0))
-            capw = float(self.variables.get('CAPW', 1.2))
-            capt = float(self.variables.get('CAPT', 110))
-            capb = float(self.variables.get('CAPB', 109.4))
-            piertw = float(self.variables.get('PIERTW', 1.2))
-            battr = float(self.variables.get('BATTR', 10))
-            futrl = float(self.variables.get('FUTRL', 100))
-            futd = float(self.variables.get('FUTD', 1.0))
-            futw = float(self.variables.get('FUTW', 4.5))
+            nspan = self.params.nspan
+            span1 = self.params.span1
+            abtl = self.params.abtl
+            capw = self.params.capw
+            capt = self.params.capt
+            capb = self.params.capb
+            piertw = self.params.piertw
+            battr = self.params.battr
+            futrl = self.params.futrl
+            futd = self.params.futd
+            futw = self.params.futw
             
             # Draw pier caps
             for i in range(1, nspan):
@@ -422,8 +473,8 @@ class BridgeGADGenerator:
         y1 = self.vpos(capb)
         
         # Bottom points (with batter) - pier should connect to top of footing
-        x2 = x1 - offset / cos(radians(self.skew))
-        x4 = x3 + offset / cos(radians(self.skew))
+        x2 = x1 - offset / self.params.cos_skew
+        x4 = x3 + offset / self.params.cos_skew
         y2 = self.vpos(futrl)  # Connect to top of footing (founding level)
         
         # Draw pier outline
@@ -438,7 +489,7 @@ class BridgeGADGenerator:
     
     def draw_pier_footing(self, xc: float, futw: float, futd: float, futrl: float):
         """Draw pier footing below ground level."""
-        futwsq = futw / cos(radians(self.skew))
+        futwsq = futw / self.params.cos_skew
         
         x1 = xc - futwsq / 2
         x2 = xc + futwsq / 2
@@ -467,22 +518,22 @@ class BridgeGADGenerator:
     def draw_left_abutment(self):
         """Draw left abutment with all details."""
         # Get abutment parameters
-        abtl = float(self.variables.get('ABTL', 0))
-        alcw = float(self.variables.get('ALCW', 0.75))
-        alcd = float(self.variables.get('ALCD', 1.2))
-        alfb = float(self.variables.get('ALFB', 10))
-        alfbl = float(self.variables.get('ALFBL', 101))
-        altb = float(self.variables.get('ALTB', 10))
-        altbl = float(self.variables.get('ALTBL', 101))
-        alfo = float(self.variables.get('ALFO', 1.5))
-        alfd = float(self.variables.get('ALFD', 1.0))
-        albb = float(self.variables.get('ALBB', 3))
-        albbl = float(self.variables.get('ALBBL', 101))
-        dwth = float(self.variables.get('DWTH', 0.3))
-        capt = float(self.variables.get('CAPT', 110))
-        rtl = float(self.variables.get('RTL', 110.98))
-        apthk = float(self.variables.get('APTHK', 0.38))
-        slbtht = float(self.variables.get('SLBTHT', 0.75))
+        abtl = self.params.abtl
+        alcw = self.params.alcw
+        alcd = self.params.alcd
+        alfb = self.params.alfb
+        alfbl = self.params.alfbl
+        altb = self.params.altb
+        altbl = self.params.altbl
+        alfo = self.params.alfo
+        alfd = self.params.alfd
+        albb = self.params.albb
+        albbl = self.params.albbl
+        dwth = self.params.dwth
+        capt = self.params.capt
+        rtl = self.params.rtl
+        apthk = self.params.apthk
+        slbtht = self.params.slbtht
         
         # Calculate abutment geometry
         x1 = abtl
@@ -534,28 +585,28 @@ class BridgeGADGenerator:
     def draw_right_abutment(self):
         """Draw right abutment (mirrored version of left)."""
         # Get abutment parameters - using right abutment specific values
-        abtl = float(self.variables.get('ABTL', 0))
-        lbridge = float(self.variables.get('LBRIDGE', 36))
-        nspan = int(self.variables.get('NSPAN', 3))
-        span1 = float(self.variables.get('SPAN1', 12))
+        abtl = self.params.abtl
+        lbridge = self.params.lbridge
+        nspan = self.params.nspan
+        span1 = self.params.span1
         
         # Right abutment parameters
-        arcw = float(self.variables.get('ARCW', 0.75))  # Right abutment cap width
-        arcd = float(self.variables.get('ARCD', 1.2))   # Right abutment cap depth
-        arfb = float(self.variables.get('ARFB', 10))    # Right abutment front batter
-        arfbl = float(self.variables.get('ARFBL', 101)) # Right abutment front batter RL
-        artb = float(self.variables.get('ARTB', 10))    # Right abutment toe batter
-        artbl = float(self.variables.get('ARTBL', 101)) # Right abutment toe batter level
-        arfo = float(self.variables.get('ARFO', 1.5))   # Right abutment front offset
-        arfd = float(self.variables.get('ARFD', 1.0))   # Right abutment footing depth
-        arbb = float(self.variables.get('ARBB', 3))     # Right abutment back batter
-        arbbl = float(self.variables.get('ARBBL', 101)) # Right abutment back batter RL
-        
-        dwth = float(self.variables.get('DWTH', 0.3))
-        capt = float(self.variables.get('CAPT', 110))
-        rtl = float(self.variables.get('RTL', 110.98))
-        apthk = float(self.variables.get('APTHK', 0.38))
-        slbtht = float(self.variables.get('SLBTHT', 0.75))
+        arcw = self.params.arcw  # Right abutment cap width
+        arcd = self.params.arcd   # Right abutment cap depth
+        arfb = self.params.arfb    # Right abutment front batter
+        arfbl = self.params.arfbl # Right abutment front batter RL
+        artb = self.params.artb    # Right abutment toe batter
+        artbl = self.params.artbl # Right abutment toe batter level
+        arfo = self.params.arfo   # Right abutment front offset
+        arfd = self.params.arfd   # Right abutment footing depth
+        arbb = self.params.arbb     # Right abutment back batter
+        arbbl = self.params.arbbl # Right abutment back batter RL
+        
+        dwth = self.params.dwth
+        capt = self.params.capt
+        rtl = self.params.rtl
+        apthk = self.params.apthk
+        slbtht = self.params.slbtht
         
         # Calculate right abutment position (at the end of the bridge)
         right_abt_pos = abtl + nspan * span1
@@ -609,8 +660,8 @@ class BridgeGADGenerator:
     
     def draw_abutment_footing_plan(self, x_start: float, x_end: float, side: str):
         """Draw abutment footing in plan view."""
-        ccbr = float(self.variables.get('CCBR', 11.1))
-        kerbw = float(self.variables.get('KERBW', 0.23))
+        ccbr = self.params.ccbr
+        kerbw = self.params.kerbw
         
         abtlen = ccbr + 2 * kerbw
         yc = self.datum - 30.0
@@ -649,13 +700,13 @@ class BridgeGADGenerator:
     
     def draw_pier_foundation_plan(self):
         """Draw pier and footing plan views with proper dimensions and skew adjustments."""
-        nspan = int(self.variables.get('NSPAN', 3))
-        span1 = float(self.variables.get('SPAN1', 12))
-        abtl = float(self.variables.get('ABTL', 0))
-        futw = float(self.variables.get('FUTW', 4.5))
-        futl = float(self.variables.get('FUTL', 12))
-        piertw = float(self.variables.get('PIERTW', 1.2))
-        pierst = float(self.variables.get('PIERST', 12))
+        nspan = self.params.nspan
+        span1 = self.params.span1
+        abtl = self.params.abtl
+        futw = self.params.futw
+        futl = self.params.futl
+        piertw = self.params.piertw
+        pierst = self.params.pierst
         
         # Plan view Y-coordinate (below elevation view)
         yc = self.datum - 30.0
@@ -664,10 +715,10 @@ class BridgeGADGenerator:
             xc = abtl + i * span1
             
             # Adjust dimensions for skew
-            futwsq = futw / cos(radians(self.skew))
-            futlsq = futl / cos(radians(self.skew))
-            piertwsq = piertw / cos(radians(self.skew))
-            pierstsq = pierst / cos(radians(self.skew))
+            futwsq = futw / self.params.cos_skew
+            futlsq = futl / self.params.cos_skew
+            piertwsq = piertw / self.params.cos_skew
+            pierstsq = pierst / self.params.cos_skew
             
             # Draw footing in plan with skew adjustments
             x1 = xc - futwsq / 2
@@ -676,8 +727,8 @@ class BridgeGADGenerator:
             y2 = yc - futlsq / 2
             
             # Apply skew rotation to footing corners
-            x_offset = (futlsq / 2) * sin(radians(self.skew))
-            y_offset = (futlsq / 2) * (1 - cos(radians(self.skew)))
+            x_offset = (futlsq / 2) * self.params.sin_skew
+            y_offset = (futlsq / 2) * (1 - self.params.cos_skew)
             
             footing_points = [
                 self.pt(x1 - x_offset, y1 - y_offset),
@@ -695,8 +746,8 @@ class BridgeGADGenerator:
             y4 = yc - pierstsq / 2
             
             # Apply skew rotation to pier corners
-            x_pier_offset = (pierstsq / 2) * sin(radians(self.skew))
-            y_pier_offset = (pierstsq / 2) * (1 - cos(radians(self.skew)))
+            x_pier_offset = (pierstsq / 2) * self.params.sin_skew
+            y_pier_offset = (pierstsq / 2) * (1 - self.params.cos_skew)
             
             pier_points = [
                 self.pt(x3 - x_pier_offset, y3 - y_pier_offset),
@@ -718,11 +769,11 @@ class BridgeGADGenerator:
     
     def draw_abutment_foundation_plans(self):
         """Draw foundation plans for both abutments."""
-        ccbr = float(self.variables.get('CCBR', 11.1))
-        kerbw = float(self.variables.get('KERBW', 0.23))
-        abtl = float(self.variables.get('ABTL', 0))
-        nspan = int(self.variables.get('NSPAN', 3))
-        span1 = float(self.variables.get('SPAN1', 12))
+        ccbr = self.params.ccbr
+        kerbw = self.params.kerbw
+        abtl = self.params.abtl
+        nspan = self.params.nspan
+        span1 = self.params.span1
         
         abtlen = ccbr + 2 * kerbw
         yc = self.datum - 30.0
@@ -737,7 +788,7 @@ class BridgeGADGenerator:
     def draw_single_abutment_foundation_plan(self, abt_x: float, abtlen: float, yc: float, label: str):
         """Draw foundation plan for a single abutment with dirt wall."""
         # Get dirt wall thickness
-        dwth = float(self.variables.get('DWTH', 0.3))
+        dwth = self.params.dwth
         
         # Foundation dimensions with extensions
         foundation_ext = 1.5  # Extension beyond abutment
@@ -751,8 +802,8 @@ class BridgeGADGenerator:
         
         # Apply skew adjustments
         xx = (abtlen + foundation_ext) / 2
-        x_adjust = xx * sin(radians(self.skew))
-        y_adjust = xx * (1 - cos(radians(self.skew)))
+        x_adjust = xx * self.params.sin_skew
+        y_adjust = xx * (1 - self.params.cos_skew)
         
         # Draw foundation plan with skew
         foundation_points = [
@@ -766,7 +817,7 @@ class BridgeGADGenerator:
         
         # Draw dirt wall in plan view
         # Dirt wall is perpendicular to bridge axis
-        dwth_sq = dwth / cos(radians(self.skew))
+        dwth_sq = dwth / self.params.cos_skew
         
         # Determine dirt wall position based on abutment side
         if label == "A1":  # Left abutment - dirt wall on left side
@@ -778,8 +829,8 @@ class BridgeGADGenerator:
         
         # Dirt wall extends full width of abutment
         xx_abt = abtlen / 2
-        x_adjust_abt = xx_abt * sin(radians(self.skew))
-        y_adjust_abt = xx_abt * (1 - cos(radians(self.skew)))
+        x_adjust_abt = xx_abt * self.params.sin_skew
+        y_adjust_abt = xx_abt * (1 - self.params.cos_skew)
         
         y_top_abt = yc + abtlen / 2
         y_bottom_abt = yc - abtlen / 2
@@ -831,8 +882,8 @@ class BridgeGADGenerator:
     def draw_a4_border(self):
         """Draw A4 landscape border with professional frame."""
         try:
-            right = float(self.variables.get('RIGHT', 50))
-            lbridge = float(self.variables.get('LBRIDGE', 36))
+            right = self.params.right
+            lbridge = self.params.lbridge
             
             # A4 landscape dimensions in mm (1mm = 2.834645669 drawing units)
             # 297mm width × 210mm height = 841.89 × 595.27 units
@@ -840,7 +891,7 @@ class BridgeGADGenerator:
             border_margin = 50
             border_left = self.hpos(self.left) - border_margin
             border_right = self.hpos(right) + 100 * self.scale1
-            border_top = self.vpos(float(self.variables.get('TOPRL', 115))) + 200
+            border_top = self.vpos(self.params.toprl) + 200
             border_bottom = self.datum - 120 * self.scale1
             
             # Draw A4 landscape border rectangle
@@ -869,22 +920,21 @@ class BridgeGADGenerator:
     def add_title_block(self):
         """Add editable title block with RKS LEGAL company information."""
         try:
-            right = float(self.variables.get('RIGHT', 50))
-            lbridge = float(self.variables.get('LBRIDGE', 36))
+            right = self.params.right
+            lbridge = self.params.lbridge
             
             # Get editable values from Excel
-            project_name = str(self.variables.get('PROJECT_NAME', 'Bridge General Arrangement Drawing'))
-            company_name = str(self.variables.get('COMPANY_NAME', 'RKS LEGAL'))
-            company_full = str(self.variables.get('COMPANY_FULL', 'Techno Legal Consultants'))
-            address = str(self.variables.get('ADDRESS', '303 Vallabh Apartment, Udaipur'))
-            # FIX KERO-004: PII defaults replaced with env-var lookups
-            import os as _os
-            email = str(self.variables.get('EMAIL', _os.environ.get('CONTACT_EMAIL', 'contact@example.com')))
-            mobile = str(self.variables.get('MOBILE', _os.environ.get('CONTACT_PHONE', '+91XXXXXXXXXX')))
+            project_name = self.params.project_name
+            company_name = self.params.company_name
+            company_full = self.params.company_full
+            address = self.params.address
+            # FIX KERO-004: PII defaults replaced with env-var lookups (BridgeParams)
+            email = self.params.email
+            mobile = self.params.mobile
             
             # Position title block on right side of drawing
             title_block_x = self.hpos(right) + 50 * self.scale1
-            title_block_y = self.vpos(float(self.variables.get('TOPRL', 115))) + 100
+            title_block_y = self.vpos(self.params.toprl) + 100
             
             # Main title
             self.msp.add_text("GENERAL ARRANGEMENT DRAWING", dxfattribs={
@@ -947,11 +997,11 @@ class BridgeGADGenerator:
     def add_project_name_footer(self):
         """Add full-width project name at bottom of drawing."""
         try:
-            right = float(self.variables.get('RIGHT', 50))
+            right = self.params.right
             
             # Get project name from Excel
-            project_name = str(self.variables.get('PROJECT_NAME', 'Bridge General Arrangement Drawing'))
-            project_code = str(self.variables.get('PROJECT_CODE', ''))
+            project_name = self.params.project_name
+            project_code = self.params.project_code
             
             # Position at bottom, full width
             footer_x = self.hpos(self.left + (right - self.left) / 2)  # Center horizontally
@@ -980,26 +1030,26 @@ class BridgeGADGenerator:
         """Draw side elevation view showing cross-section of bridge components."""
         try:
             # Get bridge parameters
-            nspan = int(self.variables.get('NSPAN', 3))
-            span1 = float(self.variables.get('SPAN1', 12))
-            abtl = float(self.variables.get('ABTL', 0))
-            rtl = float(self.variables.get('RTL', 110.98))
-            ccbr = float(self.variables.get('CCBR', 11.1))
-            kerbw = float(self.variables.get('KERBW', 0.23))
-            slbthe = float(self.variables.get('SLBTHE', 0.75))
-            kerbd = float(self.variables.get('KERBD', 0.15))
-            capt = float(self.variables.get('CAPT', 110))
-            capb = float(self.variables.get('CAPB', 109.4))
-            piertw = float(self.variables.get('PIERTW', 1.2))
-            pierst = float(self.variables.get('PIERST', 12))
-            futrl = float(self.variables.get('FUTRL', 100))
-            futd = float(self.variables.get('FUTD', 1.0))
-            futw = float(self.variables.get('FUTW', 4.5))
-            futl = float(self.variables.get('FUTL', 12))
-            right = float(self.variables.get('RIGHT', 50))
+            nspan = self.params.nspan
+            span1 = self.params.span1
+            abtl = self.params.abtl
+            rtl = self.params.rtl
+            ccbr = self.params.ccbr
+            kerbw = self.params.kerbw
+            slbthe = self.params.slbthe
+            kerbd = self.params.kerbd
+            capt = self.params.capt
+            capb = self.params.capb
+            piertw = self.params.piertw
+            pierst = self.params.pierst
+            futrl = self.params.futrl
+            futd = self.params.futd
+            futw = self.params.futw
+            futl = self.params.futl
+            right = self.params.right
             
             # Position side elevation to the right of main drawing with margin
-            lbridge = float(self.variables.get('LBRIDGE', 36))
+            lbridge = self.params.lbridge
             side_x_offset = self.hpos(right) + 40 * self.scale1  # Fixed pixels offset from main drawing
             side_y_base = self.datum  # Start at datum level
             
@@ -1162,10 +1212,10 @@ class BridgeGADGenerator:
     
     def add_span_dimensions(self):
         """Add span length dimensions."""
-        nspan = int(self.variables.get('NSPAN', 3))
-        span1 = float(self.variables.get('SPAN1', 12))
-        abtl = float(self.variables.get('ABTL', 0))
-        rtl = float(self.variables.get('RTL', 110.98))
+        nspan = self.params.nspan
+        span1 = self.params.span1
+        abtl = self.params.abtl
+        rtl = self.params.rtl
         
         for i in range(nspan):
             x1 = abtl + i * span1
@@ -1182,38 +1232,54 @@ class BridgeGADGenerator:
             )
             dim.render()
     
-    def generate_complete_drawing(self, excel_file: Path, output_file: Path) -> bool:
-        """Generate complete bridge GAD drawing."""
+    def _draw_all(self, profile: Optional[StageProfile] = None,
+                  writer: Optional[DXFStreamWriter] = None):
+        """Run every drawing stage on the current document.
+
+        With a stream ``writer`` each stage's remaining entities are
+        flushed to the output as the stage ends.
+        """
+        logger.info("Starting bridge drawing generation...")
+        for stage in self.DRAW_STAGES:
+            if profile is None:
+                getattr(self, stage)()
+                if writer is not None:
+                    writer.flush()
+            else:
+                with profile.stage(stage):
+                    getattr(self, stage)()
+                    if writer is not None:
+                        writer.flush()
+        invalidate_geometry(self.doc)  # exporters re-extract what was just drawn
+
+    def generate_complete_drawing(self, excel_file: DrawingSource, output_file: Path,
+                                  streaming: bool = False) -> bool:
+        """Generate complete bridge GAD drawing (workbook or parameter dict).
+
+        ``streaming=True`` writes the file through ``stream_dxf`` (bounded
+        memory for long viaducts; ``self.doc`` is not kept).
+        """
+        if streaming:
+            try:
+                with open(output_file, "wb") as fh:
+                    ok = self.stream_dxf(excel_file, fh)
+                if ok:
+                    logger.info(f"Bridge GAD drawing streamed to: {output_file}")
+                return ok
+            except Exception as e:
+                logger.error(f"Error streaming complete drawing: {e}")
+                return False
         try:
-            # Setup
-            self.setup_document()
-            
-            # Read parameters
-            if not self.read_variables_from_excel(excel_file):
+            dxf_bytes = self.generate_bytes(excel_file)
+            if dxf_bytes is None:
                 return False
             
-            # Draw all components
-            logger.info("Starting bridge drawing generation...")
-            
-            # Draw border and title block first (underneath)
-            self.draw_a4_border()
-            
-            # Main drawing elements
-            self.draw_layout_and_axes()
-            self.draw_cross_section_profile()
-            self.draw_bridge_superstructure()
-            self.draw_piers_elevation()
-            self.draw_abutments()
-            self.draw_plan_view()
-            self.draw_side_elevation()
-            self.add_dimensions_and_labels()
-            
-            # Add title block and footer
-            self.add_title_block()
-            self.add_project_name_footer()
-            
-            # Save the drawing
-            self.doc.saveas(output_file)
+            # Save the drawing; generate_bytes has already fed the stage
+            # histograms, so the write is observed on its own
+            with self.profile.stage("write"):
+                Path(output_file).write_bytes(dxf_bytes)
+            write = self.profile.stages[-1]
+            get_stage_histograms().observe(write.name, write.wall_ms)
             logger.info(f"Bridge GAD drawing saved to: {output_file}")
             
             return True
@@ -1222,6 +1288,187 @@ class BridgeGADGenerator:
             logger.error(f"Error generating complete drawing: {e}")
             return False
 
+    def to_dxf_bytes(self) -> bytes:
+        """Serialise the current document to DXF bytes (no temp file)."""
+        text = io.StringIO()
+        self.doc.write(text)
+        return self.doc.encode(text.getvalue())
+
+    def generate_to_stream(self, source: DrawingSource, stream: BinaryIO,
+                           streaming: bool = False) -> bool:
+        """Generate the drawing and write the DXF into a binary stream.
+
+        Args:
+            source: Parameter dict, workbook bytes, binary file-like or path.
+            stream: Writable binary stream (e.g. ``io.BytesIO``).
+            streaming: Emit entities while drawing (``stream_dxf``) instead
+                of serialising the finished document.
+        """
+        if streaming:
+            return self.stream_dxf(source, stream)
+        dxf_bytes = self.generate_bytes(source)
+        if dxf_bytes is None:
+            return False
+        stream.write(dxf_bytes)
+        return True
+
+    def stream_dxf(
+        self,
+        source: DrawingSource,
+        stream: BinaryIO,
+        on_stage: Optional[Callable[[StageTiming], None]] = None,
+    ) -> bool:
+        """Generate the drawing, writing DXF to ``stream`` as each stage runs.
+
+        Streaming counterpart of ``generate_bytes`` for long viaducts: the
+        document header and tables are written first, then modelspace
+        entities are flushed in chunks of ``BRIDGE_GAD_STREAM_CHUNK`` and
+        dropped from memory (see ``dxf_stream``), so memory does not grow
+        with the span count. Dimensions are written exploded, the render
+        cache is bypassed and ``self.doc`` is not kept afterwards.
+
+        Args:
+            source: Parameter dict, workbook bytes, binary file-like or path.
+            stream: Writable binary stream; on failure it may hold a partial DXF.
+            on_stage: Called with each ``StageTiming`` as the stage finishes.
+
+        Returns:
+            True if the drawing was written.
+        """
+        profile = StageProfile(msp_getter=lambda: self._msp, on_stage=on_stage)
+        if self.profile_memory is not None:
+            profile.track_memory = self.profile_memory
+        self.profile = profile
+        try:
+            with profile.stage("read"):
+                if isinstance(source, dict):
+                    ok = self.load_variables(source)
+                else:
+                    ok = self.read_variables_from_excel(source)
+            if not ok:
+                return False
+
+            with profile.stage("setup_document"):
+                self.setup_document()
+                writer = DXFStreamWriter(self.doc, stream)
+                writer.begin()
+                self.msp = writer.modelspace()
+            self._draw_all(profile, writer)
+
+            with profile.stage("serialize"):
+                writer.close()
+            get_stage_histograms().observe_profile(profile)
+            logger.info(f"Bridge GAD drawing streamed: {writer.entities_written} entities")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error streaming drawing: {e}")
+            return False
+        finally:
+            # The document only holds the last (empty) chunk now
+            self._doc = None
+            self._msp = None
+
+    def generate_from_params(
+        self,
+        params: Dict[str, Any],
+        on_stage: Optional[Callable[[StageTiming], None]] = None,
+    ) -> Optional[bytes]:
+        """Generate the drawing straight from a parameter dict — no workbook.
+
+        Templates, optimizer results and JSON request bodies use this
+        instead of writing an xlsx only to parse it back. Keys are matched
+        case-insensitively (upper-cased, stripped) and ``None`` values are
+        dropped, so a partial dict falls back to the drawing defaults.
+
+        Returns:
+            DXF bytes, or None if the drawing failed.
+        """
+        variables = {
+            str(key).strip().upper(): value
+            for key, value in params.items()
+            if value is not None and str(key).strip()
+        }
+        return self.generate_bytes(variables, on_stage=on_stage)
+
+    def generate_profiled(
+        self,
+        source: DrawingSource,
+        on_stage: Optional[Callable[[StageTiming], None]] = None,
+    ) -> Tuple[Optional[bytes], StageProfile]:
+        """``generate_bytes`` plus the per-stage timings of the run.
+
+        Returns:
+            (DXF bytes or None, StageProfile with one entry per stage).
+        """
+        dxf_bytes = self.generate_bytes(source, on_stage=on_stage)
+        return dxf_bytes, self.profile
+
+    def generate_bytes(
+        self,
+        source: DrawingSource,
+        on_stage: Optional[Callable[[StageTiming], None]] = None,
+    ) -> Optional[bytes]:
+        """Generate the complete drawing in memory.
+
+        Bytes-in/bytes-out counterpart of ``generate_complete_drawing``:
+        the workbook is parsed from memory and the DXF is serialised
+        straight to bytes, so a request makes no filesystem round-trips.
+        Per-stage timings of the run are left in ``self.profile``.
+
+        Args:
+            source: Parameter dict, workbook bytes, binary file-like or path.
+            on_stage: Called with each ``StageTiming`` as the stage finishes
+                (see ``PIPELINE_STAGES``); a render-cache hit only reports "read".
+
+        Returns:
+            DXF bytes, or None if the parameters could not be read or the
+            drawing failed.
+        """
+        profile = StageProfile(msp_getter=lambda: self._msp, on_stage=on_stage)
+        if self.profile_memory is not None:
+            profile.track_memory = self.profile_memory
+        self.profile = profile
+        try:
+            with profile.stage("read"):
+                if isinstance(source, dict):
+                    ok = self.load_variables(source)
+                else:
+                    ok = self.read_variables_from_excel(source)
+            if not ok:
+                return None
+            
+            # Content-addressed cache: a hit never touches ezdxf
+            cache_key = None
+            if self.use_cache:
+                cache = get_render_cache()
+                cache_key = cache.make_key(self.params, self.acad_version, "dxf")
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    self._doc = None
+                    self._msp = None
+                    self._cached_dxf = cached
+                    profile.cache_hit = True
+                    get_stage_histograms().observe_profile(profile)
+                    logger.info(f"Bridge GAD drawing served from render cache: {len(cached)} bytes")
+                    return cached
+            
+            with profile.stage("setup_document"):
+                self.setup_document()
+            self._draw_all(profile)
+            
+            with profile.stage("serialize"):
+                dxf_bytes = self.to_dxf_bytes()
+            if cache_key is not None:
+                cache.put(cache_key, dxf_bytes)
+            get_stage_histograms().observe_profile(profile)
+            logger.info(f"Bridge GAD drawing generated in memory: {len(dxf_bytes)} bytes")
+            return dxf_bytes
+            
+        except Exception as e:
+            logger.error(f"Error generating drawing in memory: {e}")
+            return None
+
 
 def generate_bridge_gad(excel_file: Path, output_file: Path = None) -> Path:
     """Main function to generate bridge GAD from Excel input."""
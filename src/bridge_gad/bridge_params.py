@@ -0,0 +1,175 @@
+"""Typed, immutable bridge parameter record for the drawing stages.
+
+The workbook yields a loose ``{Variable: Value}`` dict. Every ``draw_*``
+stage used to re-read it with ``float(self.variables.get('X', default))``
+— the same few dozen lookups and conversions repeated across the
+superstructure, piers, abutments, plan, side elevation and dimensions.
+``BridgeParams.from_variables`` does that once per drawing: each value is
+converted (and a bad one rejected with its variable name) and the skew
+trigonometry is precomputed, so the stages read plain attributes.
+
+Defaults are shared by every stage except RTL: the superstructure stage
+has always fallen back to 110 while the others use 110.98, so a workbook
+without RTL keeps its deck where it was (``deck_rtl``).
+
+The record is a NamedTuple — a tuple subclass with ``__slots__ = ()`` —
+so it is immutable and hashable (usable as a dict / ``lru_cache`` key)
+and compact; field defaults are the drawing defaults.
+
+Usage:
+    params = BridgeParams.from_variables({"NSPAN": 4, "SPAN1": 15.0, ...})
+    params.nspan, params.rtl, params.cos_skew
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+from typing import Any, Dict, Mapping, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# Legacy degree→radian factor used for the s/c/tn values (kept so drawings
+# do not shift); sin_skew/cos_skew use the exact conversion.
+_LEGACY_DEG2RAD = 0.0174532
+
+# The superstructure stage's own RTL fallback (the other stages use 110.98)
+_DECK_RTL_DEFAULT = 110.0
+
+_INT_FIELDS = frozenset({"nspan"})
+_TEXT_FIELDS = frozenset({
+    "project_name", "project_code", "company_name", "company_full",
+    "address", "email", "mobile",
+})
+# Computed in from_variables, never read from the workbook
+_DERIVED_FIELDS = frozenset({
+    "deck_rtl", "sc", "skew1", "s", "c", "tn", "sin_skew", "cos_skew",
+})
+
+
+class BridgeParams(NamedTuple):
+    """Drawing parameters; field ``x`` is workbook variable ``X``."""
+
+    # ── Scales and layout ─────────────────────────────────────────────────────
+    scale1: float = 186.0
+    scale2: float = 100.0
+    skew: float = 0.0
+    datum: float = 100.0
+    left: float = 0.0
+    right: float = 50.0
+    toprl: float = 115.0
+    xincr: float = 10.0
+    yincr: float = 1.0
+
+    # ── Spans and deck ────────────────────────────────────────────────────────
+    nspan: int = 3
+    span1: float = 12.0
+    lbridge: float = 36.0
+    abtl: float = 0.0
+    rtl: float = 110.98
+    sofl: float = 109.0
+    laslab: float = 3.5
+    apthk: float = 0.38
+    wcth: float = 0.08
+    slbtht: float = 0.75
+    slbthe: float = 0.75
+    ccbr: float = 11.1
+    kerbw: float = 0.23
+    kerbd: float = 0.15
+
+    # ── Piers ─────────────────────────────────────────────────────────────────
+    capw: float = 1.2
+    capt: float = 110.0
+    capb: float = 109.4
+    piertw: float = 1.2
+    battr: float = 10.0
+    pierst: float = 12.0
+    futrl: float = 100.0
+    futd: float = 1.0
+    futw: float = 4.5
+    futl: float = 12.0
+
+    # ── Abutments (left AL*, right AR*) ───────────────────────────────────────
+    dwth: float = 0.3
+    alcw: float = 0.75
+    alcd: float = 1.2
+    alfb: float = 10.0
+    alfbl: float = 101.0
+    altb: float = 10.0
+    altbl: float = 101.0
+    alfo: float = 1.5
+    alfd: float = 1.0
+    albb: float = 3.0
+    albbl: float = 101.0
+    arcw: float = 0.75
+    arcd: float = 1.2
+    arfb: float = 10.0
+    arfbl: float = 101.0
+    artb: float = 10.0
+    artbl: float = 101.0
+    arfo: float = 1.5
+    arfd: float = 1.0
+    arbb: float = 3.0
+    arbbl: float = 101.0
+
+    # ── Title block ───────────────────────────────────────────────────────────
+    project_name: str = "Bridge General Arrangement Drawing"
+    project_code: str = ""
+    company_name: str = "RKS LEGAL"
+    company_full: str = "Techno Legal Consultants"
+    address: str = "303 Vallabh Apartment, Udaipur"
+    email: str = "contact@example.com"
+    mobile: str = "+91XXXXXXXXXX"
+
+    # ── Derived ───────────────────────────────────────────────────────────────
+    deck_rtl: float = 110.0  # RTL for the superstructure stage (default 110)
+    sc: float = 1.86        # scale1 / scale2
+    skew1: float = 0.0      # skew in radians (legacy factor)
+    s: float = 0.0          # sin(skew1)
+    c: float = 1.0          # cos(skew1)
+    tn: float = 0.0         # tan(skew1), 0 at 90°
+    sin_skew: float = 0.0   # sin(radians(skew))
+    cos_skew: float = 1.0   # cos(radians(skew))
+
+    @classmethod
+    def from_variables(cls, variables: Mapping[str, Any]) -> "BridgeParams":
+        """Convert and validate a ``{Variable: Value}`` dict once.
+
+        Missing variables take the field default (EMAIL/MOBILE fall back to
+        ``CONTACT_EMAIL``/``CONTACT_PHONE``). Raises ValueError naming the
+        variable when a value cannot be read as a number.
+        """
+        defaults = dict(cls._field_defaults)
+        defaults["email"] = os.environ.get("CONTACT_EMAIL", defaults["email"])
+        defaults["mobile"] = os.environ.get("CONTACT_PHONE", defaults["mobile"])
+
+        values: Dict[str, Any] = {}
+        for name in cls._fields:
+            if name in _DERIVED_FIELDS:
+                continue
+            raw = variables.get(name.upper(), defaults[name])
+            if name in _TEXT_FIELDS:
+                values[name] = str(raw)
+                continue
+            try:
+                values[name] = int(float(raw)) if name in _INT_FIELDS else float(raw)
+            except (TypeError, ValueError, OverflowError):
+                raise ValueError(f"{name.upper()}: expected a number, got {raw!r}") from None
+
+        if values["scale2"] == 0:
+            raise ValueError("SCALE2: must be non-zero")
+        skew1 = values["skew"] * _LEGACY_DEG2RAD
+        s, c = math.sin(skew1), math.cos(skew1)
+        skew_rad = math.radians(values["skew"])
+        return cls(
+            **values,
+            deck_rtl=values["rtl"] if "RTL" in variables else _DECK_RTL_DEFAULT,
+            sc=values["scale1"] / values["scale2"],
+            skew1=skew1,
+            s=s,
+            c=c,
+            tn=s / c if c != 0 else 0,
+            sin_skew=math.sin(skew_rad),
+            cos_skew=math.cos(skew_rad),
+        )
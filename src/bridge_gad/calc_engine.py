@@ -6,6 +6,26 @@ Implements:
   - Deterministic ordering
   - Formula sandbox (safe eval with restricted builtins)
 
+Formulas are compiled once, at ``register_formula``: the expression is
+parsed, checked against a whitelist of AST nodes and builtins (anything
+else raises ``FormulaError`` there, not at evaluation time), names are
+normalised (parameters upper-case, builtins such as ``sqrt`` in any case)
+and the result is cached as a code object. Evaluation runs that code
+against the engine's value dict directly — no per-formula namespace copy.
+
+The dependency graph is built from the identifiers in each formula when it
+is registered (not re-derived on every ``set``/``recalculate``). ``set``
+marks the formulas that read the changed name; ``recalculate`` walks only
+that subgraph in topological order, re-evaluating a dependent only when
+something it reads actually changed.
+
+``sweep`` evaluates every formula over numpy arrays of input values (or
+the cartesian grid of them) in one pass — thousands of what-if scenarios
+per call, without touching the engine's own state. Each formula is also
+compiled in a vector form for this: ``x if c else y`` becomes
+``where(c, x, y)``, ``and``/``or``/``not`` and chained comparisons act
+element-wise, and the sandbox builtins map to their numpy ufuncs.
+
 Usage:
     engine = CalcEngine()
     engine.set("SPAN1", 12.0)
@@ -13,13 +33,27 @@ Usage:
     engine.register_formula("LBRIDGE", "SPAN1 * NSPAN")
     results = engine.recalculate()
     # results["LBRIDGE"] == 36.0
+
+    df = engine.sweep({"SPAN1": np.arange(10, 30), "NSPAN": [2, 3, 4]}, grid=True)
+    # 60 rows: SPAN1, NSPAN, LBRIDGE
 """
 
 from __future__ import annotations
 
+import ast
+import copy
+import functools
+import heapq
 import logging
 import math
-from typing import Any, Callable, Dict, List, Optional, Set
+from collections import deque
+from types import CodeType
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Set
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +68,122 @@ _SAFE_BUILTINS: Dict[str, Any] = {
     "pow": math.pow,
 }
 
+# numpy counterparts for sweep(); same names as _SAFE_BUILTINS plus the
+# helpers the vector transform emits (lower-case, so never a parameter name)
+_VECTOR_BUILTINS: Dict[str, Any] = {
+    "__builtins__": {},
+    "abs": np.abs, "round": np.round,
+    "min": lambda *a: functools.reduce(np.minimum, a),
+    "max": lambda *a: functools.reduce(np.maximum, a),
+    "int": np.trunc, "float": lambda x: np.asarray(x, dtype=float),
+    "bool": lambda x: np.asarray(x, dtype=bool),
+    "sqrt": np.sqrt, "ceil": np.ceil, "floor": np.floor,
+    "pi": math.pi, "sin": np.sin, "cos": np.cos, "tan": np.tan,
+    "log": lambda x, base=math.e: np.log(x) / math.log(base), "log10": np.log10, "exp": np.exp,
+    "pow": np.power,
+    "where": np.where, "logical_and": np.logical_and,
+    "logical_or": np.logical_or, "logical_not": np.logical_not,
+}
+
+_BUILTIN_NAMES: Dict[str, str] = {k.upper(): k for k in _SAFE_BUILTINS if k != "__builtins__"}
+
+# ── Formula compiler ─────────────────────────────────────────────────────────
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp,
+    ast.Call, ast.keyword, ast.Name, ast.Load, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.UAdd, ast.USub, ast.Not, ast.And, ast.Or,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+
+
+class FormulaError(ValueError):
+    """A formula is not valid Python or uses something outside the whitelist."""
+
+
+class CompiledFormula(NamedTuple):
+    source: str
+    code: CodeType
+    vector: CodeType        # element-wise form for sweep()
+    names: FrozenSet[str]   # parameter names read (upper-case, builtins excluded)
+
+
+def _call(func: str, *args: ast.expr) -> ast.Call:
+    return ast.Call(func=ast.Name(id=func, ctx=ast.Load()), args=list(args), keywords=[])
+
+
+class _Vectorize(ast.NodeTransformer):
+    """Rewrite control flow that needs scalar truth values into numpy calls."""
+
+    def visit_IfExp(self, node: ast.IfExp) -> ast.AST:
+        self.generic_visit(node)
+        return _call("where", node.test, node.body, node.orelse)
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> ast.AST:
+        self.generic_visit(node)
+        func = "logical_and" if isinstance(node.op, ast.And) else "logical_or"
+        return functools.reduce(lambda a, b: _call(func, a, b), node.values)
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        return _call("logical_not", node.operand) if isinstance(node.op, ast.Not) else node
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        self.generic_visit(node)
+        if len(node.ops) == 1:
+            return node
+        operands = [node.left, *node.comparators]
+        pairs = [
+            ast.Compare(left=operands[i], ops=[op], comparators=[operands[i + 1]])
+            for i, op in enumerate(node.ops)
+        ]
+        return functools.reduce(lambda a, b: _call("logical_and", a, b), pairs)
+
+
+def compile_formula(formula: str, name: str = "formula") -> CompiledFormula:
+    """Parse, whitelist-check and compile ``formula`` into a cached code object.
+
+    Raises FormulaError for syntax errors, disallowed constructs
+    (attributes, subscripts, lambdas, ...), calls to anything but the safe
+    builtins, and non-numeric constants.
+    """
+    try:
+        tree = ast.parse(formula.strip(), mode="eval")
+    except SyntaxError as exc:
+        raise FormulaError(f"{name}: invalid formula {formula!r}: {exc.msg}") from None
+
+    names: Set[str] = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise FormulaError(f"{name}: {type(node).__name__} not allowed in {formula!r}")
+        if isinstance(node, ast.Constant) and type(node.value) not in (int, float, bool):
+            raise FormulaError(f"{name}: constant {node.value!r} not allowed in {formula!r}")
+        if isinstance(node, ast.Call) and not (
+            isinstance(node.func, ast.Name) and node.func.id.upper() in _BUILTIN_NAMES
+        ):
+            raise FormulaError(f"{name}: only safe builtins may be called in {formula!r}")
+        if isinstance(node, ast.Name):
+            builtin = _BUILTIN_NAMES.get(node.id.upper())
+            if builtin is not None:
+                node.id = builtin
+            elif node.id.startswith("__"):
+                raise FormulaError(f"{name}: name {node.id!r} not allowed in {formula!r}")
+            else:
+                node.id = node.id.upper()
+                names.add(node.id)
+    vector_tree = ast.fix_missing_locations(_Vectorize().visit(copy.deepcopy(tree)))
+    return CompiledFormula(
+        formula,
+        compile(tree, f"<formula {name}>", "eval"),
+        compile(vector_tree, f"<formula {name} (vector)>", "eval"),
+        frozenset(names),
+    )
+
+
+def formula_names(formula: str) -> FrozenSet[str]:
+    """Parameter names referenced by ``formula`` (upper-cased, builtins excluded)."""
+    return compile_formula(formula).names
+
 
 class CalcEngine:
     """Reactive parameter calculation engine with dependency tracking."""
@@ -41,21 +191,29 @@ class CalcEngine:
     def __init__(self) -> None:
         self._values: Dict[str, float] = {}
         self._formulas: Dict[str, str] = {}          # name → formula string
+        self._compiled: Dict[str, CodeType] = {}     # name → compiled formula
+        self._vectorized: Dict[str, CodeType] = {}   # name → element-wise form
         self._callbacks: Dict[str, Callable] = {}    # name → callable
-        self._dirty: Set[str] = set()
+        self._dirty: Set[str] = set()                # formulas due for evaluation
+        self._deps: Dict[str, FrozenSet[str]] = {}   # formula → names it reads
+        self._dependents: Dict[str, Set[str]] = {}   # name → formulas reading it
+        self._order: Optional[List[str]] = None      # cached topological order
+        self._rank: Dict[str, int] = {}              # formula → position in _order
 
     # ── Value management ──────────────────────────────────────────────────────
 
     def set(self, name: str, value: float) -> None:
-        """Set a raw parameter value and mark dependents dirty."""
+        """Set a raw parameter value and mark it and the formulas reading it dirty.
+
+        Their own dependents are reached during ``recalculate`` (only if a
+        value actually changes on the way). Setting a formula's own output
+        lasts until then: ``recalculate`` re-evaluates the formula.
+        """
         name = name.upper()
         if self._values.get(name) != value:
             self._values[name] = value
             self._dirty.add(name)
-            # Mark all formulas that depend on this name as dirty
-            for fname, formula in self._formulas.items():
-                if name in formula.upper():
-                    self._dirty.add(fname)
+            self._dirty.update(self._dependents.get(name, ()))
 
     def get(self, name: str, default: float = 0.0) -> float:
         """Get a parameter value (raw or computed)."""
@@ -76,9 +234,23 @@ class CalcEngine:
 
         Formula may reference other parameter names (case-insensitive).
         Example: register_formula("LBRIDGE", "SPAN1 * NSPAN")
+
+        Raises FormulaError if the formula does not compile or leaves the
+        sandbox whitelist; the engine is left unchanged in that case.
         """
-        self._formulas[name.upper()] = formula
-        self._dirty.add(name.upper())
+        name = name.upper()
+        compiled = compile_formula(formula, name)
+        for dep in self._deps.get(name, ()):
+            self._dependents[dep].discard(name)
+        deps = compiled.names - {name}
+        self._formulas[name] = formula
+        self._compiled[name] = compiled.code
+        self._vectorized[name] = compiled.vector
+        self._deps[name] = deps
+        for dep in deps:
+            self._dependents.setdefault(dep, set()).add(name)
+        self._order = None
+        self._dirty.add(name)
 
     def register_callback(self, name: str, fn: Callable[[float], None]) -> None:
         """Register a callback fired when a parameter value changes."""
@@ -87,77 +259,127 @@ class CalcEngine:
     # ── Dependency graph ──────────────────────────────────────────────────────
 
     def _build_dep_graph(self) -> Dict[str, Set[str]]:
-        """Build adjacency map: formula_name → set of names it depends on."""
-        graph: Dict[str, Set[str]] = {}
-        all_names = set(self._values.keys()) | set(self._formulas.keys())
-        for fname, formula in self._formulas.items():
-            deps: Set[str] = set()
-            for token in formula.upper().split():
-                clean = token.strip("()+-*/,")
-                if clean in all_names and clean != fname:
-                    deps.add(clean)
-            graph[fname] = deps
-        return graph
+        """Adjacency map: formula_name → set of names it depends on."""
+        return {name: set(deps) for name, deps in self._deps.items()}
 
     def _topological_order(self) -> List[str]:
-        """Return formula names in safe evaluation order (Kahn's algorithm)."""
-        graph = self._build_dep_graph()
-        in_degree: Dict[str, int] = {n: 0 for n in graph}
-        dependents: Dict[str, List[str]] = {n: [] for n in graph}
-
-        for node, deps in graph.items():
-            for dep in deps:
-                if dep in graph:
-                    in_degree[node] += 1
-                    dependents[dep].append(node)
-
-        queue = [n for n, d in in_degree.items() if d == 0]
+        """Formula names in safe evaluation order (Kahn's algorithm, cached).
+
+        Rebuilt only after ``register_formula``; formulas on a cycle are
+        left out (never evaluated).
+        """
+        if self._order is not None:
+            return self._order
+        in_degree: Dict[str, int] = {
+            name: sum(1 for dep in deps if dep in self._formulas) for name, deps in self._deps.items()
+        }
+        queue = deque(name for name, degree in in_degree.items() if degree == 0)
         order: List[str] = []
         while queue:
-            node = queue.pop(0)
+            node = queue.popleft()
             order.append(node)
-            for dep in dependents.get(node, []):
-                in_degree[dep] -= 1
-                if in_degree[dep] == 0:
-                    queue.append(dep)
+            for dependent in self._dependents.get(node, ()):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
 
-        if len(order) < len(graph):
-            logger.warning("Circular dependency detected in formulas — partial evaluation")
+        if len(order) < len(self._formulas):
+            cyclic = sorted(set(self._formulas) - set(order))
+            logger.warning("Circular dependency detected in formulas %s — partial evaluation", cyclic)
+        self._order = order
+        self._rank = {name: i for i, name in enumerate(order)}
         return order
 
     # ── Recalculation ─────────────────────────────────────────────────────────
 
+    def _evaluate(self, name: str) -> bool:
+        """Evaluate one formula; True if its value changed."""
+        try:
+            # Parameters resolve from the live value dict, math from the sandbox globals
+            result = float(eval(self._compiled[name], _SAFE_BUILTINS, self._values))  # noqa: S307
+        except Exception as exc:
+            logger.warning("Formula eval failed for %s (%s): %s", name, self._formulas[name], exc)
+            return False
+        old = self._values.get(name)
+        self._values[name] = result
+        logger.debug("Calc %s = %s (formula: %s)", name, result, self._formulas[name])
+        if old == result:
+            return False
+        if name in self._callbacks:
+            try:
+                self._callbacks[name](result)
+            except Exception as cb_err:
+                logger.warning("Callback error for %s: %s", name, cb_err)
+        return True
+
     def recalculate(self, force: bool = False) -> Dict[str, float]:
         """Evaluate all dirty (or all, if force=True) formulas in dependency order.
 
+        Only the subgraph downstream of the dirty formulas is visited, and a
+        dependent is re-evaluated only when one of its inputs changed.
         Returns the full parameter dict after recalculation.
         """
         order = self._topological_order()
-        for name in order:
-            if not force and name not in self._dirty:
-                continue
-            formula = self._formulas.get(name)
-            if not formula:
-                continue
-            try:
-                # Build eval namespace: current values + safe math
-                ns = {**_SAFE_BUILTINS, **{k: v for k, v in self._values.items()}}
-                result = float(eval(formula.upper(), ns))  # noqa: S307
-                old = self._values.get(name)
-                self._values[name] = result
-                self._dirty.discard(name)
-                if old != result and name in self._callbacks:
-                    try:
-                        self._callbacks[name](result)
-                    except Exception as cb_err:
-                        logger.warning("Callback error for %s: %s", name, cb_err)
-                logger.debug("Calc %s = %s (formula: %s)", name, result, formula)
-            except Exception as exc:
-                logger.warning("Formula eval failed for %s (%s): %s", name, formula, exc)
+        if force:
+            for name in order:
+                self._evaluate(name)
+        else:
+            rank = self._rank
+            heap = [rank[name] for name in self._dirty if name in rank]
+            heapq.heapify(heap)
+            queued = set(heap)
+            while heap:
+                name = order[heapq.heappop(heap)]
+                if self._evaluate(name):
+                    for dependent in self._dependents.get(name, ()):
+                        pos = rank.get(dependent)
+                        if pos is not None and pos not in queued:
+                            queued.add(pos)
+                            heapq.heappush(heap, pos)
 
         self._dirty.clear()
         return dict(self._values)
 
+    # ── What-if sweeps ────────────────────────────────────────────────────────
+
+    def sweep(self, inputs: Mapping[str, Any], grid: bool = False) -> "pd.DataFrame":
+        """Evaluate every formula for many input scenarios at once.
+
+        ``inputs`` maps parameter names to scalars or 1-D arrays. With
+        ``grid=False`` the arrays are broadcast together (equal lengths, one
+        scenario per position); with ``grid=True`` every combination is
+        evaluated (cartesian product, first input varying slowest).
+        Parameters not in ``inputs`` keep their current engine value.
+
+        Returns a DataFrame with one row per scenario: the swept inputs, then
+        each formula in evaluation order. A formula that fails for the batch
+        is logged and yields NaN. The engine itself is not modified.
+        """
+        import pandas as pd
+
+        names = [name.upper() for name in inputs]
+        arrays = [np.atleast_1d(np.asarray(value, dtype=float)) for value in inputs.values()]
+        if any(a.ndim != 1 for a in arrays):
+            raise ValueError("sweep inputs must be scalars or 1-D arrays")
+        if grid and arrays:
+            arrays = [a.ravel() for a in np.meshgrid(*arrays, indexing="ij")]
+        arrays = np.broadcast_arrays(*arrays) if arrays else []
+        rows = len(arrays[0]) if arrays else 1
+
+        ns: Dict[str, Any] = dict(self._values)
+        ns.update(zip(names, arrays))
+        columns: Dict[str, np.ndarray] = dict(zip(names, arrays))
+        with np.errstate(all="ignore"):
+            for name in self._topological_order():
+                try:
+                    result = eval(self._vectorized[name], _VECTOR_BUILTINS, ns)  # noqa: S307
+                    result = np.broadcast_to(np.asarray(result, dtype=float), (rows,))
+                except Exception as exc:
+                    logger.warning("Vector formula eval failed for %s (%s): %s", name, self._formulas[name], exc)
+                    result = np.full(rows, np.nan)
+                ns[name] = columns[name] = result
+        return pd.DataFrame(columns)
+
     # ── Built-in bridge formulas ──────────────────────────────────────────────
 
     @classmethod
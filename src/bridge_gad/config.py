@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
 import yaml
@@ -61,7 +61,12 @@ class Settings(BaseModel):
     @classmethod
     def from_yaml(cls, path: Path) -> "Settings":
         with path.open() as f:
-            data = yaml.safe_load(f)
+            return cls.from_yaml_text(f.read())
+
+    @classmethod
+    def from_yaml_text(cls, text: Union[str, bytes]) -> "Settings":
+        """Settings from YAML already in memory (e.g. an uploaded config file)."""
+        data = yaml.safe_load(text)
         return cls(**(data or {}))
 
 
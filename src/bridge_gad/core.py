@@ -8,19 +8,36 @@ FIXES applied:
   KIMI-001     — removed module-level logging.basicConfig call (library anti-pattern)
 """
 
+import io
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import ezdxf
 import pandas as pd
 from ezdxf import units
 
 from .config import Settings
+from .doc_factory import new_document
+from .excel_reader import ExcelSource
+from .profiling import StageProfile, StageTiming
+from .render_cache import get_render_cache
 
 # FIX KIMI-001: use getLogger only — do NOT call basicConfig in a library module
 logger = logging.getLogger(__name__)
 
+# The compact GAD this wrapper draws (no border, title block or side views)
+DRAW_STAGES = (
+    "draw_layout_and_axes",
+    "draw_bridge_superstructure",
+    "draw_piers_elevation",
+    "draw_abutments",
+    "draw_plan_view",
+    "add_dimensions_and_labels",
+)
+# Render cache format tag: keeps these drawings apart from the full GAD
+CACHE_FORMAT = "core.dxf"
+
 
 class BridgeDrawing:
     """Thin wrapper that delegates real drawing to BridgeGADGenerator.
@@ -33,49 +50,93 @@ class BridgeDrawing:
         self.settings = settings or Settings()
         self.doc = None
         self.msp = None
-        self._excel_path: Optional[Path] = None
+        self._excel_path: Optional[ExcelSource] = None
+        self.profile: Optional[StageProfile] = None  # stage timings of the last draw
         self._setup_document()
 
     def _setup_document(self) -> None:
-        """Set up the DXF document with appropriate settings."""
-        self.doc = ezdxf.new("R2010", setup=True)
-        self.doc.units = units.M
+        """Set up the DXF document with appropriate settings.
+
+        The layered base document is copied from a per-process prototype
+        keyed by the configured layer names.
+        """
+        layer_names = tuple(self.settings.output.layers.values())
+
+        def _build():
+            doc = ezdxf.new("R2010", setup=True)
+            doc.units = units.M
+            self._setup_layers(doc)
+            return doc
+
+        self.doc = new_document(("core", layer_names), _build)
         self.msp = self.doc.modelspace()
-        self._setup_layers()
 
-    def _setup_layers(self) -> None:
+    def _setup_layers(self, doc=None) -> None:
         """Set up layers from configuration."""
+        doc = doc if doc is not None else self.doc
         for layer_name in self.settings.output.layers.values():
-            if layer_name not in self.doc.layers:
-                self.doc.layers.add(name=layer_name, color=7, linetype="CONTINUOUS")
+            if layer_name not in doc.layers:
+                doc.layers.add(name=layer_name, color=7, linetype="CONTINUOUS")
 
-    def set_excel_source(self, excel_path: Path) -> None:
-        """Provide the Excel file that draw_bridge() will read."""
+    def set_excel_source(self, excel_path: ExcelSource) -> None:
+        """Provide the Excel file that draw_bridge() will read (path, bytes or binary file-like)."""
         self._excel_path = excel_path
 
-    def draw_bridge(self) -> None:
-        """Generate bridge drawing by delegating to BridgeGADGenerator."""
+    def draw_bridge(self, on_stage: Optional[Callable[[StageTiming], None]] = None) -> None:
+        """Generate bridge drawing by delegating to BridgeGADGenerator.
+
+        Stage timings are left in ``self.profile``; ``on_stage`` is called
+        as each stage finishes.
+        """
+        self._draw(on_stage, serialize=False)
+
+    def render_bytes(self, on_stage: Optional[Callable[[StageTiming], None]] = None) -> Optional[bytes]:
+        """Draw and serialise the DXF in memory, served from the render cache when possible.
+
+        Returns None if the workbook could not be read or the drawing failed.
+        """
+        return self._draw(on_stage, serialize=True)
+
+    def _draw(self, on_stage: Optional[Callable[[StageTiming], None]], serialize: bool) -> Optional[bytes]:
         logger.info("Starting bridge drawing generation via BridgeGADGenerator")
+        from .bridge_generator import BridgeGADGenerator
+        gen = BridgeGADGenerator(acad_version="R2010")
+        profile = self.profile = StageProfile(msp_getter=lambda: gen._msp, on_stage=on_stage)
         if self._excel_path is None:
             logger.warning("No Excel source set — drawing will be empty")
-            return
+            return None
+        dxf_bytes = None
         try:
-            from .bridge_generator import BridgeGADGenerator
-            gen = BridgeGADGenerator(acad_version="R2010")
-            if gen.read_variables_from_excel(self._excel_path):
+            with profile.stage("read"):
+                ok = gen.read_variables_from_excel(self._excel_path)
+            if not ok:
+                return None
+            cache = get_render_cache() if serialize else None
+            if cache is not None:
+                cache_key = cache.make_key(gen.params, "R2010", CACHE_FORMAT)
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    profile.cache_hit = True
+                    logger.info(f"Bridge drawing served from render cache: {len(cached)} bytes")
+                    return cached
+            with profile.stage("setup_document"):
                 gen.setup_document()
-                gen.draw_layout_and_axes()
-                gen.draw_bridge_superstructure()
-                gen.draw_piers_elevation()
-                gen.draw_abutments()
-                gen.draw_plan_view()
-                gen.add_dimensions_and_labels()
-                # Transfer the generated document
-                self.doc = gen.doc
-                self.msp = gen.msp
+            for stage in DRAW_STAGES:
+                with profile.stage(stage):
+                    getattr(gen, stage)()
+            # Transfer the generated document
+            self.doc = gen.doc
+            self.msp = gen.msp
+            if cache is not None:
+                with profile.stage("serialize"):
+                    text = io.StringIO()
+                    self.doc.write(text)
+                    dxf_bytes = self.doc.encode(text.getvalue())
+                cache.put(cache_key, dxf_bytes)
         except Exception as e:
             logger.error(f"draw_bridge delegation failed: {e}")
         logger.info("Bridge drawing generation completed")
+        return dxf_bytes
 
     def save(self, output_path: Optional[Path] = None) -> None:
         """Save the drawing to a file."""
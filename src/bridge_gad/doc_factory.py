@@ -0,0 +1,112 @@
+"""Prototype DXF document factory.
+
+``ezdxf.new(version, setup=True)`` plus the Arial text style, the PMB100
+dimension style and any configured layers is rebuilt for every drawing,
+every detail sheet and every ``BridgeDrawing``. This module builds each
+distinct base document once per process, keeps it as a pickled prototype
+and hands out independent copies — unpickling is several times faster
+as rebuilding (see scripts/bench_document_template.py).
+
+Usage:
+    doc = new_gad_document("R2010")          # styled GAD base document
+    doc = new_sheet_document("R2010")        # plain detail-sheet document
+    doc = new_document(key, builder)         # any other prototype
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import pickle
+import threading
+from typing import Callable, Dict, Hashable, Optional
+
+import ezdxf
+from ezdxf.document import Drawing
+
+logger = logging.getLogger(__name__)
+
+# key → pickled prototype, or None when the prototype could not be pickled
+_prototypes: Dict[Hashable, Optional[bytes]] = {}
+_lock = threading.Lock()
+
+
+def add_gad_styles(doc: Drawing) -> None:
+    """Add the Arial text style and PMB100 dimension style to ``doc``."""
+    # Create Arial text style
+    if "Arial" not in doc.styles:
+        doc.styles.new("Arial", dxfattribs={'font': 'Arial.ttf'})
+
+    # Set up dimension style
+    if "PMB100" not in doc.dimstyles:
+        dimstyle = doc.dimstyles.new('PMB100')
+        dimstyle.dxf.dimasz = 150
+        dimstyle.dxf.dimtdec = 0
+        dimstyle.dxf.dimexe = 400
+        dimstyle.dxf.dimexo = 400
+        dimstyle.dxf.dimlfac = 1
+        dimstyle.dxf.dimtxsty = "Arial"
+        dimstyle.dxf.dimtxt = 400
+        dimstyle.dxf.dimtad = 0
+
+
+def _refresh_identity(doc: Drawing) -> None:
+    """Give a copy its own creation time and GUIDs."""
+    try:
+        from ezdxf.tools import guid
+        from ezdxf.tools.juliandate import juliandate
+
+        doc.header["$TDCREATE"] = juliandate(datetime.datetime.now())
+        if "$FINGERPRINTGUID" in doc.header:
+            doc.header["$FINGERPRINTGUID"] = guid()
+        if "$VERSIONGUID" in doc.header:
+            doc.header["$VERSIONGUID"] = guid()
+    except Exception as exc:
+        logger.debug("Could not refresh document identity: %s", exc)
+
+
+def new_document(key: Hashable, builder: Callable[[], Drawing]) -> Drawing:
+    """Return a fresh copy of the prototype document registered under ``key``.
+
+    ``builder`` is called once per process to create the prototype. If the
+    prototype cannot be pickled the factory falls back to calling
+    ``builder`` for every document.
+    """
+    if key not in _prototypes:
+        with _lock:
+            if key not in _prototypes:
+                proto = builder()
+                try:
+                    _prototypes[key] = pickle.dumps(proto, protocol=pickle.HIGHEST_PROTOCOL)
+                except Exception as exc:
+                    logger.warning("DXF prototype %r is not picklable, building per use: %s", key, exc)
+                    _prototypes[key] = None
+                return proto
+
+    blob = _prototypes[key]
+    if blob is None:
+        return builder()
+    doc = pickle.loads(blob)
+    _refresh_identity(doc)
+    return doc
+
+
+def clear_prototypes() -> None:
+    """Forget all prototypes (e.g. after changing style definitions)."""
+    with _lock:
+        _prototypes.clear()
+
+
+def new_gad_document(acad_version: str) -> Drawing:
+    """Styled base document used by BridgeGADGenerator."""
+    def _build() -> Drawing:
+        doc = ezdxf.new(acad_version, setup=True)
+        add_gad_styles(doc)
+        return doc
+
+    return new_document(("gad", acad_version), _build)
+
+
+def new_sheet_document(acad_version: str) -> Drawing:
+    """Plain base document used by DetailedSheetGenerator."""
+    return new_document(("sheet", acad_version), lambda: ezdxf.new(acad_version))
@@ -0,0 +1,203 @@
+"""Streaming DXF output: modelspace entities are written as they are drawn.
+
+``generate_bytes`` builds the complete ezdxf document, serialises it to a
+string and encodes that to bytes, so a long viaduct holds every entity
+plus two copies of the output in memory at once. ``DXFStreamWriter``
+instead writes the HEADER/CLASSES/TABLES/BLOCKS sections of the styled
+base document up front, then exports the modelspace entities in chunks
+while the ``draw_*`` stages run — deleting them from the document once
+written — and closes with the OBJECTS section. Memory stays at roughly
+one chunk of entities whatever the span count.
+
+Streamed output differs from the in-memory document in two ways:
+  * DIMENSION entities are exploded into their lines, solids and text —
+    their anonymous geometry blocks belong in the BLOCKS section, which
+    has already been written;
+  * ``$HANDSEED`` is written before the entities exist, so it is set a
+    fixed window (``HANDLE_WINDOW``) above the base document's handles.
+
+The writer drives ezdxf below its public API (the handle generator,
+layout entity spaces, the section exporters), so the dependency is pinned
+to the 1.4 series and ``DXFStreamWriter`` refuses to start on an ezdxf
+that lacks those internals rather than write a corrupt file.
+
+Configuration (environment):
+  BRIDGE_GAD_STREAM_CHUNK  entities buffered between flushes (default 256)
+
+Usage:
+    with open("viaduct.dxf", "wb") as fh:
+        writer = DXFStreamWriter(doc, fh)
+        writer.begin()
+        msp = writer.modelspace()          # add entities as usual
+        ...
+        writer.close()
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+from typing import Any, BinaryIO, Optional, Set
+
+import ezdxf
+from ezdxf.document import Drawing
+from ezdxf.lldxf.const import DXF12
+from ezdxf.lldxf.tagwriter import TagWriter
+
+logger = logging.getLogger(__name__)
+
+CHUNK_ENTITIES: int = int(os.environ.get("BRIDGE_GAD_STREAM_CHUNK", "256"))
+# Handles reserved for streamed entities (and scratch dimension blocks)
+HANDLE_WINDOW = 0x10000000
+
+
+def _check_ezdxf_internals(doc: Drawing) -> None:
+    """Raise if this ezdxf lacks the internals the stream writer relies on."""
+    missing = [
+        name for name, present in [
+            ("EntityDB.handles._handle", hasattr(doc.entitydb.handles, "_handle")),
+            ("EntityDB.purge", hasattr(doc.entitydb, "purge")),
+            ("BaseLayout.entity_space", hasattr(doc.modelspace(), "entity_space")),
+            ("TagWriter.write_str", hasattr(TagWriter, "write_str")),
+        ]
+        if not present
+    ]
+    if missing:
+        raise RuntimeError(
+            f"Streaming DXF output is not supported with ezdxf {ezdxf.__version__} "
+            f"(missing {', '.join(missing)}); install ezdxf 1.4.x or use non-streamed output"
+        )
+
+
+class _StreamingLayout:
+    """Modelspace proxy that flushes the writer before each ``add_*`` call.
+
+    Flushing *before* an add keeps the entity just returned alive for the
+    caller (e.g. ``add_linear_dim(...).render()``). ``len()`` counts the
+    entities written so far plus those still buffered.
+    """
+
+    def __init__(self, writer: "DXFStreamWriter", layout) -> None:
+        self._writer = writer
+        self._layout = layout
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._layout, name)
+        if not name.startswith("add_") or not callable(attr):
+            return attr
+
+        def add(*args, **kwargs):
+            self._writer.maybe_flush()
+            return attr(*args, **kwargs)
+
+        return add
+
+    def __len__(self) -> int:
+        return self._writer.entities_written + len(self._layout)
+
+    def __iter__(self):
+        return iter(self._layout)
+
+
+class DXFStreamWriter:
+    """Write ``doc`` to a binary stream, flushing modelspace entities in chunks."""
+
+    def __init__(self, doc: Drawing, stream: BinaryIO, chunk_entities: int = CHUNK_ENTITIES) -> None:
+        if doc.dxfversion <= DXF12:
+            raise ValueError("Streaming output needs DXF R2000 or later")
+        _check_ezdxf_internals(doc)
+        self.doc = doc
+        self.chunk_entities = max(1, chunk_entities)
+        self.entities_written = 0
+        self.flushes = 0
+        self.peak_buffered = 0
+        self._stream = stream
+        self._text: Optional[io.TextIOWrapper] = None
+        self._tagwriter: Optional[TagWriter] = None
+        self._handle_limit = 0
+        self._written_blocks: Set[str] = set()
+        self._db_baseline = 0
+        self._msp = doc.modelspace()
+
+    def modelspace(self) -> _StreamingLayout:
+        """Modelspace to draw into; entities are streamed out as it fills."""
+        return _StreamingLayout(self, self._msp)
+
+    # ── Sections ──────────────────────────────────────────────────────────────
+
+    def begin(self) -> None:
+        """Write everything up to the start of the ENTITIES section."""
+        doc = self.doc
+        doc.commit_pending_changes()
+        doc.update_all()
+        handles = doc.entitydb.handles
+        self._handle_limit = handles._handle + HANDLE_WINDOW
+        doc.header["$HANDSEED"] = "%X" % self._handle_limit
+
+        self._text = io.TextIOWrapper(
+            self._stream, encoding=doc.output_encoding, errors="dxfreplace", newline="",
+        )
+        self._tagwriter = TagWriter(self._text, write_handles=True, dxfversion=doc.dxfversion)
+        doc.header.export_dxf(self._tagwriter)
+        doc.classes.export_dxf(self._tagwriter)
+        doc.tables.export_dxf(self._tagwriter)
+        doc.blocks.export_dxf(self._tagwriter)
+        self._written_blocks = {block.name for block in doc.blocks}
+        self._tagwriter.write_str("  0\nSECTION\n  2\nENTITIES\n")
+        self._db_baseline = len(doc.entitydb)
+
+    def maybe_flush(self) -> None:
+        # Measured on the entity database, which also sees the geometry
+        # blocks that rendered dimensions create outside the modelspace
+        if len(self.doc.entitydb) - self._db_baseline >= self.chunk_entities:
+            self.flush()
+
+    def flush(self) -> None:
+        """Export the buffered modelspace entities and drop them from the document."""
+        msp = self._msp
+        if not len(msp):
+            return
+        for dimension in msp.query("DIMENSION"):
+            self._explode_dimension(dimension)
+        if self.doc.entitydb.handles._handle >= self._handle_limit:
+            raise RuntimeError("Streamed drawing exhausted its reserved handle window")
+        for insert in msp.query("INSERT"):
+            # e.g. a non-standard arrow block created while rendering
+            if insert.dxf.name not in self._written_blocks:
+                raise RuntimeError(f"Block {insert.dxf.name!r} was created after the BLOCKS section was written")
+
+        buffered = len(msp)
+        self.peak_buffered = max(self.peak_buffered, buffered)
+        msp.entity_space.export_dxf(self._tagwriter)
+        msp.delete_all_entities()
+        self.doc.entitydb.purge()  # deleted entities stay in the database until purged
+        self._db_baseline = len(self.doc.entitydb)
+        self.entities_written += buffered
+        self.flushes += 1
+
+    def _explode_dimension(self, dimension) -> None:
+        block_name = dimension.dxf.get("geometry")
+        dimension.explode()
+        if block_name and block_name in self.doc.blocks:
+            self.doc.blocks.delete_block(block_name, safe=False)
+
+    def close(self) -> None:
+        """Flush the remaining entities and write ENTITIES end, OBJECTS and EOF."""
+        self.flush()
+        doc = self.doc
+        tagwriter = self._tagwriter
+        doc.active_layout().entity_space.export_dxf(tagwriter)
+        tagwriter.write_tag2(0, "ENDSEC")
+        doc.objects.export_dxf(tagwriter)
+        if doc.acdsdata.is_valid:
+            doc.acdsdata.export_dxf(tagwriter)
+        for section in doc.stored_sections:
+            section.export_dxf(tagwriter)
+        tagwriter.write_tag2(0, "EOF")
+        self._text.flush()
+        self._text.detach()  # leave the caller's stream open
+        logger.info(
+            "Streamed %d entities in %d flushes (peak %d buffered)",
+            self.entities_written, self.flushes, self.peak_buffered,
+        )
@@ -12,6 +12,8 @@ from pathlib import Path
 from typing import Dict, Any, Optional, Union, List
 import logging
 
+from .parse_cache import get_parse_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,7 +64,12 @@ class SmartInputProcessor:
         
         logger.info(f"Reading input file: {file_path}")
         
-        # Determine file type and read accordingly
+        # Same content + format → parsed once per process (see parse_cache)
+        suffix = file_path.suffix.lower()
+        return get_parse_cache().get_or_parse(file_path, f"smart{suffix}", self._read_by_suffix)
+    
+    def _read_by_suffix(self, file_path: Path) -> Dict[str, Any]:
+        """Parse ``file_path`` with the reader for its extension."""
         suffix = file_path.suffix.lower()
         
         if suffix in ['.xlsx', '.xls']:
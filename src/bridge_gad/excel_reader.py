@@ -0,0 +1,224 @@
+"""Lightweight workbook reader for the 3-column parameter sheets.
+
+The parameter workbooks hold ~60 ``Value | Variable | Description`` rows.
+Reading them through ``pd.read_excel`` costs the pandas import (~0.5 s in
+a cold process) plus a DataFrame build and ``set_index().to_dict()`` for
+what is a plain key/value table. This module streams the first sheet's
+XML straight out of the xlsx zip (shared strings + ``sheetN.xml`` via
+``iterparse``) into Python lists and dicts, so the generation path never
+imports pandas and skips openpyxl's style/workbook model as well. Cells
+yield their stored values: numbers (int when integral), strings, booleans,
+cached formula results; date formatting is not applied.
+
+Workbooks the fast path cannot follow fall back to openpyxl
+(``read_only``/``values_only``); legacy ``.xls`` files (not zip-based)
+go through pandas/xlrd, imported only when such a file shows up.
+
+Usage:
+    rows = read_rows("inputs/sample_input.xlsx")     # [[12.0, "SPAN1", "..."], ...]
+    params = parameters_from_rows(rows)              # {"SPAN1": 12.0, ...} or None
+    params = read_parameters(upload_bytes)           # both steps
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import posixpath
+import re
+import zipfile
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Union
+from xml.etree.ElementTree import iterparse
+
+logger = logging.getLogger(__name__)
+
+# Anything a workbook can be read from
+ExcelSource = Union[Path, str, bytes, BinaryIO]
+
+_ZIP_MAGIC = b"PK\x03\x04"
+_HEADER_CELLS = ("value", "variable")
+_CELL_REF = re.compile(r"([A-Z]+)(\d+)")
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _is_zip(source: Union[Path, str, BinaryIO]) -> bool:
+    """True for xlsx/xlsm (zip containers); the stream position is preserved."""
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as fh:
+            return fh.read(4) == _ZIP_MAGIC
+    pos = source.tell()
+    try:
+        return source.read(4) == _ZIP_MAGIC
+    finally:
+        source.seek(pos)
+
+
+def _trim(row) -> List[Any]:
+    """Row values without the trailing empty cells."""
+    values = list(row)
+    while values and values[-1] is None:
+        values.pop()
+    return values
+
+
+def _column_index(letters: str) -> int:
+    index = 0
+    for ch in letters:
+        index = index * 26 + ord(ch) - 64
+    return index - 1
+
+
+def _number(text: str) -> Any:
+    # Same rule as openpyxl: integral literals stay int
+    return float(text) if "." in text or "E" in text or "e" in text else int(text)
+
+
+def _first_sheet_path(zf: zipfile.ZipFile) -> str:
+    """Zip member of the workbook's first sheet (via workbook.xml and its rels)."""
+    sheet_rid = None
+    for _, elem in iterparse(zf.open("xl/workbook.xml")):
+        if _local(elem.tag) == "sheet":
+            sheet_rid = elem.get(f"{_REL_NS}id")
+            break
+    for _, elem in iterparse(zf.open("xl/_rels/workbook.xml.rels")):
+        if _local(elem.tag) == "Relationship" and elem.get("Id") == sheet_rid:
+            target = elem.get("Target")
+            return target.lstrip("/") if target.startswith("/") else posixpath.normpath(f"xl/{target}")
+    raise KeyError("first worksheet not found")
+
+
+def _shared_strings(zf: zipfile.ZipFile) -> List[str]:
+    if "xl/sharedStrings.xml" not in zf.namelist():
+        return []
+    strings: List[str] = []
+    for _, elem in iterparse(zf.open("xl/sharedStrings.xml")):
+        if _local(elem.tag) == "si":
+            # Plain <t> or rich-text runs <r><t>; phonetic hints (<rPh>) skipped
+            parts: List[str] = []
+            for child in elem:
+                tag = _local(child.tag)
+                if tag == "t":
+                    parts.append(child.text or "")
+                elif tag == "r":
+                    parts.extend(t.text or "" for t in child if _local(t.tag) == "t")
+            strings.append("".join(parts))
+            elem.clear()
+    return strings
+
+
+def _read_rows_xml(source: Union[Path, str, BinaryIO]) -> List[List[Any]]:
+    """First-sheet rows parsed directly from the xlsx zip."""
+    with zipfile.ZipFile(source) as zf:
+        strings = _shared_strings(zf)
+        rows: List[List[Any]] = []
+        row: List[Any] = []
+        value: Optional[str] = None
+        for _, elem in iterparse(zf.open(_first_sheet_path(zf))):
+            tag = _local(elem.tag)
+            if tag == "v":
+                value = elem.text
+            elif tag == "t":  # inline string
+                value = (value or "") + (elem.text or "")
+            elif tag == "c":
+                if value is not None:
+                    kind = elem.get("t", "n")
+                    match = _CELL_REF.match(elem.get("r") or "")
+                    col = _column_index(match.group(1)) if match else len(row)
+                    if kind == "s":
+                        cell: Any = strings[int(value)]
+                    elif kind == "b":
+                        cell = value == "1"
+                    elif kind in ("str", "inlineStr", "e"):
+                        cell = value
+                    else:
+                        cell = _number(value)
+                    row.extend([None] * (col - len(row)))
+                    row.append(cell)
+                value = None
+                elem.clear()
+            elif tag == "row":
+                number = elem.get("r")
+                if number is not None:
+                    rows.extend([] for _ in range(int(number) - 1 - len(rows)))
+                rows.append(_trim(row))
+                row = []
+                elem.clear()
+    return rows
+
+
+def _read_rows_openpyxl(source: Union[Path, str, BinaryIO]) -> List[List[Any]]:
+    from openpyxl import load_workbook
+
+    wb = load_workbook(source, read_only=True, data_only=True)
+    try:
+        return [_trim(row) for row in wb.worksheets[0].iter_rows(values_only=True)]
+    finally:
+        wb.close()
+
+
+def _read_rows_pandas(source: Union[Path, str, BinaryIO]) -> List[List[Any]]:
+    import pandas as pd
+
+    df = pd.read_excel(source, header=None)
+    return [_trim(None if pd.isna(v) else v for v in row) for row in df.itertuples(index=False)]
+
+
+def read_rows(source: ExcelSource) -> List[List[Any]]:
+    """All rows of the first sheet as lists of cell values (``None`` = empty).
+
+    Trailing empty cells and trailing empty rows are dropped, like
+    ``pd.read_excel(header=None)``; empty rows in between are kept as ``[]``.
+    Formula cells yield their cached values.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    if not _is_zip(source):
+        return _read_rows_pandas(source)
+
+    start = None if isinstance(source, (str, Path)) else source.tell()
+    try:
+        rows = _read_rows_xml(source)
+    except (KeyError, ValueError, IndexError, SyntaxError, zipfile.BadZipFile) as exc:
+        logger.debug("Fast xlsx read failed (%s) — using openpyxl", exc)
+        if start is not None:
+            source.seek(start)
+        rows = _read_rows_openpyxl(source)
+    while rows and not rows[-1]:
+        rows.pop()
+    return rows
+
+
+def parameters_from_rows(rows: List[List[Any]]) -> Optional[Dict[str, Any]]:
+    """``{Variable: Value}`` from 3-column (Value, Variable, Description) rows.
+
+    A leading header row (first cell "Value" or "Variable") is skipped,
+    columns past the third are ignored and rows without a variable name are
+    dropped; a repeated variable keeps its last value, an empty value reads
+    as NaN. Returns None when the sheet has fewer than 3 columns, so the
+    caller can fall back to ``SmartInputProcessor``.
+    """
+    width = max((len(row) for row in rows), default=0)
+    if width < 3:
+        logger.error(
+            "Excel file must have at least 3 columns (Value, Variable, Description), got %d", width
+        )
+        return None
+    if rows and rows[0] and str(rows[0][0]).strip().lower() in _HEADER_CELLS:
+        rows = rows[1:]
+
+    params: Dict[str, Any] = {}
+    for row in rows:
+        if len(row) < 2 or row[1] is None:
+            continue
+        params[row[1]] = float("nan") if row[0] is None else row[0]
+    return params
+
+
+def read_parameters(source: ExcelSource) -> Optional[Dict[str, Any]]:
+    """Read a 3-column parameter workbook into ``{Variable: Value}`` (None if not one)."""
+    return parameters_from_rows(read_rows(source))
@@ -0,0 +1,260 @@
+"""Array-backed geometry extracted from a DXF modelspace.
+
+Every exporter needs the same coordinates: the matplotlib renderer, the
+HTML canvas viewer, the JSON export and the plot-limit/bounds helpers.
+``extract_geometry`` walks the modelspace once and stores each entity
+kind in compact numpy buffers together with precomputed bounds;
+``get_geometry`` caches the result per document so a multi-format run
+(PDF + SVG + PNG + HTML + JSON) extracts exactly once.
+
+Buffers:
+  lines          (N, 4)  x1, y1, x2, y2                      LINE
+  poly_vertices  (V, 2)  all vertices, split by poly_offsets LWPOLYLINE
+  circles        (C, 3)  cx, cy, r                           CIRCLE
+  arcs           (A, 5)  cx, cy, r, start_angle, end_angle   ARC
+  text_xy        (T, 2)  insert point                        TEXT, MTEXT
+  text_hr        (T, 2)  height, rotation
+
+Usage:
+    geometry = get_geometry(doc)
+    geometry.bounds, geometry.polylines(), geometry.to_element_dict()
+    invalidate_geometry(doc)        # after editing entities in place
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Bounds = Tuple[float, float, float, float]  # min_x, min_y, max_x, max_y
+
+_TEXT_KINDS = ("TEXT", "MTEXT")
+
+
+def _empty(cols: int) -> np.ndarray:
+    return np.empty((0, cols), dtype=float)
+
+
+@dataclass
+class ExtractedGeometry:
+    """Coordinates of one modelspace, grouped per entity kind."""
+
+    lines: np.ndarray = field(default_factory=lambda: _empty(4))
+    poly_vertices: np.ndarray = field(default_factory=lambda: _empty(2))
+    poly_offsets: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=np.int64))
+    poly_closed: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))
+    circles: np.ndarray = field(default_factory=lambda: _empty(3))
+    arcs: np.ndarray = field(default_factory=lambda: _empty(5))
+    text_xy: np.ndarray = field(default_factory=lambda: _empty(2))
+    text_hr: np.ndarray = field(default_factory=lambda: _empty(2))
+    text_strings: List[str] = field(default_factory=list)
+    # Per modelspace entity, in order: dxftype, layer and row in its kind's buffer
+    entity_kinds: List[str] = field(default_factory=list)
+    entity_layers: List[str] = field(default_factory=list)
+    entity_rows: List[int] = field(default_factory=list)
+    bounds: Optional[Bounds] = None        # LINE + LWPOLYLINE extents
+    line_bounds: Optional[Bounds] = None   # LINE extents only
+
+    @property
+    def entity_count(self) -> int:
+        return len(self.entity_kinds)
+
+    @property
+    def polyline_count(self) -> int:
+        return len(self.poly_offsets) - 1
+
+    def polyline(self, i: int) -> np.ndarray:
+        return self.poly_vertices[self.poly_offsets[i]:self.poly_offsets[i + 1]]
+
+    def polylines(self) -> List[np.ndarray]:
+        """Vertex array per LWPOLYLINE (views into ``poly_vertices``)."""
+        return np.split(self.poly_vertices, self.poly_offsets[1:-1]) if self.polyline_count else []
+
+    def texts(self) -> List[Tuple[str, float, float, float, float]]:
+        """(text, x, y, height, rotation) per TEXT/MTEXT."""
+        xy = self.text_xy.tolist()
+        hr = self.text_hr.tolist()
+        return [(s, p[0], p[1], h[0], h[1]) for s, p, h in zip(self.text_strings, xy, hr)]
+
+    # ── Legacy element views (HTML canvas / JSON exports) ────────────────────
+
+    def to_element_dict(self) -> Dict[str, List]:
+        """``MultiFormatExporter`` element dict (lines, polylines, texts, …)."""
+        lines = self.lines.tolist()
+        circles = self.circles.tolist()
+        arcs = self.arcs.tolist()
+        return {
+            'lines': [{'start': (ln[0], ln[1]), 'end': (ln[2], ln[3])} for ln in lines],
+            'rectangles': [],
+            'polylines': [
+                {'points': [tuple(p) for p in pts.tolist()], 'closed': bool(closed)}
+                for pts, closed in zip(self.polylines(), self.poly_closed.tolist())
+            ],
+            'texts': [
+                {'text': s, 'position': (x, y), 'height': h, 'rotation': r}
+                for s, x, y, h, r in self.texts()
+            ],
+            'dimensions': [],
+            'arcs': [
+                {'center': (a[0], a[1]), 'radius': a[2], 'start_angle': a[3], 'end_angle': a[4]}
+                for a in arcs
+            ],
+            'circles': [{'center': (c[0], c[1]), 'radius': c[2]} for c in circles],
+        }
+
+    def to_element_list(self) -> List[Dict[str, Any]]:
+        """``UltimateExporter`` element list: one dict per modelspace entity."""
+        lines = self.lines.tolist()
+        circles = self.circles.tolist()
+        arcs = self.arcs.tolist()
+        texts = self.texts()
+        out: List[Dict[str, Any]] = []
+        for kind, layer, row in zip(self.entity_kinds, self.entity_layers, self.entity_rows):
+            element: Dict[str, Any] = {'type': kind, 'layer': layer}
+            if kind == 'LINE':
+                ln = lines[row]
+                element['start'] = (ln[0], ln[1])
+                element['end'] = (ln[2], ln[3])
+            elif kind == 'CIRCLE':
+                c = circles[row]
+                element['center'] = (c[0], c[1])
+                element['radius'] = c[2]
+            elif kind == 'ARC':
+                a = arcs[row]
+                element['center'] = (a[0], a[1])
+                element['radius'] = a[2]
+                element['start_angle'] = a[3]
+                element['end_angle'] = a[4]
+            elif kind == 'TEXT':
+                s, x, y, h, _ = texts[row]
+                element['text'] = s
+                element['position'] = (x, y)
+                element['height'] = h
+            elif kind == 'LWPOLYLINE':
+                element['points'] = [tuple(p) for p in self.polyline(row).tolist()]
+                element['closed'] = bool(self.poly_closed[row])
+            out.append(element)
+        return out
+
+
+def _extent(points: np.ndarray) -> Optional[Bounds]:
+    if not len(points):
+        return None
+    lo = points.min(axis=0)
+    hi = points.max(axis=0)
+    return float(lo[0]), float(lo[1]), float(hi[0]), float(hi[1])
+
+
+def extract_geometry(msp) -> ExtractedGeometry:
+    """Walk ``msp`` once and build an ``ExtractedGeometry``."""
+    lines: List[float] = []
+    vertices: List[np.ndarray] = []
+    offsets: List[int] = [0]
+    closed: List[bool] = []
+    circles: List[float] = []
+    arcs: List[float] = []
+    text_xy: List[float] = []
+    text_hr: List[float] = []
+    geom = ExtractedGeometry()
+
+    for entity in msp:
+        kind = entity.dxftype()
+        row = -1
+        try:
+            if kind == "LINE":
+                s, e = entity.dxf.start, entity.dxf.end
+                row = len(lines) // 4
+                lines.extend((s.x, s.y, e.x, e.y))
+            elif kind == "LWPOLYLINE":
+                pts = np.asarray(entity.get_points("xy"), dtype=float).reshape(-1, 2)
+                row = len(closed)
+                vertices.append(pts)
+                offsets.append(offsets[-1] + len(pts))
+                closed.append(bool(entity.closed))
+            elif kind == "CIRCLE":
+                c = entity.dxf.center
+                row = len(circles) // 3
+                circles.extend((c.x, c.y, entity.dxf.radius))
+            elif kind == "ARC":
+                c = entity.dxf.center
+                row = len(arcs) // 5
+                arcs.extend((c.x, c.y, entity.dxf.radius, entity.dxf.start_angle, entity.dxf.end_angle))
+            elif kind in _TEXT_KINDS:
+                p = entity.dxf.insert
+                if kind == "TEXT":
+                    text, height = entity.dxf.text, entity.dxf.height
+                else:
+                    text, height = entity.plain_text(), entity.dxf.char_height
+                row = len(geom.text_strings)
+                geom.text_strings.append(text)
+                text_xy.extend((p.x, p.y))
+                text_hr.extend((height, entity.dxf.get("rotation", 0.0)))
+        except Exception as exc:
+            logger.warning("Error extracting %s: %s", kind, exc)
+            row = -1
+        geom.entity_kinds.append(kind)
+        geom.entity_layers.append(entity.dxf.get("layer", "default"))
+        geom.entity_rows.append(row)
+
+    if lines:
+        geom.lines = np.asarray(lines, dtype=float).reshape(-1, 4)
+    if vertices:
+        geom.poly_vertices = np.concatenate(vertices)
+        geom.poly_offsets = np.asarray(offsets, dtype=np.int64)
+        geom.poly_closed = np.asarray(closed, dtype=bool)
+    if circles:
+        geom.circles = np.asarray(circles, dtype=float).reshape(-1, 3)
+    if arcs:
+        geom.arcs = np.asarray(arcs, dtype=float).reshape(-1, 5)
+    if text_xy:
+        geom.text_xy = np.asarray(text_xy, dtype=float).reshape(-1, 2)
+        geom.text_hr = np.asarray(text_hr, dtype=float).reshape(-1, 2)
+
+    line_points = geom.lines.reshape(-1, 2)
+    geom.line_bounds = _extent(line_points)
+    geom.bounds = _extent(np.concatenate((line_points, geom.poly_vertices)))
+    return geom
+
+
+# ── Per-document cache ────────────────────────────────────────────────────────
+
+_cache: "weakref.WeakKeyDictionary[Any, Tuple[Tuple[int, str], ExtractedGeometry]]" = weakref.WeakKeyDictionary()
+_cache_lock = threading.Lock()
+
+
+def _fingerprint(doc, msp) -> Tuple[int, str]:
+    # The handle seed advances with every entity created, so an add plus a
+    # delete still changes it even though the entity count is unchanged
+    return len(msp), str(doc.entitydb.handles)
+
+
+def get_geometry(doc) -> ExtractedGeometry:
+    """Extracted geometry of ``doc``'s modelspace, built once per document.
+
+    The cached model is rebuilt when entities were added or removed since
+    it was extracted. Editing existing entities in place is not detected —
+    call ``invalidate_geometry`` after doing that.
+    """
+    msp = doc.modelspace()
+    fingerprint = _fingerprint(doc, msp)
+    with _cache_lock:
+        cached = _cache.get(doc)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    geom = extract_geometry(msp)
+    with _cache_lock:
+        _cache[doc] = (fingerprint, geom)
+    return geom
+
+
+def invalidate_geometry(doc) -> None:
+    """Drop the cached geometry of ``doc`` (after it was drawn on or edited)."""
+    with _cache_lock:
+        _cache.pop(doc, None)
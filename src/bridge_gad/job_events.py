@@ -0,0 +1,273 @@
+"""Per-job progress events (in-process pub/sub, optionally fed from Redis).
+
+Publishers — the asyncio job runner in the API, or the ARQ worker via
+Redis — emit one event per pipeline stage; SSE subscribers await the
+next event instead of polling the job store.
+
+Events are plain dicts::
+
+    {"job_id": ..., "status": "running", "progress": 42,
+     "stage": "draw_plan_view", "label": "Plan view drawn", "ms": 3.1}
+
+``publish`` is thread-safe (generation runs in an executor thread) and
+never blocks: each subscriber has a small queue and, when a slow client
+falls behind, the oldest pending event is dropped — every event carries
+the full status, so only the latest one matters.
+
+Worker processes publish to the Redis channel ``bridge_gad:job:<id>``;
+``RedisEventRelay`` in the API process pattern-subscribes to those
+channels and republishes locally.
+
+Usage:
+    bus = get_job_events()
+    bus.publish(job_id, {"status": "running", "progress": 50})
+    async for event in bus.subscribe(job_id):
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+REDIS_CHANNEL_PREFIX = "bridge_gad:job:"
+TERMINAL_STATUSES = ("complete", "failed", "cancelled")
+
+# Human-readable labels for the generator's pipeline stages
+STAGE_LABELS = {
+    "read": "Excel parsed",
+    "setup_document": "Document ready",
+    "serialize": "Drawing saved",
+}
+
+
+def stage_label(stage: str) -> str:
+    if stage in STAGE_LABELS:
+        return STAGE_LABELS[stage]
+    return stage.replace("draw_", "").replace("add_", "").replace("_", " ").capitalize() + " drawn"
+
+
+def progress_reporter(
+    emit: Callable[[Dict[str, Any]], None],
+    stages: Sequence[str],
+    start: int = 10,
+    end: int = 95,
+) -> Callable[[Any], None]:
+    """``StageProfile.on_stage`` callback mapping finished stages onto ``start..end`` %.
+
+    ``emit`` receives one running-status event per completed stage.
+    """
+    total = max(1, len(stages))
+    done = 0
+
+    def on_stage(timing) -> None:
+        nonlocal done
+        done += 1
+        emit({
+            "status": "running",
+            "progress": start + (end - start) * min(done, total) // total,
+            "stage": timing.name,
+            "label": stage_label(timing.name),
+            "ms": timing.wall_ms,
+        })
+
+    return on_stage
+
+
+class JobEventBus:
+    """In-process fan-out of job events to asyncio subscribers."""
+
+    def __init__(self, queue_size: int = 16) -> None:
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._lock = threading.Lock()
+        self.published = 0
+        self.dropped = 0
+
+    def _offer(self, queue: asyncio.Queue, event: Dict[str, Any]) -> None:
+        # Runs on the subscriber's loop
+        if queue.full():
+            queue.get_nowait()
+            self.dropped += 1
+        queue.put_nowait(event)
+
+    def publish(self, job_id: str, event: Dict[str, Any]) -> int:
+        """Deliver ``event`` to every subscriber of ``job_id``; returns their number."""
+        event = {"job_id": job_id, **event}
+        with self._lock:
+            targets = list(self._subscribers.get(job_id, ()))
+        self.published += 1
+        for loop, queue in targets:
+            try:
+                loop.call_soon_threadsafe(self._offer, queue, event)
+            except RuntimeError:  # subscriber's loop already closed
+                pass
+        return len(targets)
+
+    @asynccontextmanager
+    async def listen(self, job_id: str) -> AsyncIterator[asyncio.Queue]:
+        """Register a queue for ``job_id`` events for the duration of the block."""
+        entry = (asyncio.get_running_loop(), asyncio.Queue(self.queue_size))
+        with self._lock:
+            self._subscribers.setdefault(job_id, set()).add(entry)
+        try:
+            yield entry[1]
+        finally:
+            with self._lock:
+                subs = self._subscribers.get(job_id)
+                if subs is not None:
+                    subs.discard(entry)
+                    if not subs:
+                        del self._subscribers[job_id]
+
+    async def subscribe(self, job_id: str, timeout: Optional[float] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Yield events for ``job_id`` until a terminal status (or ``timeout`` idle seconds)."""
+        async with self.listen(job_id) as queue:
+            while True:
+                event = await asyncio.wait_for(queue.get(), timeout)
+                yield event
+                if event.get("status") in TERMINAL_STATUSES:
+                    return
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            watched = len(self._subscribers)
+            subscribers = sum(len(s) for s in self._subscribers.values())
+        return {
+            "watched_jobs": watched,
+            "subscribers": subscribers,
+            "published": self.published,
+            "dropped": self.dropped,
+        }
+
+
+# ── Redis bridge (ARQ worker → API process) ───────────────────────────────────
+
+def redis_channel(job_id: str) -> str:
+    return f"{REDIS_CHANNEL_PREFIX}{job_id}"
+
+
+class RedisEventRelay:
+    """Background task relaying worker events from Redis into a ``JobEventBus``.
+
+    ``on_event(job_id, event)`` (optional, sync or async) runs for every
+    relayed event before it is published locally — the API uses it to
+    update its job store and fetch finished results. It may return a
+    replacement event to publish (e.g. "failed" when the result could not
+    be fetched). Handlers run as separate tasks, so a slow one never holds
+    up events of other jobs. A dropped pubsub connection is re-established
+    with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        bus: JobEventBus,
+        on_event: Optional[Callable[[str, Dict[str, Any]], Any]] = None,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
+    ) -> None:
+        self.bus = bus
+        self.on_event = on_event
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.reconnects = 0
+        self._task: Optional[asyncio.Task] = None
+        self._handlers: Set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, redis) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run(redis))
+
+    async def stop(self) -> None:
+        tasks = [t for t in (self._task, *self._handlers) if t is not None]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._task = None
+        self._handlers.clear()
+
+    async def _run(self, redis) -> None:
+        delay = self.retry_delay
+        while True:
+            try:
+                await self._listen(redis)
+                reason = "subscription closed"
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                reason = f"{type(exc).__name__}: {exc}"
+            else:
+                delay = self.retry_delay  # the connection had been up
+            self.reconnects += 1
+            logger.warning("Job event relay lost Redis (%s) — resubscribing in %.0fs", reason, delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_retry_delay)
+
+    async def _listen(self, redis) -> None:
+        pubsub = redis.pubsub()
+        try:
+            await pubsub.psubscribe(f"{REDIS_CHANNEL_PREFIX}*")
+            logger.info("Relaying job events from Redis")
+            async for message in pubsub.listen():
+                if message.get("type") != "pmessage":
+                    continue
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                job_id = channel[len(REDIS_CHANNEL_PREFIX):]
+                try:
+                    event = json.loads(message["data"])
+                    if not isinstance(event, dict):
+                        raise ValueError(f"expected an object, got {type(event).__name__}")
+                except ValueError as exc:
+                    logger.warning("Dropping malformed job event on %s: %s", channel, exc)
+                    continue
+                self._dispatch(job_id, event)
+        finally:
+            try:
+                await pubsub.close()
+            except Exception as exc:
+                logger.debug("Closing job event pubsub: %s", exc)
+
+    def _dispatch(self, job_id: str, event: Dict[str, Any]) -> None:
+        if self.on_event is None:
+            self.bus.publish(job_id, event)
+            return
+        task = asyncio.create_task(self._handle(job_id, event))
+        self._handlers.add(task)
+        task.add_done_callback(self._handlers.discard)
+
+    async def _handle(self, job_id: str, event: Dict[str, Any]) -> None:
+        try:
+            replacement = self.on_event(job_id, event)
+            if asyncio.iscoroutine(replacement):
+                replacement = await replacement
+            if isinstance(replacement, dict):
+                event = replacement
+        except Exception as exc:
+            logger.error("Job event handler failed for %s: %s", job_id, exc)
+        self.bus.publish(job_id, event)
+
+
+# ── Process-wide instance ─────────────────────────────────────────────────────
+
+_bus = JobEventBus()
+
+
+def get_job_events() -> JobEventBus:
+    """Return the process-wide job event bus."""
+    return _bus
@@ -0,0 +1,644 @@
+"""Job store for the API — job metadata kept separate from result blobs.
+
+Backends:
+  - MemoryJobStore — dict metadata + in-memory blobs; TTL and byte budget
+  - SQLiteJobStore — SQLite metadata table + one blob file per result,
+                     survives restarts
+
+Both evict finished jobs whose last update is older than the TTL, then
+the oldest finished jobs until stored results fit the byte budget;
+queued and running jobs are never evicted, however long they wait.
+Eviction runs when a job is created or a result stored (at most once a
+second unless over budget), so the store never grows without bound.
+
+Several API processes (e.g. uvicorn workers) may share one SQLite store.
+Each holds a lock file for its lifetime; on start-up only the unfinished
+local jobs of processes that no longer hold theirs are marked failed.
+
+Batches (``/jobs/batch``) are small records listing their job ids; one
+is dropped once it is older than the TTL and every job it lists has been
+evicted, so a long batch keeps its record while any job is pending.
+
+Configuration (environment):
+  BRIDGE_GAD_JOB_STORE     memory | sqlite (default memory)
+  BRIDGE_GAD_JOB_TTL       seconds a job is kept after its last update (default 3600)
+  BRIDGE_GAD_JOB_STORE_MB  result byte budget in MB (default 256)
+  BRIDGE_GAD_JOB_DIR       sqlite backend directory (default ./jobs)
+
+Usage:
+    store = get_job_store()
+    store.create(job_id, status="queued", filename="a.xlsx")
+    store.update(job_id, status="running", progress=10)
+    store.set_result(job_id, dxf_bytes, status="complete")
+    store.get(job_id)          # metadata dict (no bytes)
+    store.get_result(job_id)   # bytes
+    store.create_batch(batch_id, [job_id, ...])
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("complete", "failed", "cancelled")
+_EVICT_INTERVAL = 1.0  # seconds between routine eviction passes
+
+
+class JobStore(ABC):
+    """Job metadata + result blob storage with age/size eviction."""
+
+    def __init__(self, ttl: float = 3600.0, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._last_evict = 0.0
+
+    # ── Metadata ──────────────────────────────────────────────────────────────
+
+    @abstractmethod
+    def create(self, job_id: str, **fields: Any) -> Dict[str, Any]:
+        """Register a new job; returns its metadata."""
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Job metadata (never the result bytes), or None if unknown/evicted."""
+
+    @abstractmethod
+    def update(self, job_id: str, **fields: Any) -> Optional[Dict[str, Any]]:
+        """Merge ``fields`` into the job metadata; returns it (None if unknown)."""
+
+    @abstractmethod
+    def delete(self, job_id: str) -> bool:
+        """Remove a job and its result."""
+
+    @abstractmethod
+    def list_jobs(self, limit: int = 100, **match: Any) -> List[Dict[str, Any]]:
+        """Most recent jobs whose metadata matches every ``match`` item."""
+
+    @abstractmethod
+    def count_by_status(self) -> Dict[str, int]:
+        """Number of jobs per status."""
+
+    # ── Batches ───────────────────────────────────────────────────────────────
+
+    @abstractmethod
+    def create_batch(self, batch_id: str, job_ids: List[str], **fields: Any) -> Dict[str, Any]:
+        """Record a batch of jobs."""
+
+    @abstractmethod
+    def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """Batch record (``job_ids`` plus extra fields), or None."""
+
+    @abstractmethod
+    def _expire_batches(self, cutoff: float) -> int:
+        """Drop batches created before ``cutoff`` none of whose jobs remain; returns how many."""
+
+    # ── Results ───────────────────────────────────────────────────────────────
+
+    @abstractmethod
+    def _write_blob(self, job_id: str, data: bytes) -> None:
+        """Store (or replace) the result bytes of a job."""
+
+    @abstractmethod
+    def _delete_blob(self, job_id: str) -> None:
+        """Remove a job's result bytes, if any."""
+
+    @abstractmethod
+    def open_result(self, job_id: str) -> Optional[BinaryIO]:
+        """Binary file object positioned at the start of the result, or None."""
+
+    def set_result(self, job_id: str, data: bytes, **fields: Any) -> Optional[Dict[str, Any]]:
+        """Store the result blob and merge ``fields`` (e.g. status) into metadata."""
+        if self.get(job_id) is None:
+            return None
+        self._write_blob(job_id, data)
+        meta = self.update(
+            job_id,
+            result_size=len(data),
+            result_sha256=hashlib.sha256(data).hexdigest(),
+            **fields,
+        )
+        self.evict()
+        return meta
+
+    def get_result(self, job_id: str) -> Optional[bytes]:
+        fh = self.open_result(job_id)
+        if fh is None:
+            return None
+        with fh:
+            return fh.read()
+
+    # ── Eviction / stats ──────────────────────────────────────────────────────
+
+    @abstractmethod
+    def _expire_jobs(self, cutoff: float) -> int:
+        """Delete finished jobs last updated before ``cutoff``; returns how many."""
+
+    @abstractmethod
+    def _evict_oldest_results(self, excess: int) -> int:
+        """Delete the oldest finished jobs with results until ``excess`` bytes are freed."""
+
+    def evict(self, force: bool = False) -> int:
+        """Drop expired finished jobs, then the oldest finished results over the byte budget.
+
+        Routine passes (job created, result stored) run at most once per
+        ``_EVICT_INTERVAL`` unless the store is over budget; ``force``
+        runs one regardless.
+        """
+        now = time.time()
+        stored = self.stored_bytes()
+        if not force and now - self._last_evict < _EVICT_INTERVAL and stored <= self.max_bytes:
+            return 0
+        self._last_evict = now
+        removed = 0
+        if self.ttl > 0:
+            removed = self._expire_jobs(now - self.ttl)
+            if removed:
+                stored = self.stored_bytes()
+            self._expire_batches(now - self.ttl)
+        if stored > self.max_bytes:
+            removed += self._evict_oldest_results(stored - self.max_bytes)
+        if removed:
+            self.evictions += removed
+            logger.info("Job store evicted %d job(s)", removed)
+        return removed
+
+    @abstractmethod
+    def stored_bytes(self) -> int:
+        """Total size of stored results."""
+
+    def stats(self) -> Dict[str, Any]:
+        by_status = self.count_by_status()
+        return {
+            "backend": type(self).__name__,
+            "total_jobs": sum(by_status.values()),
+            "by_status": by_status,
+            "result_bytes": self.stored_bytes(),
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl,
+            "evictions": self.evictions,
+        }
+
+
+def _matches(meta: Dict[str, Any], match: Dict[str, Any]) -> bool:
+    return all(meta.get(k) == v for k, v in match.items())
+
+
+# ── In-memory backend ─────────────────────────────────────────────────────────
+
+class MemoryJobStore(JobStore):
+    """Process-local store; lost on restart."""
+
+    def __init__(self, ttl: float = 3600.0, max_bytes: int = 256 * 1024 * 1024) -> None:
+        super().__init__(ttl, max_bytes)
+        self._meta: Dict[str, Dict[str, Any]] = {}
+        self._blobs: Dict[str, bytes] = {}
+        self._batches: Dict[str, Dict[str, Any]] = {}
+        self._status_counts: Dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+    def _count(self, status: Optional[str], delta: int) -> None:
+        if status is None:
+            return
+        n = self._status_counts.get(status, 0) + delta
+        if n:
+            self._status_counts[status] = n
+        else:
+            self._status_counts.pop(status, None)
+
+    def create(self, job_id: str, **fields: Any) -> Dict[str, Any]:
+        now = time.time()
+        meta = {"job_id": job_id, "status": "queued", "progress": 0, "error": None,
+                "created_at": now, "updated_at": now, **fields}
+        with self._lock:
+            self._meta[job_id] = meta
+            self._count(meta["status"], 1)
+        self.evict()
+        return dict(meta)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            meta = self._meta.get(job_id)
+            return dict(meta) if meta is not None else None
+
+    def update(self, job_id: str, **fields: Any) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            meta = self._meta.get(job_id)
+            if meta is None:
+                return None
+            if "status" in fields and fields["status"] != meta.get("status"):
+                self._count(meta.get("status"), -1)
+                self._count(fields["status"], 1)
+            meta.update(fields)
+            meta["updated_at"] = time.time()
+            return dict(meta)
+
+    def delete(self, job_id: str) -> bool:
+        with self._lock:
+            meta = self._meta.pop(job_id, None)
+            if meta is None:
+                return False
+            self._count(meta.get("status"), -1)
+            self._delete_blob(job_id)
+            return True
+
+    def list_jobs(self, limit: int = 100, **match: Any) -> List[Dict[str, Any]]:
+        with self._lock:
+            jobs = [dict(m) for m in self._meta.values() if _matches(m, match)]
+        jobs.sort(key=lambda m: m.get("created_at", 0), reverse=True)
+        return jobs[:limit]
+
+    def count_by_status(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._status_counts)
+
+    def create_batch(self, batch_id: str, job_ids: List[str], **fields: Any) -> Dict[str, Any]:
+        batch = {"batch_id": batch_id, "job_ids": list(job_ids), "created_at": time.time(), **fields}
+        with self._lock:
+            self._batches[batch_id] = batch
+        return dict(batch)
+
+    def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            batch = self._batches.get(batch_id)
+            return dict(batch) if batch is not None else None
+
+    def _expire_batches(self, cutoff: float) -> int:
+        with self._lock:
+            expired = [
+                batch_id for batch_id, batch in self._batches.items()
+                if batch["created_at"] < cutoff and not any(j in self._meta for j in batch["job_ids"])
+            ]
+            for batch_id in expired:
+                del self._batches[batch_id]
+        return len(expired)
+
+    def _write_blob(self, job_id: str, data: bytes) -> None:
+        with self._lock:
+            self._delete_blob(job_id)
+            self._blobs[job_id] = data
+            self._bytes += len(data)
+
+    def _delete_blob(self, job_id: str) -> None:
+        with self._lock:
+            old = self._blobs.pop(job_id, None)
+            if old is not None:
+                self._bytes -= len(old)
+
+    def open_result(self, job_id: str) -> Optional[BinaryIO]:
+        with self._lock:
+            data = self._blobs.get(job_id)
+        return io.BytesIO(data) if data is not None else None
+
+    def _expire_jobs(self, cutoff: float) -> int:
+        with self._lock:
+            expired = [
+                job_id for job_id, meta in self._meta.items()
+                if meta.get("status") in TERMINAL_STATUSES and meta["updated_at"] < cutoff
+            ]
+            for job_id in expired:
+                self.delete(job_id)
+        return len(expired)
+
+    def _evict_oldest_results(self, excess: int) -> int:
+        removed = 0
+        with self._lock:
+            finished = sorted(
+                (meta["updated_at"], job_id) for job_id, meta in self._meta.items()
+                if job_id in self._blobs and meta.get("status") in TERMINAL_STATUSES
+            )
+            for _, job_id in finished:
+                if excess <= 0:
+                    break
+                excess -= len(self._blobs[job_id])
+                self.delete(job_id)
+                removed += 1
+        return removed
+
+    def stored_bytes(self) -> int:
+        return self._bytes
+
+
+# ── SQLite + blob directory backend ───────────────────────────────────────────
+
+def _try_lock(fh) -> bool:
+    """Take an exclusive, non-blocking lock on an open file (released when the process exits)."""
+    try:
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+_TERMINAL_SQL = "status IN (%s)" % ", ".join(f"'{s}'" for s in TERMINAL_STATUSES)
+
+
+class SQLiteJobStore(JobStore):
+    """Metadata in SQLite, each result in ``<dir>/blobs/<job_id>.bin``; survives restarts."""
+
+    _COLUMNS = ("job_id", "status", "progress", "error", "created_at", "updated_at", "result_size")
+    _SELECT = f"SELECT {', '.join(_COLUMNS)}, extra FROM jobs"
+
+    def __init__(self, directory: Path, ttl: float = 3600.0, max_bytes: int = 256 * 1024 * 1024) -> None:
+        super().__init__(ttl, max_bytes)
+        self.directory = Path(directory)
+        self.blob_dir = self.directory / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(str(self.directory / "jobs.sqlite3"), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS jobs (
+                   job_id      TEXT PRIMARY KEY,
+                   status      TEXT NOT NULL,
+                   progress    INTEGER NOT NULL DEFAULT 0,
+                   error       TEXT,
+                   created_at  REAL NOT NULL,
+                   updated_at  REAL NOT NULL,
+                   result_size INTEGER,
+                   extra       TEXT NOT NULL DEFAULT '{}'
+               )"""
+        )
+        if "owner" not in {row[1] for row in self._db.execute("PRAGMA table_info(jobs)")}:
+            self._db.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")  # API process that created the job
+        self._db.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs(status)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS jobs_updated ON jobs(updated_at)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS jobs_status_updated ON jobs(status, updated_at)")
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS batches (
+                   batch_id   TEXT PRIMARY KEY,
+                   created_at REAL NOT NULL,
+                   job_ids    TEXT NOT NULL,
+                   extra      TEXT NOT NULL DEFAULT '{}'
+               )"""
+        )
+        self._db.commit()
+        self.owner = uuid.uuid4().hex
+        self._owner_dir = self.directory / "owners"
+        self._owner_dir.mkdir(exist_ok=True)
+        self._owner_lock = open(self._owner_dir / f"{self.owner}.lock", "wb")
+        if not _try_lock(self._owner_lock):
+            logger.warning("Could not lock job store owner file; restarts may fail this process's jobs")
+        self._fail_interrupted()
+
+    def _live_owners(self) -> Set[str]:
+        """Owners whose API process still holds its lock file; stale files are removed."""
+        live = {self.owner}
+        for path in self._owner_dir.glob("*.lock"):
+            if path.stem == self.owner:
+                continue
+            with open(path, "ab") as fh:
+                alive = not _try_lock(fh)
+            if alive:
+                live.add(path.stem)
+            else:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+        return live
+
+    def _fail_interrupted(self) -> None:
+        """Local jobs of an API process that has exited cannot finish any more.
+
+        Jobs of live processes sharing the database (other uvicorn
+        workers) and ARQ jobs are left alone.
+        """
+        live = self._live_owners()
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT job_id, owner, extra FROM jobs WHERE status IN ('queued', 'running')"
+            ).fetchall()
+        for job_id, owner, extra in rows:
+            if owner in live or json.loads(extra or "{}").get("backend") == "arq":
+                continue
+            self.update(job_id, status="failed", error="Interrupted by server restart")
+
+    def _row_to_meta(self, row) -> Dict[str, Any]:
+        meta = dict(zip(self._COLUMNS, row[:-1]))
+        meta.update(json.loads(row[-1] or "{}"))
+        return meta
+
+    def _split(self, meta: Dict[str, Any]):
+        cols = [meta.get(c) for c in self._COLUMNS]
+        extra = {k: v for k, v in meta.items() if k not in self._COLUMNS}
+        return cols, json.dumps(extra, default=str)
+
+    def create(self, job_id: str, **fields: Any) -> Dict[str, Any]:
+        now = time.time()
+        meta = {"job_id": job_id, "status": "queued", "progress": 0, "error": None,
+                "created_at": now, "updated_at": now, "result_size": None, **fields}
+        cols, extra = self._split(meta)
+        with self._lock:
+            self._db.execute(
+                f"INSERT OR REPLACE INTO jobs ({', '.join(self._COLUMNS)}, extra, owner) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (*cols, extra, self.owner),
+            )
+            self._db.commit()
+        self.evict()
+        return meta
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db.execute(f"{self._SELECT} WHERE job_id = ?", (job_id,)).fetchone()
+        return self._row_to_meta(row) if row else None
+
+    def update(self, job_id: str, **fields: Any) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            meta = self.get(job_id)
+            if meta is None:
+                return None
+            meta.update(fields)
+            meta["updated_at"] = time.time()
+            cols, extra = self._split(meta)
+            self._db.execute(
+                "UPDATE jobs SET status=?, progress=?, error=?, created_at=?, updated_at=?, "
+                "result_size=?, extra=? WHERE job_id=?",
+                (*cols[1:], extra, job_id),
+            )
+            self._db.commit()
+            return meta
+
+    def delete(self, job_id: str) -> bool:
+        with self._lock:
+            cur = self._db.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+            self._db.commit()
+        self._delete_blob(job_id)
+        return cur.rowcount > 0
+
+    def list_jobs(self, limit: int = 100, **match: Any) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._db.execute(f"{self._SELECT} ORDER BY created_at DESC").fetchall()
+        jobs = (self._row_to_meta(r) for r in rows)
+        out = []
+        for meta in jobs:
+            if _matches(meta, match):
+                out.append(meta)
+                if len(out) >= limit:
+                    break
+        return out
+
+    def count_by_status(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: n for status, n in rows}
+
+    def create_batch(self, batch_id: str, job_ids: List[str], **fields: Any) -> Dict[str, Any]:
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO batches VALUES (?, ?, ?, ?)",
+                (batch_id, now, json.dumps(list(job_ids)), json.dumps(fields, default=str)),
+            )
+            self._db.commit()
+        return {"batch_id": batch_id, "job_ids": list(job_ids), "created_at": now, **fields}
+
+    def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db.execute("SELECT * FROM batches WHERE batch_id = ?", (batch_id,)).fetchone()
+        if row is None:
+            return None
+        return {"batch_id": row[0], "created_at": row[1], "job_ids": json.loads(row[2]), **json.loads(row[3])}
+
+    def _expire_batches(self, cutoff: float) -> int:
+        with self._write_transaction():
+            rows = self._db.execute(
+                "SELECT batch_id, job_ids FROM batches WHERE created_at < ?", (cutoff,)
+            ).fetchall()
+            expired = [batch_id for batch_id, job_ids in rows if not self._any_job_exists(json.loads(job_ids))]
+            for batch_id in expired:
+                self._db.execute("DELETE FROM batches WHERE batch_id = ?", (batch_id,))
+        return len(expired)
+
+    def _any_job_exists(self, job_ids: List[str]) -> bool:
+        for i in range(0, len(job_ids), 500):
+            chunk = job_ids[i:i + 500]
+            if self._db.execute(
+                f"SELECT 1 FROM jobs WHERE job_id IN ({', '.join('?' * len(chunk))}) LIMIT 1", chunk
+            ).fetchone():
+                return True
+        return False
+
+    def _blob_path(self, job_id: str) -> Path:
+        return self.blob_dir / f"{Path(job_id).name}.bin"
+
+    def _write_blob(self, job_id: str, data: bytes) -> None:
+        path = self._blob_path(job_id)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def _delete_blob(self, job_id: str) -> None:
+        try:
+            self._blob_path(job_id).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning("Could not delete job blob %s: %s", job_id, exc)
+
+    def result_path(self, job_id: str) -> Optional[Path]:
+        path = self._blob_path(job_id)
+        return path if path.exists() else None
+
+    def open_result(self, job_id: str) -> Optional[BinaryIO]:
+        try:
+            return open(self._blob_path(job_id), "rb")
+        except OSError:
+            return None
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[None]:
+        """Select-then-delete without another process updating rows in between."""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._db.rollback()
+                raise
+            self._db.commit()
+
+    def _delete_rows(self, job_ids: List[str]) -> None:
+        for i in range(0, len(job_ids), 500):
+            chunk = job_ids[i:i + 500]
+            self._db.execute(f"DELETE FROM jobs WHERE job_id IN ({', '.join('?' * len(chunk))})", chunk)
+
+    def _expire_jobs(self, cutoff: float) -> int:
+        with self._write_transaction():
+            job_ids = [row[0] for row in self._db.execute(
+                f"SELECT job_id FROM jobs WHERE {_TERMINAL_SQL} AND updated_at < ?", (cutoff,)
+            )]
+            self._delete_rows(job_ids)
+        for job_id in job_ids:
+            self._delete_blob(job_id)
+        return len(job_ids)
+
+    def _evict_oldest_results(self, excess: int) -> int:
+        job_ids: List[str] = []
+        with self._write_transaction():
+            # Rows are stepped lazily: only as many are read as need deleting
+            cur = self._db.execute(
+                f"SELECT job_id, result_size FROM jobs WHERE {_TERMINAL_SQL} AND result_size > 0 "
+                "ORDER BY updated_at"
+            )
+            for job_id, size in cur:
+                if excess <= 0:
+                    break
+                job_ids.append(job_id)
+                excess -= size
+            cur.close()
+            self._delete_rows(job_ids)
+        for job_id in job_ids:
+            self._delete_blob(job_id)
+        return len(job_ids)
+
+    def stored_bytes(self) -> int:
+        with self._lock:
+            row = self._db.execute("SELECT COALESCE(SUM(result_size), 0) FROM jobs").fetchone()
+        return int(row[0])
+
+
+# ── Process-wide instance ─────────────────────────────────────────────────────
+
+_store: Optional[JobStore] = None
+_store_lock = threading.Lock()
+
+
+def get_job_store() -> JobStore:
+    """Return the process-wide job store, configured from the environment."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                backend = os.environ.get("BRIDGE_GAD_JOB_STORE", "memory").lower()
+                ttl = float(os.environ.get("BRIDGE_GAD_JOB_TTL", "3600"))
+                max_bytes = int(float(os.environ.get("BRIDGE_GAD_JOB_STORE_MB", "256")) * 1024 * 1024)
+                if backend == "sqlite":
+                    directory = Path(os.environ.get("BRIDGE_GAD_JOB_DIR", "jobs"))
+                    _store = SQLiteJobStore(directory, ttl=ttl, max_bytes=max_bytes)
+                else:
+                    if backend != "memory":
+                        logger.warning("Unknown BRIDGE_GAD_JOB_STORE %r — using memory", backend)
+                    _store = MemoryJobStore(ttl=ttl, max_bytes=max_bytes)
+                logger.info("Job store: %s", type(_store).__name__)
+    return _store
@@ -1,8 +1,10 @@
-import pandas as pd
 import ezdxf
 from pathlib import Path
 from typing import Dict, Any
 
+from .excel_reader import read_rows
+from .parse_cache import get_parse_cache
+
 def read_lisp_sheet(xlsx_path: Path) -> dict:
     """Read Lisp parameters from Excel, handling units in cells.
     
@@ -12,17 +14,20 @@ def read_lisp_sheet(xlsx_path: Path) -> dict:
     Returns:
         dict: {parameter_name: float_value}
     """
-    df = pd.read_excel(xlsx_path, header=0, engine='openpyxl')
+    return get_parse_cache().get_or_parse(xlsx_path, "lisp", _parse_lisp_sheet)
+
+def _parse_lisp_sheet(xlsx_path) -> dict:
+    rows = read_rows(xlsx_path)[1:]  # first row is the header
     out = {}
-    for _, row in df.iterrows():
-        if len(row) >= 2:  # Ensure we have at least 2 columns
-            key = str(row.iloc[0]).strip()
+    for row in rows:
+        if len(row) >= 2 and row[0] is not None:  # Ensure we have at least 2 columns
+            key = str(row[0]).strip()
             # Extract numeric part from value (handles "10.8 m" -> 10.8)
-            val_str = str(row.iloc[1]).split()[0]  # Get first part before space
+            val_str = str(row[1]).split()[0] if row[1] is not None else ""  # Get first part before space
             try:
                 out[key] = float(val_str)
             except (ValueError, IndexError):
-                print(f"Warning: Could not convert value '{row.iloc[1]}' to float for parameter '{key}'")
+                print(f"Warning: Could not convert value '{row[1]}' to float for parameter '{key}'")
     return out
 
 def draw_lisp_bridge(xlsx_path: Path, out_dxf: Path) -> Path:
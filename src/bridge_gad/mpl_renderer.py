@@ -0,0 +1,158 @@
+"""Batched matplotlib renderer for DXF modelspace content.
+
+The exporters used to add one ``ax.plot`` line per LINE, one patch per
+polyline and one ``ax.text`` per label, so a long bridge produced
+thousands of artists. Here the extracted geometry (numpy buffers, see
+``geometry_model``) is drawn with a handful of collections:
+
+  - LINE segments                 → one LineCollection from an (N, 2, 2) array
+  - open polylines + arcs         → one LineCollection
+  - closed polylines + circles    → one PolyCollection (outline only)
+  - TEXT / MTEXT                  → one PathCollection of glyph outlines,
+                                    sized by the entity's text height
+
+Glyph outlines suit raster output. PDF and SVG want real text artists
+(``text_artists=True``) saved with ``VECTOR_TEXT_RC`` so that labels stay
+selectable and searchable. Text is never clipped to the axes, and
+``text_bounds`` gives the glyph extents for sizing the plot limits.
+
+Usage:
+    geometry = get_geometry(doc)
+    draw_geometry(ax, geometry, linewidth=1.0)
+    limits = union_bounds(geometry.line_bounds, text_bounds(geometry))
+"""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+import numpy as np
+from matplotlib.collections import LineCollection, PathCollection, PolyCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.path import Path as MplPath
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D
+
+from .geometry_model import Bounds, ExtractedGeometry
+
+logger = logging.getLogger(__name__)
+
+_ARC_SEGMENTS = 50
+_CIRCLE_SEGMENTS = 64
+# Text artists keep the exporters' previous ax.text size
+TEXT_FONTSIZE = 8
+# Write text as text (not glyph paths) in vector output
+VECTOR_TEXT_RC = {"svg.fonttype": "none", "pdf.fonttype": 42}
+
+
+def _arc_points(arcs: np.ndarray) -> np.ndarray:
+    """Sample every ARC row (cx, cy, r, start, end) → (A, _ARC_SEGMENTS, 2)."""
+    start = arcs[:, 3]
+    end = np.where(arcs[:, 4] < start, arcs[:, 4] + 360.0, arcs[:, 4])
+    t = np.linspace(0.0, 1.0, _ARC_SEGMENTS)
+    angles = np.radians(start[:, None] + (end - start)[:, None] * t[None, :])
+    return np.stack(
+        (arcs[:, 0:1] + arcs[:, 2:3] * np.cos(angles), arcs[:, 1:2] + arcs[:, 2:3] * np.sin(angles)),
+        axis=-1,
+    )
+
+
+def _circle_points(circles: np.ndarray) -> np.ndarray:
+    """Sample every CIRCLE row (cx, cy, r) → (C, _CIRCLE_SEGMENTS, 2)."""
+    theta = np.linspace(0.0, 2 * np.pi, _CIRCLE_SEGMENTS, endpoint=False)
+    unit = np.column_stack((np.cos(theta), np.sin(theta)))
+    return circles[:, None, :2] + circles[:, None, 2:3] * unit[None, :, :]
+
+
+_FONT = FontProperties(family="DejaVu Sans")
+
+
+@lru_cache(maxsize=4096)
+def _unit_text_path(text: str) -> Optional[MplPath]:
+    """Glyph outline of ``text`` at unit height (cached per string)."""
+    try:
+        return TextPath((0, 0), text, size=1.0, prop=_FONT)
+    except Exception:
+        return None
+
+
+def _text_paths(geom: ExtractedGeometry) -> List[MplPath]:
+    paths = []
+    for text, x, y, height, rotation in geom.texts():
+        if not text or not text.strip() or not height or height <= 0:
+            continue
+        unit = _unit_text_path(text)
+        if unit is None:
+            continue
+        transform = Affine2D().scale(height).rotate_deg(rotation or 0.0).translate(x, y)
+        paths.append(unit.transformed(transform))
+    return paths
+
+
+def text_bounds(geom: ExtractedGeometry) -> Optional[Bounds]:
+    """Extents of every TEXT/MTEXT glyph outline, or None without text."""
+    paths = _text_paths(geom)
+    if not paths:
+        return None
+    vertices = np.concatenate([path.vertices for path in paths])
+    lo = vertices.min(axis=0)
+    hi = vertices.max(axis=0)
+    return float(lo[0]), float(lo[1]), float(hi[0]), float(hi[1])
+
+
+def union_bounds(*bounds: Optional[Bounds]) -> Optional[Bounds]:
+    """Smallest bounds covering every non-None argument."""
+    present: Sequence[Bounds] = [b for b in bounds if b is not None]
+    if not present:
+        return None
+    return (min(b[0] for b in present), min(b[1] for b in present),
+            max(b[2] for b in present), max(b[3] for b in present))
+
+
+def draw_geometry(ax, geom: ExtractedGeometry, linewidth: float = 1.0, color: str = "black",
+                  text_artists: bool = False) -> list:
+    """Add ``geom`` to ``ax`` as a few collections; returns the artists.
+
+    With ``text_artists`` each TEXT/MTEXT becomes an ``ax.text`` artist
+    (selectable in PDF/SVG) instead of part of the glyph-outline collection.
+    """
+    artists = []
+
+    if len(geom.lines):
+        artists.append(LineCollection(geom.lines.reshape(-1, 2, 2), colors=color, linewidths=linewidth))
+
+    polylines = geom.polylines()
+    closed_flags = geom.poly_closed.tolist()
+    open_paths: list = [p for p, c in zip(polylines, closed_flags) if len(p) > 1 and not (c and len(p) > 2)]
+    if len(geom.arcs):
+        open_paths.extend(_arc_points(geom.arcs))
+    if open_paths:
+        artists.append(LineCollection(open_paths, colors=color, linewidths=linewidth))
+
+    closed_paths: list = [p for p, c in zip(polylines, closed_flags) if c and len(p) > 2]
+    if len(geom.circles):
+        closed_paths.extend(_circle_points(geom.circles))
+    if closed_paths:
+        artists.append(PolyCollection(closed_paths, facecolors="none", edgecolors=color,
+                                      linewidths=linewidth))
+
+    if not text_artists:
+        text_paths = _text_paths(geom)
+        if text_paths:
+            # Labels such as the title block sit outside the LINE extents
+            text_collection = PathCollection(text_paths, facecolors=color, edgecolors="none",
+                                             linewidths=0)
+            text_collection.set_clip_on(False)
+            artists.append(text_collection)
+
+    for artist in artists:
+        ax.add_collection(artist, autolim=False)
+
+    if text_artists:
+        for text, x, y, _height, rotation in geom.texts():
+            if text and text.strip():
+                artists.append(ax.text(x, y, text, fontsize=TEXT_FONTSIZE, rotation=rotation or 0.0,
+                                       ha="left", va="bottom", color=color, clip_on=False))
+    return artists
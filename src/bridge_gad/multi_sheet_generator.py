@@ -8,12 +8,14 @@ Generates 4 separate A4 landscape sheets with detailed views:
 All with borders, labels, dimensions, and RKS LEGAL title block
 """
 
-import ezdxf
 from ezdxf.math import Vec2, Vec3
+from ezdxf.document import Drawing
 from pathlib import Path
 from typing import Dict, Tuple
 import math
 
+from .doc_factory import new_sheet_document
+
 
 class DetailedSheetGenerator:
     """Generates detailed A4 landscape sheets with professional formatting"""
@@ -30,8 +32,8 @@ class DetailedSheetGenerator:
         self.sheets = []
     
     def _create_sheet(self, sheet_title: str):
-        """Create new sheet document"""
-        doc = ezdxf.new(self.acad_version)
+        """Create new sheet document (copied from the per-process prototype)"""
+        doc = new_sheet_document(self.acad_version)
         msp = doc.modelspace()
         return doc, msp
     
@@ -123,7 +125,7 @@ class DetailedSheetGenerator:
             # Label text
             msp.add_text(label, dxfattribs={'height': 2}).set_placement((x - 3, y + 2))
     
-    def generate_pier_elevation(self, variables: Dict) -> ezdxf.Drawing:
+    def generate_pier_elevation(self, variables: Dict) -> Drawing:
         """Generate detailed pier elevation sheet"""
         doc, msp = self._create_sheet("PIER ELEVATION")
         self._draw_border(msp, 1)
@@ -195,7 +197,7 @@ class DetailedSheetGenerator:
         
         return doc
     
-    def generate_abutment_elevation(self, variables: Dict) -> ezdxf.Drawing:
+    def generate_abutment_elevation(self, variables: Dict) -> Drawing:
         """Generate detailed abutment elevation sheet"""
         doc, msp = self._create_sheet("ABUTMENT ELEVATION")
         self._draw_border(msp, 2)
@@ -257,7 +259,7 @@ class DetailedSheetGenerator:
         
         return doc
     
-    def generate_plan_view(self, variables: Dict) -> ezdxf.Drawing:
+    def generate_plan_view(self, variables: Dict) -> Drawing:
         """Generate plan view (top view) sheet"""
         doc, msp = self._create_sheet("PLAN VIEW")
         self._draw_border(msp, 3)
@@ -325,7 +327,7 @@ class DetailedSheetGenerator:
         
         return doc
     
-    def generate_section_view(self, variables: Dict) -> ezdxf.Drawing:
+    def generate_section_view(self, variables: Dict) -> Drawing:
         """Generate section/profile view sheet"""
         doc, msp = self._create_sheet("SECTION VIEW")
         self._draw_border(msp, 4)
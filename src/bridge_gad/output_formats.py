@@ -12,14 +12,16 @@ import logging
 import ezdxf
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-from matplotlib.patches import Polygon, Rectangle
-import numpy as np
+from matplotlib.patches import Rectangle
 from reportlab.pdfgen import canvas as pdf_canvas
 from reportlab.lib.pagesizes import A3, A4, letter
 from reportlab.lib import colors
 from reportlab.lib.units import mm
 import io
 
+from .geometry_model import ExtractedGeometry, get_geometry
+from .mpl_renderer import VECTOR_TEXT_RC, draw_geometry, text_bounds, union_bounds
+
 logger = logging.getLogger(__name__)
 
 class MultiFormatExporter:
@@ -31,6 +33,11 @@ class MultiFormatExporter:
         self.msp = bridge_generator.msp
         self.variables = bridge_generator.variables
         
+    @property
+    def geometry(self) -> ExtractedGeometry:
+        """Modelspace geometry, extracted once per document."""
+        return get_geometry(self.doc)
+        
     def export(self, output_path: Path, format_type: str = "auto") -> Path:
         """Export to specified format."""
         if format_type == "auto":
@@ -84,8 +91,8 @@ class MultiFormatExporter:
     
     def _export_pdf(self, output_path: Path) -> Path:
         """Export as PDF using matplotlib."""
-        # Extract drawing elements from DXF
-        elements = self._extract_drawing_elements()
+        # Drawing geometry from DXF as batched arrays (shared across formats)
+        geometry = self.geometry
         
         # Create PDF using matplotlib
         fig, ax = plt.subplots(1, 1, figsize=(16, 12))
@@ -96,17 +103,18 @@ class MultiFormatExporter:
         ax.set_title('Bridge General Arrangement Drawing', fontsize=16, fontweight='bold')
         
         # Draw all elements
-        self._draw_elements_matplotlib(ax, elements)
+        draw_geometry(ax, geometry, linewidth=1, text_artists=True)
         
         # Set appropriate limits
-        self._set_plot_limits(ax, elements)
+        self._set_plot_limits(ax, geometry)
         
         # Add labels and annotations
         self._add_annotations_matplotlib(ax)
         
         # Save as PDF
         plt.tight_layout()
-        plt.savefig(output_path, format='pdf', dpi=300, bbox_inches='tight')
+        with plt.rc_context(VECTOR_TEXT_RC):
+            plt.savefig(output_path, format='pdf', dpi=300, bbox_inches='tight')
         plt.close()
         
         logger.info(f"PDF file exported to: {output_path}")
@@ -114,18 +122,19 @@ class MultiFormatExporter:
     
     def _export_svg(self, output_path: Path) -> Path:
         """Export as SVG using matplotlib."""
-        elements = self._extract_drawing_elements()
+        geometry = self.geometry
         
         fig, ax = plt.subplots(1, 1, figsize=(16, 12))
         ax.set_aspect('equal')
         
         # Draw elements
-        self._draw_elements_matplotlib(ax, elements)
-        self._set_plot_limits(ax, elements)
+        draw_geometry(ax, geometry, linewidth=1, text_artists=True)
+        self._set_plot_limits(ax, geometry)
         self._add_annotations_matplotlib(ax)
         
         # Save as SVG
-        plt.savefig(output_path, format='svg', bbox_inches='tight')
+        with plt.rc_context(VECTOR_TEXT_RC):
+            plt.savefig(output_path, format='svg', bbox_inches='tight')
         plt.close()
         
         logger.info(f"SVG file exported to: {output_path}")
@@ -133,7 +142,7 @@ class MultiFormatExporter:
     
     def _export_image(self, output_path: Path, format_type: str) -> Path:
         """Export as PNG/JPG using matplotlib."""
-        elements = self._extract_drawing_elements()
+        geometry = self.geometry
         
         fig, ax = plt.subplots(1, 1, figsize=(16, 12))
         ax.set_aspect('equal')
@@ -144,8 +153,8 @@ class MultiFormatExporter:
             ax.set_facecolor('white')
         
         # Draw elements
-        self._draw_elements_matplotlib(ax, elements)
-        self._set_plot_limits(ax, elements)
+        draw_geometry(ax, geometry, linewidth=1)
+        self._set_plot_limits(ax, geometry)
         self._add_annotations_matplotlib(ax)
         
         # Save as image
@@ -170,127 +179,19 @@ class MultiFormatExporter:
         return output_path
     
     def _extract_drawing_elements(self) -> Dict[str, List]:
-        """Extract drawing elements from DXF document."""
-        elements = {
-            'lines': [],
-            'rectangles': [],
-            'polylines': [],
-            'texts': [],
-            'dimensions': [],
-            'arcs': [],
-            'circles': []
-        }
-        
-        try:
-            # Iterate through all entities in modelspace
-            for entity in self.msp:
-                if entity.dxftype() == 'LINE':
-                    start = (entity.dxf.start.x, entity.dxf.start.y)
-                    end = (entity.dxf.end.x, entity.dxf.end.y)
-                    elements['lines'].append({'start': start, 'end': end})
-                    
-                elif entity.dxftype() == 'LWPOLYLINE':
-                    points = [(p[0], p[1]) for p in entity.get_points()]
-                    elements['polylines'].append({
-                        'points': points, 
-                        'closed': entity.closed
-                    })
-                    
-                elif entity.dxftype() == 'TEXT':
-                    elements['texts'].append({
-                        'text': entity.dxf.text,
-                        'position': (entity.dxf.insert.x, entity.dxf.insert.y),
-                        'height': entity.dxf.height,
-                        'rotation': getattr(entity.dxf, 'rotation', 0)
-                    })
-                    
-                elif entity.dxftype() == 'MTEXT':
-                    elements['texts'].append({
-                        'text': entity.text,
-                        'position': (entity.dxf.insert.x, entity.dxf.insert.y),
-                        'height': entity.dxf.char_height,
-                        'rotation': getattr(entity.dxf, 'rotation', 0)
-                    })
-                    
-                elif entity.dxftype() == 'CIRCLE':
-                    elements['circles'].append({
-                        'center': (entity.dxf.center.x, entity.dxf.center.y),
-                        'radius': entity.dxf.radius
-                    })
-                    
-                elif entity.dxftype() == 'ARC':
-                    elements['arcs'].append({
-                        'center': (entity.dxf.center.x, entity.dxf.center.y),
-                        'radius': entity.dxf.radius,
-                        'start_angle': entity.dxf.start_angle,
-                        'end_angle': entity.dxf.end_angle
-                    })
-                    
-        except Exception as e:
-            logger.warning(f"Error extracting elements: {e}")
-        
-        return elements
-    
-    def _draw_elements_matplotlib(self, ax, elements):
-        """Draw elements using matplotlib."""
-        # Draw lines
-        for line in elements['lines']:
-            x_data = [line['start'][0], line['end'][0]]
-            y_data = [line['start'][1], line['end'][1]]
-            ax.plot(x_data, y_data, 'k-', linewidth=1)
-        
-        # Draw polylines
-        for polyline in elements['polylines']:
-            if len(polyline['points']) > 1:
-                points = np.array(polyline['points'])
-                if polyline['closed'] and len(points) > 2:
-                    # Create closed polygon
-                    poly = Polygon(points, fill=False, edgecolor='black', linewidth=1)
-                    ax.add_patch(poly)
-                else:
-                    # Draw as line
-                    ax.plot(points[:, 0], points[:, 1], 'k-', linewidth=1)
-        
-        # Draw circles
-        for circle in elements['circles']:
-            circle_patch = plt.Circle(circle['center'], circle['radius'], 
-                                    fill=False, edgecolor='black', linewidth=1)
-            ax.add_patch(circle_patch)
-        
-        # Draw arcs
-        for arc in elements['arcs']:
-            # Approximate arc with line segments
-            angles = np.linspace(np.radians(arc['start_angle']), 
-                               np.radians(arc['end_angle']), 50)
-            x = arc['center'][0] + arc['radius'] * np.cos(angles)
-            y = arc['center'][1] + arc['radius'] * np.sin(angles)
-            ax.plot(x, y, 'k-', linewidth=1)
-        
-        # Draw texts
-        for text in elements['texts']:
-            ax.text(text['position'][0], text['position'][1], text['text'],
-                   fontsize=8, rotation=text['rotation'], ha='left', va='bottom')
+        """Drawing elements as plain dicts (for the HTML canvas)."""
+        return self.geometry.to_element_dict()
     
-    def _set_plot_limits(self, ax, elements):
-        """Set appropriate plot limits based on drawing elements."""
-        all_x, all_y = [], []
-        
-        # Collect all coordinates
-        for line in elements['lines']:
-            all_x.extend([line['start'][0], line['end'][0]])
-            all_y.extend([line['start'][1], line['end'][1]])
-        
-        for polyline in elements['polylines']:
-            for point in polyline['points']:
-                all_x.append(point[0])
-                all_y.append(point[1])
-        
-        if all_x and all_y:
-            margin_x = (max(all_x) - min(all_x)) * 0.1
-            margin_y = (max(all_y) - min(all_y)) * 0.1
+    def _set_plot_limits(self, ax, geometry):
+        """Set plot limits from the LINE/polyline/text extents plus a 10% margin."""
+        bounds = union_bounds(geometry.bounds, text_bounds(geometry))
+        if bounds:
+            min_x, min_y, max_x, max_y = bounds
+            margin_x = (max_x - min_x) * 0.1
+            margin_y = (max_y - min_y) * 0.1
             
-            ax.set_xlim(min(all_x) - margin_x, max(all_x) + margin_x)
-            ax.set_ylim(min(all_y) - margin_y, max(all_y) + margin_y)
+            ax.set_xlim(min_x - margin_x, max_x + margin_x)
+            ax.set_ylim(min_y - margin_y, max_y + margin_y)
         
     def _add_annotations_matplotlib(self, ax):
         """Add annotations and labels."""
@@ -0,0 +1,146 @@
+"""Parsed-parameter cache keyed by workbook content.
+
+The same upload is parsed several times per request/session — the
+Streamlit preview and stats, then generation, then a re-download; the
+robotic harness re-reads each input per run. Entries are keyed by the
+SHA-256 of the file bytes plus the parser ("parameters", "lisp",
+"smart.xlsx", ...), so a renamed copy of a workbook is still a hit and a
+changed workbook never is. Parsers that fail (return None) are not cached.
+
+Callers get their own copy of the cached dict, so mutating a result never
+leaks into the next request.
+
+Configuration (environment):
+  BRIDGE_GAD_PARSE_CACHE_ENTRIES  max cached workbooks (default 128, 0 disables)
+
+Usage:
+    params = cached_parameters(upload_bytes)        # 3-column Value/Variable reader
+    params = get_parse_cache().get_or_parse(path, "lisp", parse_fn)
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+from .excel_reader import ExcelSource, read_parameters
+
+logger = logging.getLogger(__name__)
+
+Params = Dict[str, Any]
+
+
+def source_bytes(source: ExcelSource) -> bytes:
+    """Raw bytes of a path, bytes or binary stream (stream position preserved)."""
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    if isinstance(source, (str, Path)):
+        return Path(source).read_bytes()
+    pos = source.tell()
+    try:
+        return source.read()
+    finally:
+        source.seek(pos)
+
+
+class ParseCache:
+    """LRU of parsed parameter dicts keyed by (content hash, parser)."""
+
+    def __init__(self, max_entries: int = 128) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Params]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(data: bytes, kind: str) -> str:
+        return f"{kind}:{hashlib.sha256(data).hexdigest()}"
+
+    def get(self, key: str) -> Optional[Params]:
+        with self._lock:
+            params = self._entries.get(key)
+            if params is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(params)
+
+    def put(self, key: str, params: Params) -> None:
+        if self.max_entries <= 0:
+            return
+        params = copy.deepcopy(params)
+        with self._lock:
+            self._entries[key] = params
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_parse(
+        self,
+        source: ExcelSource,
+        kind: str,
+        parse: Callable[[Union[Path, str, bytes]], Optional[Params]],
+    ) -> Optional[Params]:
+        """Cached ``parse(source)`` for this content and parser ``kind``.
+
+        ``parse`` receives the original path (so suffix-based parsers keep
+        working) or, for bytes/stream sources, the raw bytes.
+        """
+        data = source_bytes(source)
+        key = self.make_key(data, kind)
+        params = self.get(key)
+        if params is not None:
+            logger.debug("Parse cache hit (%s)", kind)
+            return params
+        params = parse(source if isinstance(source, (str, Path)) else data)
+        if params is not None:
+            self.put(key, params)
+        return params
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for /metrics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "evictions": self.evictions,
+            }
+
+
+def cached_parameters(source: ExcelSource) -> Optional[Params]:
+    """``excel_reader.read_parameters`` through the shared parse cache."""
+    return get_parse_cache().get_or_parse(source, "parameters", read_parameters)
+
+
+# ── Process-wide instance ─────────────────────────────────────────────────────
+
+_cache: Optional[ParseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> ParseCache:
+    """Return the process-wide parse cache, configured from the environment."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ParseCache(int(os.environ.get("BRIDGE_GAD_PARSE_CACHE_ENTRIES", "128")))
+    return _cache
@@ -0,0 +1,171 @@
+"""Per-stage timing instrumentation for drawing generation.
+
+``BridgeGADGenerator`` records one ``StageTiming`` per pipeline stage
+(workbook read, document setup, every ``draw_*`` stage, serialisation):
+wall time, entities added to modelspace and — when memory profiling is
+enabled — peak traced allocation during the stage.
+
+Completed profiles feed process-wide latency histograms reported by
+``/metrics``; ``StageProfile.server_timing()`` formats the same data as a
+``Server-Timing`` header for ``/predict``. An ``on_stage`` callback sees
+each stage as soon as it finishes (job progress events).
+
+Configuration (environment):
+  BRIDGE_GAD_PROFILE_MEMORY  1 = trace peak memory per stage (tracemalloc,
+                             noticeably slower; default 0)
+
+Usage:
+    profile = StageProfile(msp_getter=lambda: gen.msp)
+    with profile.stage("draw_abutments"):
+        gen.draw_abutments()
+    profile.as_dicts()
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MEMORY: bool = os.environ.get("BRIDGE_GAD_PROFILE_MEMORY", "0") == "1"
+
+# Histogram bucket upper bounds in milliseconds (Prometheus-style, cumulative)
+HISTOGRAM_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+@dataclass
+class StageTiming:
+    """Measurements for one pipeline stage."""
+
+    name: str
+    wall_ms: float
+    entities: Optional[int] = None      # entities added to modelspace
+    peak_kb: Optional[float] = None     # peak traced memory during the stage
+
+
+@dataclass
+class StageProfile:
+    """Ordered stage timings for one generation run."""
+
+    msp_getter: Optional[Callable[[], Any]] = None
+    track_memory: bool = PROFILE_MEMORY
+    stages: List[StageTiming] = field(default_factory=list)
+    cache_hit: bool = False
+    on_stage: Optional[Callable[[StageTiming], None]] = None  # called as each stage ends
+
+    def _entity_count(self) -> Optional[int]:
+        if self.msp_getter is None:
+            return None
+        try:
+            msp = self.msp_getter()
+            return len(msp) if msp is not None else None
+        except Exception:
+            return None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as stage ``name``."""
+        started_tracing = False
+        if self.track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            mem_before = tracemalloc.get_traced_memory()[0]
+        before = self._entity_count()
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall_ms = (time.perf_counter() - t0) * 1000
+            after = self._entity_count()
+            peak_kb = None
+            if self.track_memory:
+                peak_kb = round(max(0, tracemalloc.get_traced_memory()[1] - mem_before) / 1024, 1)
+                if started_tracing:
+                    tracemalloc.stop()
+            entities = after - before if before is not None and after is not None else None
+            timing = StageTiming(name, round(wall_ms, 3), entities, peak_kb)
+            self.stages.append(timing)
+            if self.on_stage is not None:
+                try:
+                    self.on_stage(timing)
+                except Exception as exc:  # observers must never break generation
+                    logger.warning("on_stage callback failed for %s: %s", name, exc)
+
+    @property
+    def total_ms(self) -> float:
+        return round(sum(s.wall_ms for s in self.stages), 3)
+
+    def as_dicts(self) -> List[Dict[str, Any]]:
+        return [asdict(s) for s in self.stages]
+
+    def server_timing(self) -> str:
+        """``Server-Timing`` header value, e.g. ``read;dur=12.1, draw_abutments;dur=0.7``."""
+        parts = [f"{s.name};dur={s.wall_ms:.2f}" for s in self.stages]
+        parts.append(f"total;dur={self.total_ms:.2f}")
+        if self.cache_hit:
+            parts.append('cache;desc="hit"')
+        return ", ".join(parts)
+
+
+class StageHistograms:
+    """Thread-safe cumulative latency histograms keyed by stage name."""
+
+    def __init__(self, buckets=HISTOGRAM_BUCKETS_MS) -> None:
+        self.buckets = tuple(buckets)
+        self._counts: Dict[str, List[int]] = {}
+        self._sums: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, value_ms: float) -> None:
+        idx = bisect_left(self.buckets, value_ms)
+        with self._lock:
+            counts = self._counts.setdefault(name, [0] * (len(self.buckets) + 1))
+            counts[idx] += 1
+            self._sums[name] = self._sums.get(name, 0.0) + value_ms
+
+    def observe_profile(self, profile: StageProfile) -> None:
+        for s in profile.stages:
+            self.observe(s.name, s.wall_ms)
+        self.observe("total", profile.total_ms)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """JSON-ready view: cumulative ``le`` buckets, count and sum per stage."""
+        out: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for name, counts in self._counts.items():
+                running = 0
+                buckets: Dict[str, int] = {}
+                for bound, n in zip(self.buckets, counts):
+                    running += n
+                    buckets[f"{bound:g}"] = running
+                running += counts[-1]
+                buckets["+Inf"] = running
+                out[name] = {
+                    "buckets_ms": buckets,
+                    "count": running,
+                    "sum_ms": round(self._sums.get(name, 0.0), 3),
+                }
+        return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._sums.clear()
+
+
+_histograms = StageHistograms()
+
+
+def get_stage_histograms() -> StageHistograms:
+    """Return the process-wide stage histograms."""
+    return _histograms
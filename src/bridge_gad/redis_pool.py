@@ -0,0 +1,170 @@
+"""Shared Redis connection pool with a circuit breaker, for job enqueueing.
+
+The API opens one ``ArqRedis`` pool at startup (application lifespan)
+and reuses it for every enqueue. When Redis is unreachable the breaker
+opens: callers get ``None`` immediately — and fall back to the local
+render pool — instead of paying a connect timeout per upload. After the
+cool-down one caller probes Redis again (half-open); success closes the
+breaker, failure re-opens it.
+
+Configuration (environment):
+  REDIS_URL                    Redis DSN (empty = Redis disabled)
+  BRIDGE_GAD_REDIS_TIMEOUT     connect timeout in seconds (default 1)
+  BRIDGE_GAD_REDIS_COOLDOWN    seconds to skip Redis after a failure (default 30)
+  BRIDGE_GAD_REDIS_MAX_CONN    connections in the pool (default 20)
+
+Usage:
+    broker = get_redis_broker()
+    redis = await broker.client()           # None while Redis is unavailable
+    try:
+        await redis.enqueue_job(...)
+        broker.record_success()
+    except Exception as exc:
+        broker.record_failure(exc)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL: str = os.environ.get("REDIS_URL", "redis://localhost:6379")
+CONNECT_TIMEOUT: float = float(os.environ.get("BRIDGE_GAD_REDIS_TIMEOUT", "1"))
+COOLDOWN_SECONDS: float = float(os.environ.get("BRIDGE_GAD_REDIS_COOLDOWN", "30"))
+MAX_CONNECTIONS: int = int(os.environ.get("BRIDGE_GAD_REDIS_MAX_CONN", "20"))
+
+
+class RedisBroker:
+    """Lazily connected ``ArqRedis`` pool guarded by a circuit breaker."""
+
+    def __init__(
+        self,
+        url: str = REDIS_URL,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        cooldown: float = COOLDOWN_SECONDS,
+        max_connections: int = MAX_CONNECTIONS,
+    ) -> None:
+        self.url = url
+        self.connect_timeout = connect_timeout
+        self.cooldown = cooldown
+        self.max_connections = max_connections
+        self._redis = None
+        self._open_until = 0.0          # breaker open while time.monotonic() < this
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.failures = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.url)
+
+    @property
+    def is_open(self) -> bool:
+        return time.monotonic() < self._open_until
+
+    # ── Lifecycle ─────────────────────────────────────────────────────────────
+
+    async def _connect(self):
+        from arq.connections import RedisSettings, create_pool
+
+        settings = RedisSettings.from_dsn(self.url)
+        settings.conn_timeout = self.connect_timeout
+        settings.conn_retries = 0
+        settings.max_connections = self.max_connections
+        return await asyncio.wait_for(create_pool(settings), self.connect_timeout + 1)
+
+    async def close(self) -> None:
+        redis, self._redis = self._redis, None
+        if redis is not None:
+            try:
+                await redis.aclose()
+            except Exception as exc:
+                logger.debug("Closing Redis pool: %s", exc)
+
+    def _lock(self) -> asyncio.Lock:
+        # Created in the running loop: on Python 3.9 a Lock made at import
+        # time binds to whatever loop get_event_loop() returned then
+        loop = asyncio.get_running_loop()
+        if self._connect_lock is None or self._lock_loop is not loop:
+            self._connect_lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._connect_lock
+
+    # ── Breaker ───────────────────────────────────────────────────────────────
+
+    async def client(self):
+        """The pooled client, or None while Redis is disabled/unavailable."""
+        if not self.enabled or self.is_open:
+            return None
+        if self._redis is not None:
+            return self._redis
+        async with self._lock():
+            if self._redis is None and not self.is_open:
+                try:
+                    self._redis = await self._connect()
+                    logger.info("Redis pool connected: %s", self.url)
+                except ImportError:
+                    self.url = ""  # arq not installed — disable for good
+                    logger.info("arq not installed — jobs use the local render pool")
+                except Exception as exc:
+                    self.record_failure(exc)
+        return self._redis
+
+    def record_success(self) -> None:
+        self._open_until = 0.0
+        self.last_error = None
+
+    def record_failure(self, exc: BaseException) -> None:
+        """Open the breaker for the cool-down period."""
+        self.failures += 1
+        self.last_error = f"{type(exc).__name__}: {exc}"
+        self._open_until = time.monotonic() + self.cooldown
+        logger.warning("Redis unavailable (%s) — skipping it for %.0fs", self.last_error, self.cooldown)
+
+    # ── Health ────────────────────────────────────────────────────────────────
+
+    async def health(self) -> Dict[str, Any]:
+        """Ping Redis (unless the breaker is open) and describe the breaker."""
+        if not self.enabled:
+            return {"status": "disabled"}
+        latency_ms = None
+        if not self.is_open:
+            redis = await self.client()
+            if redis is not None:
+                t0 = time.perf_counter()
+                try:
+                    await asyncio.wait_for(redis.ping(), self.connect_timeout)
+                    latency_ms = round((time.perf_counter() - t0) * 1000, 2)
+                    self.record_success()
+                except Exception as exc:
+                    self.record_failure(exc)
+        report: Dict[str, Any] = {
+            "status": "up" if latency_ms is not None else "down",
+            "breaker": "open" if self.is_open else "closed",
+            "failures": self.failures,
+        }
+        if latency_ms is not None:
+            report["latency_ms"] = latency_ms
+        else:
+            report["retry_in_s"] = round(max(0.0, self._open_until - time.monotonic()), 1)
+            report["error"] = self.last_error
+        return report
+
+
+# ── Process-wide instance ─────────────────────────────────────────────────────
+
+_broker: Optional[RedisBroker] = None
+
+
+def get_redis_broker() -> RedisBroker:
+    """Return the process-wide Redis broker."""
+    global _broker
+    if _broker is None:
+        _broker = RedisBroker()
+    return _broker
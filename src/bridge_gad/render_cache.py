@@ -0,0 +1,239 @@
+"""Content-addressed render cache for generated drawings.
+
+Drawings are keyed by a SHA-256 of the parameters the drawing reads
+(``BridgeParams``: converted values, defaults filled in), the AutoCAD
+version, the output format and the package version, so the same workbook
+uploaded twice (preview, PDF, DXF, re-download) renders once — and two
+inputs that draw differently never share a key.
+
+Tiers:
+  - Memory — LRU, bounded by entry count and total bytes
+  - Disk   — optional, enabled by BRIDGE_GAD_CACHE_DIR; oldest files are
+             pruned once BRIDGE_GAD_CACHE_DISK_MB is exceeded
+
+Configuration (environment):
+  BRIDGE_GAD_CACHE_MB       memory budget in MB (default 128, 0 disables)
+  BRIDGE_GAD_CACHE_ENTRIES  max in-memory entries (default 256)
+  BRIDGE_GAD_CACHE_DIR      on-disk tier directory (default: disabled)
+  BRIDGE_GAD_CACHE_DISK_MB  on-disk budget in MB (default 1024)
+
+Usage:
+    cache = get_render_cache()
+    key = cache.make_key(gen.params, "R2010", "dxf")
+    data = cache.get(key)
+    if data is None:
+        data = render(...)
+        cache.put(key, data)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Union
+
+from .bridge_params import BridgeParams
+
+logger = logging.getLogger(__name__)
+
+
+def _params_repr(params: Union[BridgeParams, Mapping[str, Any]]) -> str:
+    """Canonical text of the parameters; dict keys and values are kept as-is."""
+    if isinstance(params, BridgeParams):
+        return repr(params)  # field names + exact float reprs, in field order
+    return repr(sorted((repr(k), repr(v)) for k, v in params.items()))
+
+
+class RenderCache:
+    """Two-tier (memory LRU + optional disk) cache of rendered output bytes."""
+
+    def __init__(
+        self,
+        max_bytes: int = 128 * 1024 * 1024,
+        max_entries: int = 256,
+        disk_dir: Optional[Path] = None,
+        max_disk_bytes: int = 1024 * 1024 * 1024,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.max_disk_bytes = max_disk_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    # ── Keys ──────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def make_key(params: Union[BridgeParams, Mapping[str, Any]], acad_version: str,
+                 output_format: str = "dxf") -> str:
+        """Content hash of the parameters + render options.
+
+        Pass the ``BridgeParams`` the drawing is rendered from; a plain dict
+        is hashed exactly as given (no key folding or number coercion).
+        """
+        from . import __version__
+
+        payload = json.dumps(
+            {
+                "params": _params_repr(params),
+                "acad_version": str(acad_version).upper(),
+                "format": str(output_format).lower(),
+                "version": __version__,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # ── Lookup / store ────────────────────────────────────────────────────────
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached bytes for ``key`` or None, updating counters."""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+
+        data = self._disk_get(key)
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+        self._memory_put(key, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` in every enabled tier."""
+        self._memory_put(key, data)
+        self._disk_put(key, data)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (the disk tier is left intact)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for /metrics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "disk_enabled": self.disk_dir is not None,
+            }
+
+    # ── Memory tier ───────────────────────────────────────────────────────────
+
+    def _memory_put(self, key: str, data: bytes) -> None:
+        size = len(data)
+        if self.max_bytes <= 0 or self.max_entries <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._entries[key] = data
+            self._bytes += size
+            while self._entries and (
+                self._bytes > self.max_bytes or len(self._entries) > self.max_entries
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    # ── Disk tier ─────────────────────────────────────────────────────────────
+
+    def _disk_path(self, key: str) -> Path:
+        assert self.disk_dir is not None
+        return self.disk_dir / key[:2] / f"{key}.bin"
+
+    def _disk_get(self, key: str) -> Optional[bytes]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)  # refresh mtime so pruning is LRU-ish
+            return data
+        except OSError:
+            return None
+
+    def _disk_put(self, key: str, data: bytes) -> None:
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+            self._disk_prune()
+        except OSError as exc:
+            logger.warning("Render cache disk write failed: %s", exc)
+
+    def _disk_prune(self) -> None:
+        assert self.disk_dir is not None
+        files = []
+        total = 0
+        for path in self.disk_dir.glob("*/*.bin"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        if total <= self.max_disk_bytes:
+            return
+        for _, size, path in sorted(files):
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_disk_bytes:
+                break
+
+
+# ── Process-wide instance ─────────────────────────────────────────────────────
+
+_cache: Optional[RenderCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_render_cache() -> RenderCache:
+    """Return the process-wide render cache, configured from the environment."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                disk_dir = os.environ.get("BRIDGE_GAD_CACHE_DIR") or None
+                _cache = RenderCache(
+                    max_bytes=int(float(os.environ.get("BRIDGE_GAD_CACHE_MB", "128")) * 1024 * 1024),
+                    max_entries=int(os.environ.get("BRIDGE_GAD_CACHE_ENTRIES", "256")),
+                    disk_dir=Path(disk_dir) if disk_dir else None,
+                    max_disk_bytes=int(float(os.environ.get("BRIDGE_GAD_CACHE_DISK_MB", "1024")) * 1024 * 1024),
+                )
+    return _cache
@@ -0,0 +1,509 @@
+"""Bounded process pool for API renders, with admission control.
+
+``/predict``, ``/bundle`` and the asyncio ``/jobs`` backend hand workbooks to a
+dedicated ``ProcessPoolExecutor`` instead of rendering on the event loop
+or in the default (unbounded) thread executor.
+
+Features:
+  - Admission control — at most ``workers + queue`` renders admitted at
+    once; beyond that ``submit`` raises ``PoolSaturated`` with a
+    Retry-After estimate (the API answers 429)
+  - Per-render timeout — enforced inside the worker with an interval
+    timer (the worker survives and takes the next job); a worker that is
+    stuck past the grace period is written off and the pool is recycled
+    once no healthy worker remains
+  - Cancellation — queued renders are dropped; running ones stop at the
+    next pipeline stage
+  - Stage progress — each finished stage is forwarded from the worker to
+    the caller's ``on_stage`` callback (job progress events)
+  - Warm workers — each worker runs ``warmup.warm_up`` as it starts and
+    ``start()`` spawns them ahead of the first request
+  - Cache counters — each worker has its own render/parse cache memory
+    tier; the hits and misses of every render are sent back with its
+    result and summed in ``cache_counts`` for /metrics
+
+Configuration (environment):
+  BRIDGE_GAD_RENDER_WORKERS  worker processes (default 0 = one per CPU)
+  BRIDGE_GAD_RENDER_QUEUE    renders admitted beyond busy workers (default 2 × workers)
+  BRIDGE_GAD_RENDER_TIMEOUT  seconds per render (default 120)
+
+Usage:
+    pool = get_render_pool()
+    task = pool.submit(excel_bytes, "R2010", on_stage=callback)   # may raise PoolSaturated
+    result = await pool.wait(task)                                # RenderResult
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import math
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .profiling import StageProfile, StageTiming, get_stage_histograms
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS: int = int(os.environ.get("BRIDGE_GAD_RENDER_WORKERS", "0")) or (os.cpu_count() or 1)
+DEFAULT_QUEUE: Optional[int] = (
+    int(os.environ["BRIDGE_GAD_RENDER_QUEUE"]) if os.environ.get("BRIDGE_GAD_RENDER_QUEUE") else None
+)
+DEFAULT_TIMEOUT: float = float(os.environ.get("BRIDGE_GAD_RENDER_TIMEOUT", "120"))
+
+# Extra time the parent waits past the timeout before writing a worker off
+_GRACE_SECONDS = 5.0
+_CANCEL_RING_SIZE = 64
+# Counters reported back from the workers' caches, per cache
+_CACHE_COUNTERS = {
+    "render_cache": ("hits", "misses", "disk_hits"),
+    "parse_cache": ("hits", "misses"),
+}
+
+
+class PoolSaturated(Exception):
+    """Every worker is busy and the queue is full."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(f"Render pool saturated; retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class RenderTimeout(Exception):
+    """The render exceeded its time budget."""
+
+
+class RenderCancelled(Exception):
+    """The render was cancelled before it finished."""
+
+
+class RenderInputError(Exception):
+    """The workbook or parameter dict could not be read."""
+
+
+@dataclass
+class RenderResult:
+    """Output of one pooled render."""
+
+    dxf_bytes: Optional[bytes]
+    profile: StageProfile
+    cache_counts: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+
+# ── Worker side ───────────────────────────────────────────────────────────────
+
+class _Interrupted(BaseException):
+    """Raised inside a worker to abort a render.
+
+    A ``BaseException`` so the generator's broad ``except Exception``
+    handlers cannot swallow it.
+    """
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+
+_progress_queue = None
+_cancel_ring = None
+_alarm_fired = False
+
+
+def _init_worker(progress_queue, cancel_ring, warm: bool) -> None:
+    global _progress_queue, _cancel_ring
+    _progress_queue = progress_queue
+    _cancel_ring = cancel_ring
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C is handled by the parent
+    if warm:
+        from .warmup import warm_up
+        progress_queue.put((0, os.getpid(), warm_up()))
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _on_alarm(signum, frame) -> None:
+    global _alarm_fired
+    # Remembered as well as raised: an exception raised while a finalizer
+    # or GC callback runs is printed and dropped by the interpreter
+    _alarm_fired = True
+    raise _Interrupted("timeout")
+
+
+def _cache_counters() -> Dict[str, Dict[str, int]]:
+    from .parse_cache import get_parse_cache
+    from .render_cache import get_render_cache
+
+    caches = {"render_cache": get_render_cache(), "parse_cache": get_parse_cache()}
+    return {
+        name: {counter: getattr(caches[name], counter) for counter in counters}
+        for name, counters in _CACHE_COUNTERS.items()
+    }
+
+
+def _render(
+    seq: int, source: Any, acad_version: str, timeout: Optional[float],
+    engine: str = "gad", settings: Any = None,
+) -> Tuple[str, Any, List[Dict], Dict[str, Dict[str, int]]]:
+    """Run one render; returns (outcome, dxf_bytes, stage dicts, cache counter deltas).
+
+    ``engine`` "gad" renders with ``BridgeGADGenerator``; "core" with the
+    ``core.BridgeDrawing`` wrapper (/predict), configured by ``settings``.
+    """
+    from .bridge_generator import BridgeGADGenerator
+    from .core import BridgeDrawing
+
+    before = _cache_counters()
+
+    def on_stage(timing: StageTiming) -> None:
+        if _progress_queue is not None:
+            _progress_queue.put((seq, timing.name, timing.wall_ms))
+        if _alarm_fired:
+            raise _Interrupted("timeout")
+        if _cancel_ring is not None and seq in _cancel_ring[:]:
+            raise _Interrupted("cancelled")
+
+    global _alarm_fired
+    _alarm_fired = False
+    use_timer = bool(timeout) and hasattr(signal, "setitimer")
+    if use_timer:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    gen = None
+    try:
+        # Disarmed inside the try: an alarm landing between the render's
+        # return and the disarm is still caught below, never sent to the parent
+        try:
+            if engine == "core":
+                gen = BridgeDrawing(settings)
+                gen.set_excel_source(source)
+                dxf_bytes = gen.render_bytes(on_stage=on_stage)
+            else:
+                gen = BridgeGADGenerator(acad_version=acad_version)
+                if isinstance(source, dict):
+                    dxf_bytes = gen.generate_from_params(source, on_stage=on_stage)
+                else:
+                    dxf_bytes = gen.generate_bytes(source, on_stage=on_stage)
+            outcome, payload = "ok", dxf_bytes
+        finally:
+            if use_timer:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+    except _Interrupted as exc:
+        outcome, payload = exc.reason, None
+    if outcome == "ok" and _alarm_fired:
+        outcome, payload = "timeout", None  # the alarm's exception was swallowed
+    profile = gen.profile if gen is not None else None
+    stages = profile.as_dicts() if profile is not None else []
+    if outcome == "ok" and payload is None and [s["name"] for s in stages] == ["read"]:
+        outcome = "unreadable"  # failed while reading, before any drawing stage
+    if profile is not None and profile.cache_hit:
+        stages.append({"name": "cache_hit"})
+    after = _cache_counters()
+    deltas = {
+        name: {counter: after[name][counter] - before[name][counter] for counter in counters}
+        for name, counters in after.items()
+    }
+    return outcome, payload, stages, deltas
+
+
+# ── Parent side ───────────────────────────────────────────────────────────────
+
+@dataclass
+class RenderTask:
+    """Handle for one admitted render."""
+
+    seq: int
+    future: Future
+    timeout: Optional[float]
+    started: float = field(default_factory=time.monotonic)
+    on_stage: Optional[Callable[[StageTiming], None]] = None
+
+
+class RenderPool:
+    """Process pool with a bounded admission queue."""
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        queue: Optional[int] = DEFAULT_QUEUE,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        warm: Optional[bool] = None,
+    ) -> None:
+        from .warmup import WARMUP_ENABLED
+
+        self.workers = max(1, int(workers))
+        self.warm = WARMUP_ENABLED if warm is None else warm
+        self.queue = 2 * self.workers if queue is None else max(0, int(queue))
+        self.timeout = timeout or None
+        self._ctx = multiprocessing.get_context()
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._progress_queue = None
+        self._cancel_ring = None
+        self._cancel_pos = 0
+        self._pump: Optional[threading.Thread] = None
+        self._seq = itertools.count(1)
+        self._tasks: Dict[int, RenderTask] = {}
+        self._stuck: Set[Future] = set()  # written-off renders still occupying a worker
+        self._avg_seconds = 1.0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.cancelled = 0
+        self.recycled = 0
+        self.warmups: Dict[int, Dict[str, float]] = {}  # worker pid → warm-up report (ms)
+        self.cache_counts: Dict[str, Dict[str, int]] = {
+            name: dict.fromkeys(counters, 0) for name, counters in _CACHE_COUNTERS.items()
+        }
+
+    # ── Pool lifecycle ────────────────────────────────────────────────────────
+
+    def _initializer(self) -> Tuple[Callable, tuple]:
+        return _init_worker, (self._progress_queue, self._cancel_ring, self.warm)
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            if self._progress_queue is None:
+                self._progress_queue = self._ctx.Queue()
+                self._cancel_ring = self._ctx.Array("q", _CANCEL_RING_SIZE, lock=False)
+                self._pump = threading.Thread(
+                    target=self._pump_progress, args=(self._progress_queue,), name="render-progress", daemon=True,
+                )
+                self._pump.start()
+            initializer, initargs = self._initializer()
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=self._ctx,
+                initializer=initializer, initargs=initargs,
+            )
+            self._stuck.clear()
+            logger.info("Render pool: %d worker(s), queue %d", self.workers, self.queue)
+        return self._pool
+
+    def _pump_progress(self, progress_queue) -> None:
+        """Forward (seq, stage, ms) messages from workers to task callbacks.
+
+        Reads the queue it was started with: ``shutdown`` drops the pool's
+        reference while this thread may still be waiting on it.
+        """
+        while True:
+            try:
+                message = progress_queue.get()
+            except (EOFError, OSError):
+                return
+            if message is None:
+                return
+            seq, name, wall_ms = message
+            if seq == 0:  # (0, pid, warm-up report) from a starting worker
+                self.warmups[name] = wall_ms
+                continue
+            task = self._tasks.get(seq)
+            if task is not None and task.on_stage is not None:
+                try:
+                    task.on_stage(StageTiming(name, wall_ms))
+                except Exception as exc:
+                    logger.warning("Progress callback failed for render %d: %s", seq, exc)
+
+    def start(self) -> None:
+        """Spawn (and warm) every worker now instead of on the first request."""
+        with self._lock:
+            pool = self._ensure_pool()
+        for _ in range(self.workers):
+            pool.submit(_ping)
+
+    def _recycle(self) -> None:
+        """Terminate a pool whose workers are all stuck; the next submit starts a fresh one."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is None:
+            return
+        processes = list(getattr(pool, "_processes", {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for proc in processes:
+            try:
+                proc.terminate()
+            except Exception:
+                pass
+        self.warmups.clear()
+        self.recycled += 1
+        logger.warning("Render pool recycled (all workers stuck)")
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        if self._progress_queue is not None:
+            self._progress_queue.put(None)
+            self._progress_queue = None
+
+    # ── Admission ─────────────────────────────────────────────────────────────
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely free (average render time × queue depth)."""
+        waves = (self.in_flight - self.workers + 1) / self.workers
+        return int(min(60, max(1, math.ceil(self._avg_seconds * max(1.0, waves)))))
+
+    def submit(
+        self,
+        source: Any,
+        acad_version: str = "R2010",
+        on_stage: Optional[Callable[[StageTiming], None]] = None,
+        timeout: Optional[float] = None,
+        engine: str = "gad",
+        settings: Any = None,
+    ) -> RenderTask:
+        """Admit one render or raise ``PoolSaturated``.
+
+        ``engine="core"`` renders with ``core.BridgeDrawing`` (optionally
+        configured by ``settings``) instead of ``BridgeGADGenerator``.
+        """
+        timeout = timeout or self.timeout
+        with self._lock:
+            if len(self._tasks) >= self.workers + self.queue:
+                self.rejected += 1
+                raise PoolSaturated(self.retry_after())
+            pool = self._ensure_pool()
+            seq = next(self._seq)
+            future = pool.submit(_render, seq, source, acad_version, timeout, engine, settings)
+            task = RenderTask(seq, future, timeout, on_stage=on_stage)
+            self._tasks[seq] = task
+        future.add_done_callback(lambda _f, s=seq: self._finished(s))
+        return task
+
+    def _finished(self, seq: int) -> None:
+        with self._lock:
+            task = self._tasks.pop(seq, None)
+        if task is not None and not task.future.cancelled():
+            elapsed = time.monotonic() - task.started
+            self._avg_seconds = 0.8 * self._avg_seconds + 0.2 * elapsed
+            self.completed += 1
+
+    def cancel(self, task: RenderTask) -> None:
+        """Drop a queued render, or stop a running one at its next stage."""
+        if task.future.cancel():
+            return
+        with self._lock:
+            if self._cancel_ring is not None:
+                self._cancel_ring[self._cancel_pos] = task.seq
+                self._cancel_pos = (self._cancel_pos + 1) % _CANCEL_RING_SIZE
+
+    def _write_off(self, task: RenderTask) -> None:
+        """The worker ignored its timer (e.g. stuck in C code).
+
+        The worker counts as stuck until its render finishes after all;
+        when every worker is stuck the pool is recycled.
+        """
+        with self._lock:
+            self._tasks.pop(task.seq, None)
+            self._stuck.add(task.future)
+            all_stuck = len(self._stuck) >= self.workers
+        task.future.add_done_callback(self._unstuck)
+        if all_stuck:
+            self._recycle()
+
+    def _unstuck(self, future: Future) -> None:
+        with self._lock:
+            self._stuck.discard(future)
+
+    @property
+    def stuck(self) -> int:
+        return len(self._stuck)
+
+    # ── Results ───────────────────────────────────────────────────────────────
+
+    async def wait(self, task: RenderTask) -> RenderResult:
+        """Await a submitted render.
+
+        Raises ``RenderTimeout``, ``RenderCancelled`` or ``RenderInputError``;
+        cancelling the awaiting coroutine cancels the render.
+        """
+        hard_limit = task.timeout + _GRACE_SECONDS if task.timeout else None
+        try:
+            outcome, payload, stages, cache_counts = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(task.future)), hard_limit
+            )
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            self.cancel(task)
+            self._write_off(task)
+            raise RenderTimeout(f"Render exceeded {task.timeout:g}s") from None
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            if task.future.cancelled():  # dropped from the queue by cancel()
+                raise RenderCancelled("Render cancelled before it started") from None
+            self.cancel(task)            # the awaiting request/task went away
+            raise
+
+        self._count_cache_lookups(cache_counts)
+        profile = StageProfile()
+        for stage in stages:
+            if stage.get("name") == "cache_hit":
+                profile.cache_hit = True
+            else:
+                profile.stages.append(StageTiming(**stage))
+        if outcome == "timeout":
+            self.timeouts += 1
+            raise RenderTimeout(f"Render exceeded {task.timeout:g}s")
+        if outcome == "cancelled":
+            self.cancelled += 1
+            raise RenderCancelled("Render cancelled")
+        if outcome == "unreadable":
+            raise RenderInputError("Could not read drawing parameters")
+        get_stage_histograms().observe_profile(profile)  # the worker's histograms are not ours
+        return RenderResult(payload, profile, cache_counts)
+
+    def _count_cache_lookups(self, cache_counts: Dict[str, Dict[str, int]]) -> None:
+        with self._lock:
+            for name, counters in cache_counts.items():
+                totals = self.cache_counts.setdefault(name, {})
+                for counter, value in counters.items():
+                    totals[counter] = totals.get(counter, 0) + value
+
+    async def run(self, source: Any, acad_version: str = "R2010", **kwargs: Any) -> RenderResult:
+        """``submit`` + ``wait``."""
+        return await self.wait(self.submit(source, acad_version, **kwargs))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "queue": self.queue,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "cancelled": self.cancelled,
+            "recycled": self.recycled,
+            "stuck": self.stuck,
+            "avg_render_seconds": round(self._avg_seconds, 3),
+            "warm_workers": len(self.warmups),
+            "warmup_ms": sorted(w["total"] for w in self.warmups.values()),
+            "worker_caches": {name: dict(counters) for name, counters in self.cache_counts.items()},
+        }
+
+
+# ── Process-wide instance ─────────────────────────────────────────────────────
+
+_pool: Optional[RenderPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> RenderPool:
+    """Return the process-wide render pool (workers start on first use)."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = RenderPool()
+    return _pool
@@ -7,11 +7,11 @@ Supports: DXF, PDF, SVG, PNG, HTML Canvas, JSON, Excel, ZIP
 
 import logging
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Iterator, List, Optional, Union
 from datetime import datetime
 import json
-import zipfile
 import io
+from concurrent.futures import ThreadPoolExecutor
 
 import ezdxf
 import matplotlib.pyplot as plt
@@ -19,6 +19,10 @@ import matplotlib.patches as patches
 from matplotlib.backends.backend_pdf import PdfPages
 import numpy as np
 
+from .geometry_model import ExtractedGeometry, get_geometry
+from .mpl_renderer import VECTOR_TEXT_RC, draw_geometry, text_bounds, union_bounds
+from .zip_stream import stream_zip, write_zip
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,13 +48,34 @@ class UltimateExporter:
         self.variables = bridge_generator.variables
         self.export_history = []
     
-    def export_all_formats(self, base_path: Union[str, Path], formats: Optional[List[str]] = None) -> Dict[str, Path]:
+    @property
+    def geometry(self) -> ExtractedGeometry:
+        """Modelspace geometry, extracted once per document"""
+        return get_geometry(self.doc)
+    
+    # Figure formats share one render; saved PDF last because it alone
+    # applies tight_layout. Per-format defaults, override via ``dpi=``.
+    FIGURE_FORMATS = ('png', 'svg', 'pdf')
+    DOCUMENT_FORMATS = ('dxf', 'json', 'html')
+    # Formats whose text must stay selectable: real text artists, not glyph paths
+    VECTOR_FORMATS = ('svg', 'pdf')
+    DEFAULT_DPI = {'pdf': 300, 'png': 300}
+    
+    def export_all_formats(self, base_path: Union[str, Path], formats: Optional[List[str]] = None,
+                           dpi: Optional[Dict[str, int]] = None) -> Dict[str, Path]:
         """
         Export to all specified formats
         
+        The matplotlib figure is rendered once and saved as PNG, SVG and
+        PDF in turn. DXF, JSON and HTML are serialised to bytes first, on
+        the calling thread, because the ezdxf document is not thread-safe:
+        writing DXF commits pending changes to it. Only the file writes
+        run in a thread pool, alongside the figure render.
+        
         Args:
             base_path: Base output path (without extension)
             formats: List of formats to export (default: all)
+            dpi: Per-format resolution, e.g. {'pdf': 300, 'png': 150}
         
         Returns:
             Dictionary mapping format to output file path
@@ -59,34 +84,59 @@ class UltimateExporter:
         
         if formats is None:
             formats = ['dxf', 'pdf', 'svg', 'png', 'html', 'json']
+        dpi = {**self.DEFAULT_DPI, **(dpi or {})}
         
         results = {}
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         logger.info(f"🚀 Starting batch export to {len(formats)} formats...")
         
+        # Everything that reads the document happens on this thread
+        outputs = {}
         for fmt in formats:
-            try:
-                output_path = base_path.with_suffix(f'.{fmt}')
-                
-                if fmt == 'dxf':
-                    results[fmt] = self.export_dxf(output_path)
-                elif fmt == 'pdf':
-                    results[fmt] = self.export_pdf(output_path)
-                elif fmt == 'svg':
-                    results[fmt] = self.export_svg(output_path)
-                elif fmt == 'png':
-                    results[fmt] = self.export_png(output_path)
-                elif fmt == 'html':
-                    results[fmt] = self.export_html_canvas(output_path)
-                elif fmt == 'json':
-                    results[fmt] = self.export_json(output_path)
-                
-                logger.info(f"  ✅ {fmt.upper()}: {output_path.name}")
-                
-            except Exception as e:
-                logger.error(f"  ❌ {fmt.upper()} export failed: {e}")
-                results[fmt] = None
+            if fmt in self.DOCUMENT_FORMATS:
+                try:
+                    outputs[fmt] = self._format_bytes(fmt)
+                except Exception as e:
+                    logger.error(f"  ❌ {fmt.upper()} export failed: {e}")
+                    results[fmt] = None
+        
+        with ThreadPoolExecutor(max_workers=max(1, len(outputs))) as pool:
+            futures = {
+                fmt: pool.submit(self._write_bytes, base_path.with_suffix(f'.{fmt}'), data)
+                for fmt, data in outputs.items()
+            }
+            
+            figure_formats = [fmt for fmt in self.FIGURE_FORMATS if fmt in formats]
+            if figure_formats:
+                try:
+                    fig, ax = self._render_figure(self._wants_text_artists(figure_formats))
+                except Exception as e:
+                    logger.error(f"  ❌ Figure render failed: {e}")
+                    fig = None
+                    results.update({fmt: None for fmt in figure_formats})
+                if fig is not None:
+                    try:
+                        for fmt in figure_formats:
+                            output_path = base_path.with_suffix(f'.{fmt}')
+                            try:
+                                results[fmt] = self._save_figure(fig, ax, fmt, output_path, dpi.get(fmt))
+                                logger.info(f"  ✅ {fmt.upper()}: {output_path.name}")
+                            except Exception as e:
+                                logger.error(f"  ❌ {fmt.upper()} export failed: {e}")
+                                results[fmt] = None
+                    finally:
+                        plt.close(fig)
+            
+            for fmt, future in futures.items():
+                try:
+                    results[fmt] = future.result()
+                    logger.info(f"  ✅ {fmt.upper()}: {results[fmt].name}")
+                except Exception as e:
+                    logger.error(f"  ❌ {fmt.upper()} export failed: {e}")
+                    results[fmt] = None
+        
+        # Keep the caller's format order
+        results = {fmt: results[fmt] for fmt in formats if fmt in results}
         
         # Create ZIP bundle if multiple formats
         if len([r for r in results.values() if r]) > 1:
@@ -111,75 +161,65 @@ class UltimateExporter:
             output_path: Output PDF file path
             dpi: Resolution (default: 300 DPI)
         """
-        # Extract drawing elements
-        elements = self._extract_drawing_elements()
-        
-        # Create figure
-        fig, ax = plt.subplots(1, 1, figsize=(16, 12))
-        ax.set_aspect('equal')
-        ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.5)
-        
-        # Set title
-        project_name = self.variables.get('PROJECT_NAME', 'Bridge Project')
-        ax.set_title(f'{project_name}\nGeneral Arrangement Drawing', 
-                    fontsize=16, fontweight='bold', pad=20)
-        
-        # Draw all elements
-        self._draw_elements_matplotlib(ax, elements)
-        
-        # Set limits
-        self._set_plot_limits(ax, elements)
-        
-        # Add annotations
-        self._add_annotations_matplotlib(ax)
-        
-        # Add RKS LEGAL branding
-        self._add_branding(ax)
-        
-        # Save as PDF
-        plt.tight_layout()
-        plt.savefig(output_path, format='pdf', dpi=dpi, bbox_inches='tight')
-        plt.close()
-        
-        logger.info(f"PDF exported: {output_path} ({dpi} DPI)")
-        return output_path
+        return self._export_figure('pdf', output_path, dpi)
     
     def export_svg(self, output_path: Path) -> Path:
         """Export as SVG (vector format)"""
-        elements = self._extract_drawing_elements()
-        
-        fig, ax = plt.subplots(1, 1, figsize=(16, 12))
-        ax.set_aspect('equal')
-        
-        self._draw_elements_matplotlib(ax, elements)
-        self._set_plot_limits(ax, elements)
-        self._add_annotations_matplotlib(ax)
-        self._add_branding(ax)
-        
-        plt.savefig(output_path, format='svg', bbox_inches='tight')
-        plt.close()
-        
-        logger.info(f"SVG exported: {output_path}")
-        return output_path
+        return self._export_figure('svg', output_path, None)
     
     def export_png(self, output_path: Path, dpi: int = 300) -> Path:
         """Export as PNG (raster format)"""
-        elements = self._extract_drawing_elements()
-        
+        return self._export_figure('png', output_path, dpi)
+    
+    def _export_figure(self, fmt: str, output_path: Path, dpi: Optional[int]) -> Path:
+        """Render the figure and save a single format"""
+        fig, ax = self._render_figure(self._wants_text_artists([fmt]))
+        try:
+            return self._save_figure(fig, ax, fmt, output_path, dpi)
+        finally:
+            plt.close(fig)
+    
+    def _wants_text_artists(self, formats: List[str]) -> bool:
+        """A figure shared with a vector format draws its labels as text"""
+        return any(fmt in self.VECTOR_FORMATS for fmt in formats)
+    
+    def _render_figure(self, text_artists: bool = False):
+        """Build the drawing figure once: geometry, limits, annotations, branding"""
         fig, ax = plt.subplots(1, 1, figsize=(16, 12))
         ax.set_aspect('equal')
         fig.patch.set_facecolor('white')
         ax.set_facecolor('white')
         
-        self._draw_elements_matplotlib(ax, elements)
-        self._set_plot_limits(ax, elements)
+        # Drawing geometry as batched arrays (shared across formats)
+        draw_geometry(ax, self.geometry, linewidth=0.5, text_artists=text_artists)
+        self._set_plot_limits(ax, self.geometry)
         self._add_annotations_matplotlib(ax)
-        self._add_branding(ax)
-        
-        plt.savefig(output_path, format='png', dpi=dpi, bbox_inches='tight', facecolor='white')
-        plt.close()
         
-        logger.info(f"PNG exported: {output_path} ({dpi} DPI)")
+        # Add RKS LEGAL branding
+        self._add_branding(ax)
+        return fig, ax
+    
+    def _save_figure(self, fig, ax, fmt: str, output_path: Path, dpi: Optional[int]) -> Path:
+        """Save a rendered figure; PDF adds the grid, title and tight layout"""
+        if fmt == 'pdf':
+            ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.5)
+            project_name = self.variables.get('PROJECT_NAME', 'Bridge Project')
+            ax.set_title(f'{project_name}\nGeneral Arrangement Drawing', 
+                        fontsize=16, fontweight='bold', pad=20)
+            fig.tight_layout()
+            with plt.rc_context(VECTOR_TEXT_RC):
+                fig.savefig(output_path, format='pdf', dpi=dpi or 300, bbox_inches='tight')
+            ax.grid(False)
+            ax.set_title('')
+            logger.info(f"PDF exported: {output_path} ({dpi or 300} DPI)")
+        elif fmt == 'png':
+            fig.savefig(output_path, format='png', dpi=dpi or 300, bbox_inches='tight', facecolor='white')
+            logger.info(f"PNG exported: {output_path} ({dpi or 300} DPI)")
+        else:
+            kwargs = {'dpi': dpi} if dpi else {}
+            with plt.rc_context(VECTOR_TEXT_RC):
+                fig.savefig(output_path, format=fmt, bbox_inches='tight', **kwargs)
+            logger.info(f"{fmt.upper()} exported: {output_path}")
         return output_path
     
     def export_html_canvas(self, output_path: Path) -> Path:
@@ -212,7 +252,15 @@ class UltimateExporter:
         - Drawing elements
         - Metadata
         """
-        data = {
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(self._json_payload(), f, indent=2, default=str)
+        
+        logger.info(f"JSON exported: {output_path}")
+        return output_path
+    
+    def _json_payload(self) -> Dict[str, Any]:
+        """Parameters, drawing elements and metadata for the JSON export"""
+        return {
             'metadata': {
                 'project_name': self.variables.get('PROJECT_NAME', 'Bridge Project'),
                 'generated_at': datetime.now().isoformat(),
@@ -222,119 +270,106 @@ class UltimateExporter:
             'parameters': self.variables,
             'elements': self._extract_drawing_elements(),
             'statistics': {
-                'total_elements': len(self.msp),
+                'total_elements': self.geometry.entity_count,
                 'layers': list(self.doc.layers),
                 'bounds': self._calculate_bounds()
             }
         }
+    
+    def create_zip_bundle(self, files: Dict[str, Path], output_path: Path,
+                          compresslevel: Optional[int] = None) -> Path:
+        """Create ZIP bundle of all exported files
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, default=str)
+        Files are streamed into the archive in chunks; PNG/PDF are stored
+        rather than re-compressed.
+        """
+        entries = (
+            (file_path.name, file_path)
+            for fmt, file_path in files.items()
+            if file_path and file_path.exists() and fmt != 'zip'
+        )
+        write_zip(entries, output_path, compresslevel)
         
-        logger.info(f"JSON exported: {output_path}")
+        logger.info(f"ZIP bundle created: {output_path}")
         return output_path
     
-    def create_zip_bundle(self, files: Dict[str, Path], output_path: Path) -> Path:
-        """Create ZIP bundle of all exported files"""
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for fmt, file_path in files.items():
-                if file_path and file_path.exists() and fmt != 'zip':
-                    zipf.write(file_path, file_path.name)
+    def iter_zip_bundle(self, base_name: str = 'bridge_drawing', formats: Optional[List[str]] = None,
+                        dpi: Optional[Dict[str, int]] = None,
+                        compresslevel: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Yield a ZIP of all formats chunk by chunk, without touching disk
         
-        logger.info(f"ZIP bundle created: {output_path}")
+        Each format is rendered into memory only when the archive reaches
+        it, so peak memory is about one output file. Suitable as the body
+        of a streaming HTTP response.
+        """
+        if formats is None:
+            formats = ['dxf', 'pdf', 'svg', 'png', 'html', 'json']
+        return stream_zip(self._iter_format_bytes(base_name, formats, dpi), compresslevel)
+    
+    def _iter_format_bytes(self, base_name: str, formats: List[str],
+                           dpi: Optional[Dict[str, int]] = None):
+        """Yield (filename, bytes) per format; figure formats share one render"""
+        dpi = {**self.DEFAULT_DPI, **(dpi or {})}
+        fig = ax = None
+        # PDF last: it alone applies tight_layout to the shared figure
+        ordered = sorted(formats, key=lambda f: f == 'pdf')
+        text_artists = self._wants_text_artists(formats)
+        try:
+            for fmt in ordered:
+                if fmt in self.DOCUMENT_FORMATS:
+                    data = self._format_bytes(fmt)
+                elif fmt in self.FIGURE_FORMATS:
+                    if fig is None:
+                        fig, ax = self._render_figure(text_artists)
+                    buf = io.BytesIO()
+                    self._save_figure(fig, ax, fmt, buf, dpi.get(fmt))
+                    data = buf.getvalue()
+                else:
+                    logger.warning(f"Skipping unsupported bundle format: {fmt}")
+                    continue
+                yield f'{base_name}.{fmt}', data
+        finally:
+            if fig is not None:
+                plt.close(fig)
+    
+    def _format_bytes(self, fmt: str) -> bytes:
+        """DXF, JSON or HTML output in memory (reads the document)"""
+        if fmt == 'dxf':
+            text = io.StringIO()
+            self.doc.write(text)
+            return self.doc.encode(text.getvalue())
+        if fmt == 'json':
+            return json.dumps(self._json_payload(), indent=2, default=str).encode('utf-8')
+        if fmt == 'html':
+            return self._generate_html_canvas(self._extract_drawing_elements()).encode('utf-8')
+        raise ValueError(f"Not a document format: {fmt}")
+    
+    @staticmethod
+    def _write_bytes(output_path: Path, data: bytes) -> Path:
+        """Write serialised output to disk (safe to run off the calling thread)"""
+        output_path.write_bytes(data)
         return output_path
     
     def _extract_drawing_elements(self) -> List[Dict[str, Any]]:
-        """Extract drawing elements from DXF document"""
-        elements = []
-        
-        for entity in self.msp:
-            element = {
-                'type': entity.dxftype(),
-                'layer': entity.dxf.layer if hasattr(entity.dxf, 'layer') else 'default'
-            }
-            
-            if entity.dxftype() == 'LINE':
-                element['start'] = (entity.dxf.start.x, entity.dxf.start.y)
-                element['end'] = (entity.dxf.end.x, entity.dxf.end.y)
-            
-            elif entity.dxftype() == 'CIRCLE':
-                element['center'] = (entity.dxf.center.x, entity.dxf.center.y)
-                element['radius'] = entity.dxf.radius
-            
-            elif entity.dxftype() == 'ARC':
-                element['center'] = (entity.dxf.center.x, entity.dxf.center.y)
-                element['radius'] = entity.dxf.radius
-                element['start_angle'] = entity.dxf.start_angle
-                element['end_angle'] = entity.dxf.end_angle
-            
-            elif entity.dxftype() == 'TEXT':
-                element['text'] = entity.dxf.text
-                element['position'] = (entity.dxf.insert.x, entity.dxf.insert.y)
-                element['height'] = entity.dxf.height
-            
-            elif entity.dxftype() == 'LWPOLYLINE':
-                element['points'] = [(p[0], p[1]) for p in entity.get_points()]
-                element['closed'] = entity.closed
-            
-            elements.append(element)
-        
-        return elements
+        """Drawing elements as plain dicts (one per modelspace entity)"""
+        return self.geometry.to_element_list()
     
-    def _draw_elements_matplotlib(self, ax, elements: List[Dict[str, Any]]):
-        """Draw elements using matplotlib"""
-        for elem in elements:
-            if elem['type'] == 'LINE':
-                ax.plot([elem['start'][0], elem['end'][0]], 
-                       [elem['start'][1], elem['end'][1]], 
-                       'k-', linewidth=0.5)
-            
-            elif elem['type'] == 'CIRCLE':
-                circle = plt.Circle(elem['center'], elem['radius'], 
-                                   fill=False, edgecolor='black', linewidth=0.5)
-                ax.add_patch(circle)
-            
-            elif elem['type'] == 'ARC':
-                # Draw arc using matplotlib
-                pass  # Simplified for now
-            
-            elif elem['type'] == 'TEXT':
-                ax.text(elem['position'][0], elem['position'][1], elem['text'],
-                       fontsize=8, ha='left', va='bottom')
-            
-            elif elem['type'] == 'LWPOLYLINE':
-                points = elem['points']
-                if len(points) > 1:
-                    xs, ys = zip(*points)
-                    if elem.get('closed', False):
-                        xs = xs + (xs[0],)
-                        ys = ys + (ys[0],)
-                    ax.plot(xs, ys, 'k-', linewidth=0.5)
-    
-    def _set_plot_limits(self, ax, elements: List[Dict[str, Any]]):
-        """Set appropriate plot limits based on elements"""
-        bounds = self._calculate_bounds()
-        
-        if bounds:
-            margin = 0.1 * max(bounds['width'], bounds['height'])
-            ax.set_xlim(bounds['min_x'] - margin, bounds['max_x'] + margin)
-            ax.set_ylim(bounds['min_y'] - margin, bounds['max_y'] + margin)
+    def _set_plot_limits(self, ax, geometry):
+        """Set plot limits from the LINE and text extents"""
+        bounds = union_bounds(geometry.line_bounds, text_bounds(geometry)) or (0, 0, 100, 100)
+        min_x, min_y, max_x, max_y = bounds
+        margin = 0.1 * max(max_x - min_x, max_y - min_y)
+        ax.set_xlim(min_x - margin, max_x + margin)
+        ax.set_ylim(min_y - margin, max_y + margin)
     
     def _calculate_bounds(self) -> Dict[str, float]:
-        """Calculate drawing bounds"""
-        min_x = min_y = float('inf')
-        max_x = max_y = float('-inf')
-        
-        for entity in self.msp:
-            if entity.dxftype() == 'LINE':
-                min_x = min(min_x, entity.dxf.start.x, entity.dxf.end.x)
-                max_x = max(max_x, entity.dxf.start.x, entity.dxf.end.x)
-                min_y = min(min_y, entity.dxf.start.y, entity.dxf.end.y)
-                max_y = max(max_y, entity.dxf.start.y, entity.dxf.end.y)
-        
-        if min_x == float('inf'):
+        """Calculate drawing bounds (LINE extents, precomputed at extraction)"""
+        bounds = self.geometry.line_bounds
+        if bounds is None:
             return {'min_x': 0, 'max_x': 100, 'min_y': 0, 'max_y': 100, 'width': 100, 'height': 100}
         
+        min_x, min_y, max_x, max_y = bounds
         return {
             'min_x': min_x,
             'max_x': max_x,
@@ -0,0 +1,90 @@
+"""Warm-up for worker processes (ARQ worker and the API render pool).
+
+A cold worker pays for importing ezdxf/matplotlib, building the
+DXF template document, loading ezdxf's writer code and matplotlib's font
+cache on its first job. ``warm_up`` does all of that at process start so
+the first job runs as fast as the hundredth, and reports how long each
+step took.
+
+Configuration (environment):
+  BRIDGE_GAD_WARMUP  1 = warm workers at startup (default 1)
+
+Usage:
+    report = warm_up()          # {"imports": 812.4, ..., "total": 1290.1} (ms)
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import time
+from typing import Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+WARMUP_ENABLED: bool = os.environ.get("BRIDGE_GAD_WARMUP", "1") == "1"
+
+_ACAD_VERSIONS = ("R2010",)
+
+
+def _imports() -> None:
+    import matplotlib
+    matplotlib.use("Agg")
+    import ezdxf  # noqa: F401
+    from . import bridge_generator, excel_reader, geometry_model, mpl_renderer, ultimate_exporter  # noqa: F401
+
+
+def _template_documents() -> None:
+    """Build (and pickle) the DXF prototypes, then run the writer once."""
+    from .doc_factory import new_gad_document
+
+    for version in _ACAD_VERSIONS:
+        doc = new_gad_document(version)
+        doc.write(io.StringIO())
+
+
+def _font_cache() -> None:
+    """Load the font list and glyph tables, and touch the Agg/SVG/PDF backends."""
+    import matplotlib.pyplot as plt
+    from matplotlib.font_manager import findfont
+
+    from .mpl_renderer import _FONT, _unit_text_path
+
+    findfont(_FONT)
+    for text in ("0123456789", "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz .,:-()"):
+        _unit_text_path(text)
+    fig, ax = plt.subplots(figsize=(1, 1))
+    try:
+        ax.text(0.5, 0.5, "GAD")
+        for fmt in ("png", "svg", "pdf"):
+            fig.savefig(io.BytesIO(), format=fmt, dpi=30)
+    finally:
+        plt.close(fig)
+
+
+_STEPS: Tuple[Tuple[str, Callable[[], None]], ...] = (
+    ("imports", _imports),
+    ("template_documents", _template_documents),
+    ("font_cache", _font_cache),
+)
+
+
+def warm_up() -> Dict[str, float]:
+    """Run every warm-up step; returns milliseconds per step plus ``total``.
+
+    A failing step is logged and skipped — warm-up never stops a worker
+    from starting.
+    """
+    report: Dict[str, float] = {}
+    start = time.perf_counter()
+    for name, step in _STEPS:
+        t0 = time.perf_counter()
+        try:
+            step()
+        except Exception as exc:
+            logger.warning("Warm-up step %s failed: %s", name, exc)
+        report[name] = round((time.perf_counter() - t0) * 1000, 1)
+    report["total"] = round((time.perf_counter() - start) * 1000, 1)
+    logger.info("Worker %d warmed up in %.0f ms %s", os.getpid(), report["total"], report)
+    return report
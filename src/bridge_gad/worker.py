@@ -1,7 +1,9 @@
 """ARQ async worker — background job processing for Bridge GAD Generator.
 
 Phase 7: Background job abstraction using ARQ (async-native, Redis-backed).
-Provides non-blocking Excel → DXF/PDF generation with SSE-ready status updates.
+Provides non-blocking Excel → DXF/PDF generation with SSE-ready status updates:
+each finished pipeline stage is published to the Redis channel
+``bridge_gad:job:<job_id>``, which the API relays to SSE subscribers.
 
 Usage:
     python -m bridge_gad.worker          # start worker process
@@ -10,9 +12,10 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import os
-import tempfile
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -21,6 +24,25 @@ logger = logging.getLogger(__name__)
 REDIS_URL: str = os.environ.get("REDIS_URL", "redis://localhost:6379")
 
 
+def _event_publisher(ctx: Dict[str, Any], loop: asyncio.AbstractEventLoop):
+    """Fire-and-forget progress publisher usable from the generation thread."""
+    from .job_events import redis_channel
+
+    redis = ctx.get("redis")
+    job_id = ctx.get("job_id")
+
+    def publish(event: Dict[str, Any]) -> None:
+        if redis is None or job_id is None:
+            return
+        message = json.dumps(event, default=str)
+        try:
+            asyncio.run_coroutine_threadsafe(redis.publish(redis_channel(job_id), message), loop)
+        except RuntimeError:  # loop shutting down
+            pass
+
+    return publish
+
+
 # ── Job functions ─────────────────────────────────────────────────────────────
 
 async def generate_drawing_job(
@@ -29,8 +51,9 @@ async def generate_drawing_job(
     filename: str,
     acad_version: str = "R2010",
     output_format: str = "dxf",
+    parameters: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    """Background job: Excel bytes → DXF/PDF generation.
+    """Background job: Excel bytes (or a parameter dict) → DXF/PDF generation.
 
     Args:
         ctx:           ARQ context (injected by worker).
@@ -38,54 +61,76 @@ async def generate_drawing_job(
         filename:      Original filename (sanitised before use).
         acad_version:  AutoCAD version string (R2010 or R2006).
         output_format: Desired output format (dxf, pdf, png, svg, html, csv).
+        parameters:    Parameter dict (JSON request or template); when given,
+                       ``excel_bytes`` is ignored and no workbook is parsed.
 
     Returns:
-        Dict with keys: success, output_bytes, output_format, error.
+        Dict with keys: success, output_bytes, output_format, timings, error.
     """
     from .bridge_generator import BridgeGADGenerator
+    from .job_events import progress_reporter
 
     safe_name = Path(filename).name  # strip any path traversal
     logger.info("Job started: %s → %s (%s)", safe_name, output_format, acad_version)
+    loop = asyncio.get_running_loop()
+    publish = _event_publisher(ctx, loop)
+    publish({"status": "running", "progress": 5, "stage": "start", "label": "Generation started"})
+    on_stage = progress_reporter(publish, BridgeGADGenerator.PIPELINE_STAGES)
+
+    def _generate():
+        gen = BridgeGADGenerator(acad_version=acad_version)
+        if parameters is not None:
+            return gen.generate_from_params(parameters, on_stage=on_stage), gen.profile
+        return gen.generate_profiled(excel_bytes, on_stage=on_stage)
 
     try:
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            excel_path = tmp_path / safe_name
-            excel_path.write_bytes(excel_bytes)
-
-            output_path = tmp_path / f"output.{output_format}"
-            gen = BridgeGADGenerator(acad_version=acad_version)
-
-            success = gen.generate_complete_drawing(excel_path, output_path)
-            if not success or not output_path.exists():
-                return {"success": False, "error": "Generation returned no output file"}
-
-            output_bytes = output_path.read_bytes()
-            logger.info(
-                "Job complete: %s → %d bytes", safe_name, len(output_bytes)
-            )
-            return {
-                "success": True,
-                "output_bytes": output_bytes,
-                "output_format": output_format,
-                "filename": f"bridge_drawing.{output_format}",
-            }
+        # Off the event loop so progress events go out while drawing
+        output_bytes, profile = await loop.run_in_executor(None, _generate)
+        if not output_bytes:
+            publish({"status": "failed", "error": "Generation returned no output"})
+            return {"success": False, "error": "Generation returned no output"}
+
+        logger.info(
+            "Job complete: %s → %d bytes", safe_name, len(output_bytes)
+        )
+        # The API fetches the ARQ result when it relays this event
+        publish({"status": "complete", "progress": 100, "stage": "exported", "label": "Result ready"})
+        return {
+            "success": True,
+            "output_bytes": output_bytes,
+            "output_format": output_format,
+            "filename": f"bridge_drawing.{output_format}",
+            "timings": profile.as_dicts(),
+        }
 
     except Exception as exc:
         logger.exception("Job failed for %s: %s", safe_name, exc)
+        publish({"status": "failed", "error": str(exc)})
         return {"success": False, "error": str(exc)}
 
 
+# ── Lifecycle hooks ───────────────────────────────────────────────────────────
+
+async def startup(ctx: Dict[str, Any]) -> None:
+    """ARQ on_startup: preload modules, template document and fonts."""
+    from .warmup import WARMUP_ENABLED, warm_up
+
+    if WARMUP_ENABLED:
+        ctx["warmup_ms"] = warm_up()
+
+
 # ── Worker settings ───────────────────────────────────────────────────────────
 
 class WorkerSettings:
     """ARQ WorkerSettings — configure via environment variables."""
 
     functions = [generate_drawing_job]
+    on_startup = startup
     redis_settings = None  # set dynamically below
     max_jobs = int(os.environ.get("ARQ_MAX_JOBS", "10"))
     job_timeout = int(os.environ.get("ARQ_JOB_TIMEOUT", "120"))  # seconds
     keep_result = int(os.environ.get("ARQ_KEEP_RESULT", "3600"))  # 1 hour
+    allow_abort_jobs = True  # DELETE /jobs/{id}
 
 
 # Attach Redis settings at import time so ARQ CLI can discover them
@@ -99,7 +144,6 @@ except ImportError:
 # ── Entrypoint ────────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
-    import asyncio
     try:
         from arq import run_worker
         run_worker(WorkerSettings)
@@ -0,0 +1,173 @@
+"""Streaming ZIP writer.
+
+Builds a ZIP archive incrementally: each entry is written as its bytes
+are produced and the archive is handed out as a sequence of chunks, so
+peak memory stays around one file instead of every file plus the whole
+archive. Works on a non-seekable sink (sizes go in data descriptors),
+which makes the chunk iterator usable directly as a FastAPI
+``StreamingResponse`` body.
+
+Already-compressed formats (PNG, PDF, JPG, ZIP) are stored rather than
+deflated; everything else uses the configured compression level.
+
+Configuration (environment):
+  BRIDGE_GAD_ZIP_LEVEL  deflate level 0-9 for compressible entries (default 6)
+
+Usage:
+    for chunk in stream_zip([("a.dxf", dxf_bytes), ("b.png", png_path)]):
+        out.write(chunk)
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import sys
+import time
+import zipfile
+from collections import deque
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMPRESSLEVEL: int = int(os.environ.get("BRIDGE_GAD_ZIP_LEVEL", "6"))
+STORE_SUFFIXES = frozenset({".png", ".pdf", ".jpg", ".jpeg", ".zip", ".gz"})
+CHUNK_SIZE = 64 * 1024
+
+# bytes, a binary file object, a path on disk, or an iterable of byte chunks
+EntrySource = Union[bytes, bytearray, BinaryIO, Path, Iterable[bytes]]
+
+
+class _ChunkSink:
+    """Write-only, non-seekable file object that queues written bytes."""
+
+    def __init__(self) -> None:
+        self._chunks: deque = deque()
+
+    def write(self, data) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> Iterator[bytes]:
+        while self._chunks:
+            yield self._chunks.popleft()
+
+
+def _iter_source(source: EntrySource, chunk_size: int) -> Iterator[bytes]:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        for i in range(0, len(source), chunk_size):
+            yield bytes(source[i:i + chunk_size])
+    elif isinstance(source, (str, Path)):
+        with open(source, "rb") as fh:
+            yield from iter(lambda: fh.read(chunk_size), b"")
+    elif hasattr(source, "read"):
+        yield from iter(lambda: source.read(chunk_size), b"")
+    else:
+        for chunk in source:
+            yield chunk
+
+
+class StreamingZipWriter:
+    """Incremental ZIP builder; every method yields the archive bytes produced."""
+
+    def __init__(
+        self,
+        compresslevel: Optional[int] = None,
+        store_suffixes: Iterable[str] = STORE_SUFFIXES,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        self.compresslevel = DEFAULT_COMPRESSLEVEL if compresslevel is None else compresslevel
+        self.store_suffixes = frozenset(s.lower() for s in store_suffixes)
+        self.chunk_size = chunk_size
+        self._sink = _ChunkSink()
+        self._zip = zipfile.ZipFile(self._sink, "w", zipfile.ZIP_DEFLATED, compresslevel=self.compresslevel)
+        self.entries = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def _zipinfo(self, name: str) -> zipfile.ZipInfo:
+        info = zipfile.ZipInfo(name, date_time=time.localtime(time.time())[:6])
+        info.external_attr = 0o644 << 16
+        if self.compresslevel <= 0 or Path(name).suffix.lower() in self.store_suffixes:
+            info.compress_type = zipfile.ZIP_STORED
+        else:
+            info.compress_type = zipfile.ZIP_DEFLATED
+            # ZipFile.open(info, "w") takes the level from the ZipInfo, not the ZipFile
+            if sys.version_info >= (3, 13):
+                info.compress_level = self.compresslevel
+            else:
+                info._compresslevel = self.compresslevel
+        return info
+
+    def _drain(self) -> Iterator[bytes]:
+        for chunk in self._sink.drain():
+            self.bytes_out += len(chunk)
+            yield chunk
+
+    def add(self, name: str, source: EntrySource) -> Iterator[bytes]:
+        """Write one entry from ``source``, yielding archive chunks as they appear."""
+        with self._zip.open(self._zipinfo(name), "w") as entry:
+            for data in _iter_source(source, self.chunk_size):
+                entry.write(data)
+                self.bytes_in += len(data)
+                yield from self._drain()
+        self.entries += 1
+        yield from self._drain()
+
+    def close(self) -> Iterator[bytes]:
+        """Write the central directory."""
+        self._zip.close()
+        yield from self._drain()
+        logger.info(
+            "Streamed ZIP: %d entries, %d → %d bytes", self.entries, self.bytes_in, self.bytes_out
+        )
+
+
+def stream_zip(
+    entries: Iterable[Tuple[str, EntrySource]],
+    compresslevel: Optional[int] = None,
+    store_suffixes: Iterable[str] = STORE_SUFFIXES,
+) -> Iterator[bytes]:
+    """Yield a ZIP archive of ``(name, source)`` entries chunk by chunk.
+
+    ``entries`` may be lazy; each source is consumed (and can be released)
+    before the next entry is requested.
+    """
+    writer = StreamingZipWriter(compresslevel, store_suffixes)
+    for name, source in entries:
+        yield from writer.add(name, source)
+    yield from writer.close()
+
+
+def write_zip(
+    entries: Iterable[Tuple[str, EntrySource]],
+    dest: Union[str, Path, BinaryIO],
+    compresslevel: Optional[int] = None,
+    store_suffixes: Iterable[str] = STORE_SUFFIXES,
+) -> int:
+    """Stream a ZIP of ``entries`` into a path or binary file; returns bytes written."""
+    total = 0
+    if isinstance(dest, (str, Path)):
+        with open(dest, "wb") as fh:
+            return write_zip(entries, fh, compresslevel, store_suffixes)
+    for chunk in stream_zip(entries, compresslevel, store_suffixes):
+        dest.write(chunk)
+        total += len(chunk)
+    return total
+
+
+def zip_bytes(
+    entries: Iterable[Tuple[str, EntrySource]],
+    compresslevel: Optional[int] = None,
+    store_suffixes: Iterable[str] = STORE_SUFFIXES,
+) -> bytes:
+    """Whole archive as bytes (for callers that need a buffer, e.g. Streamlit)."""
+    buf = io.BytesIO()
+    write_zip(entries, buf, compresslevel, store_suffixes)
+    return buf.getvalue()
@@ -14,7 +14,6 @@ Design: 2025 International Trends applied
 import streamlit as st
 import pandas as pd
 from pathlib import Path
-import tempfile
 import sys
 import os
 from io import BytesIO
@@ -59,6 +58,8 @@ def _load_modules():
     bc_validate, cleanup_dxf_entities, BC_TEMPLATES,
     make_template_excel, batch_generate, batch_results_to_zip,
 ) = _load_modules()
+from bridge_gad.excel_reader import read_rows  # noqa: E402
+from bridge_gad.parse_cache import cached_parameters  # noqa: E402
 
 st.set_page_config(
     page_title="Bridge GAD Generator",
@@ -690,19 +691,19 @@ with tab1:
 
         if uploaded_file:
             st.success("✅ File uploaded successfully")
-            _df_raw = pd.read_excel(uploaded_file, header=None)
+            _rows_raw = read_rows(uploaded_file)
             uploaded_file.seek(0)
 
             with st.expander("👁️ Preview Data"):
-                st.dataframe(_df_raw.head(20), use_container_width=True)
+                st.dataframe(pd.DataFrame(_rows_raw[:20]), use_container_width=True)
 
     with col2:
         st.markdown('<p class="section-title">📊 Quick Stats</p>', unsafe_allow_html=True)
         if uploaded_file:
             try:
-                _df_stats = _df_raw.copy()
-                _df_stats.columns = ["Value", "Variable", "Description"]
-                var_dict = _df_stats.set_index("Variable")["Value"].to_dict()
+                var_dict = cached_parameters(uploaded_file)  # generation reuses this parse
+                if var_dict is None:
+                    raise ValueError("expected Value, Variable, Description columns")
                 _spans    = int(var_dict.get("NSPAN", 0))
                 _span_len = float(var_dict.get("SPAN1", 0))
                 _width    = float(var_dict.get("CCBR", 0))
@@ -745,71 +746,65 @@ with tab1:
         if generate_btn:
             with st.spinner("🔄 Generating bridge drawing..."):
                 try:
-                    with tempfile.TemporaryDirectory() as temp_dir:
-                        temp_path = Path(temp_dir)
-                        excel_path = temp_path / Path(uploaded_file.name).name
-                        with open(excel_path, "wb") as f:
-                            f.write(uploaded_file.getbuffer())
-
-                        gen = BridgeGADGenerator(acad_version=acad_version)
-                        output_file = temp_path / f"bridge_gad.{export_format}"
-
-                        if gen.generate_complete_drawing(excel_path, output_file):
-                            st.success("✅ Drawing generated successfully!")
-                            file_size = output_file.stat().st_size / 1024
-                            st.markdown(f"""
-                            <div class="glass-card" style="display:flex;align-items:center;gap:1rem;">
-                                <span style="font-size:2rem;">📁</span>
-                                <div>
-                                    <div style="color:#00d4ff;font-weight:700;">bridge_gad.{export_format}</div>
-                                    <div style="color:#8b949e;font-size:0.8rem;">{file_size:.1f} KB &nbsp;·&nbsp; {acad_version}</div>
-                                </div>
+                    gen = BridgeGADGenerator(acad_version=acad_version)
+                    uploaded_file.seek(0)
+                    _dxf_bytes = gen.generate_bytes(uploaded_file)
+
+                    if _dxf_bytes:
+                        st.success("✅ Drawing generated successfully!")
+                        file_size = len(_dxf_bytes) / 1024
+                        st.markdown(f"""
+                        <div class="glass-card" style="display:flex;align-items:center;gap:1rem;">
+                            <span style="font-size:2rem;">📁</span>
+                            <div>
+                                <div style="color:#00d4ff;font-weight:700;">bridge_gad.{export_format}</div>
+                                <div style="color:#8b949e;font-size:0.8rem;">{file_size:.1f} KB &nbsp;·&nbsp; {acad_version}</div>
                             </div>
-                            """, unsafe_allow_html=True)
-
-                            with open(output_file, "rb") as f:
-                                _mime_map = {
-                                    "dxf": "application/dxf",
-                                    "pdf": "application/pdf",
-                                    "png": "image/png",
-                                    "svg": "image/svg+xml",
-                                    "excel": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                                    "csv": "text/csv",
-                                    "html": "text/html",
-                                }
-                                st.download_button(
-                                    label=f"⬇️ Download {export_format.upper()}",
-                                    data=f.read(),
-                                    file_name=f"bridge_drawing.{export_format}",
-                                    mime=_mime_map.get(export_format, "application/octet-stream"),
-                                )
-
-                            st.session_state.history.append({
-                                "type": "Drawing",
-                                "name": uploaded_file.name,
-                                "date": datetime.now().strftime("%Y-%m-%d %H:%M"),
-                                "format": export_format,
-                                "size": file_size,
-                            })
-                            # Phase 6: store params for CalcEngine / Quality / 3D tabs
-                            try:
-                                from bridge_gad.calc_engine import CalcEngine
-                                _engine = CalcEngine.with_bridge_defaults()
-                                _engine.load(gen.variables if hasattr(gen, "variables") else {})
-                                _calc = _engine.recalculate()
-                                st.session_state.last_params = _calc
-                            except Exception:
-                                st.session_state.last_params = getattr(gen, "variables", {})
-                            # BridgeCanvas DXF cleanup — remove orphan/degenerate entities
-                            try:
-                                _cleanup = cleanup_dxf_entities(gen.doc)
-                                _total_cleaned = sum(_cleanup.values())
-                                if _total_cleaned:
-                                    st.caption(f"🧹 Cleaned {_total_cleaned} degenerate entities from DXF")
-                            except Exception:
-                                pass
-                        else:
-                            st.error("❌ Failed to generate drawing")
+                        </div>
+                        """, unsafe_allow_html=True)
+
+                        _mime_map = {
+                            "dxf": "application/dxf",
+                            "pdf": "application/pdf",
+                            "png": "image/png",
+                            "svg": "image/svg+xml",
+                            "excel": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                            "csv": "text/csv",
+                            "html": "text/html",
+                        }
+                        st.download_button(
+                            label=f"⬇️ Download {export_format.upper()}",
+                            data=_dxf_bytes,
+                            file_name=f"bridge_drawing.{export_format}",
+                            mime=_mime_map.get(export_format, "application/octet-stream"),
+                        )
+
+                        st.session_state.history.append({
+                            "type": "Drawing",
+                            "name": uploaded_file.name,
+                            "date": datetime.now().strftime("%Y-%m-%d %H:%M"),
+                            "format": export_format,
+                            "size": file_size,
+                        })
+                        # Phase 6: store params for CalcEngine / Quality / 3D tabs
+                        try:
+                            from bridge_gad.calc_engine import CalcEngine
+                            _engine = CalcEngine.with_bridge_defaults()
+                            _engine.load(gen.variables if hasattr(gen, "variables") else {})
+                            _calc = _engine.recalculate()
+                            st.session_state.last_params = _calc
+                        except Exception:
+                            st.session_state.last_params = getattr(gen, "variables", {})
+                        # BridgeCanvas DXF cleanup — remove orphan/degenerate entities
+                        try:
+                            _cleanup = cleanup_dxf_entities(gen.doc)
+                            _total_cleaned = sum(_cleanup.values())
+                            if _total_cleaned:
+                                st.caption(f"🧹 Cleaned {_total_cleaned} degenerate entities from DXF")
+                        except Exception:
+                            pass
+                    else:
+                        st.error("❌ Failed to generate drawing")
 
                 except Exception as e:
                     st.error(f"❌ Error: {str(e)}")
@@ -1008,7 +1003,7 @@ with tab3:
     st.markdown('<p class="section-title">🎯 Quick-Start Templates</p>', unsafe_allow_html=True)
     st.markdown("""
     <div class="glass-card" style="padding:0.8rem 1.2rem; margin-bottom:0.5rem;">
-        5 standard bridge templates from BridgeCanvas. Download as Excel, modify if needed, then upload in Tab 1.
+        5 standard bridge templates from BridgeCanvas. Generate the DXF directly, or download as Excel, modify if needed, then upload in Tab 1.
     </div>
     """, unsafe_allow_html=True)
 
@@ -1050,6 +1045,22 @@ with tab3:
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             type="primary",
         )
+        if st.button(f"🚀 Generate {_t3_tmpl['name']} DXF", key="bc_template_gen"):
+            with st.spinner("🔄 Generating template drawing..."):
+                # Straight from the parameter dict — no workbook round-trip
+                _t3_dxf = BridgeGADGenerator(acad_version=acad_version).generate_from_params(
+                    _t3_tmpl["parameters"]
+                )
+            if _t3_dxf:
+                st.download_button(
+                    "⬇️ Download DXF",
+                    data=_t3_dxf,
+                    file_name=f"{_t3_sel}_bridge.dxf",
+                    mime="application/dxf",
+                    key="bc_template_dxf",
+                )
+            else:
+                st.error("Template drawing failed — see logs")
 
     st.markdown('<p class="section-title">📦 Batch Processing</p>', unsafe_allow_html=True)
     _t3_batch_files = st.file_uploader(
@@ -1281,11 +1292,7 @@ with tab6:
         file_b = st.file_uploader("Design B", type=["xlsx", "xls"], key="cmp_b")
     if file_a and file_b:
         def _read_vars(f):
-            df = pd.read_excel(f, header=None)
-            if df.shape[1] >= 3:
-                df.columns = ["Value", "Variable", "Description"]
-                return df.set_index("Variable")["Value"].to_dict()
-            return {}
+            return cached_parameters(f) or {}
         d1, d2 = _read_vars(file_a), _read_vars(file_b)
         comparator = DesignComparator(d1, d2)
         st.text(comparator.get_summary())
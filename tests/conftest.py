@@ -0,0 +1,6 @@
+"""Shared pytest setup: import ``bridge_gad`` from ``src/`` without installing."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
@@ -0,0 +1,74 @@
+"""/predict: the generate_bridge_drawing engine, config_file and unreadable workbooks."""
+
+import io
+from collections import Counter
+from pathlib import Path
+
+import ezdxf
+import pytest
+
+from bridge_gad.render_pool import RenderPool
+
+INPUTS = Path(__file__).resolve().parent.parent / "inputs"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from bridge_gad import api
+
+    pool = RenderPool(workers=1, warm=False)
+    monkeypatch.setattr(api, "_pool", pool)
+    with TestClient(api.app) as c:
+        yield c
+    pool.shutdown()
+
+
+def _upload(path: Path):
+    return {"excel_file": (path.name, path.read_bytes(), "application/octet-stream")}
+
+
+def _entity_types(data: bytes) -> Counter:
+    doc = ezdxf.read(io.StringIO(data.decode("utf-8")))
+    return Counter(e.dxftype() for e in doc.modelspace())
+
+
+def test_predict_draws_like_generate_bridge_drawing(client, tmp_path):
+    from bridge_gad.core import generate_bridge_drawing
+
+    response = client.post("/predict", files=_upload(INPUTS / "sample_input.xlsx"))
+    assert response.status_code == 200
+    assert "read;dur=" in response.headers["Server-Timing"]
+    assert "draw_abutments;dur=" in response.headers["Server-Timing"]
+
+    expected = generate_bridge_drawing(INPUTS / "sample_input.xlsx", output_path=tmp_path / "gad.dxf")
+    assert _entity_types(response.content) == _entity_types(expected.read_bytes())
+
+
+def test_predict_accepts_config_file(client):
+    files = _upload(INPUTS / "sample_input.xlsx")
+    files["config_file"] = ("config.yaml", b"output:\n  format: DXF\n", "application/x-yaml")
+    response = client.post("/predict", files=files)
+    assert response.status_code == 200
+    assert response.content.rstrip().endswith(b"EOF")
+
+
+def test_invalid_config_file_is_422(client):
+    files = _upload(INPUTS / "sample_input.xlsx")
+    files["config_file"] = ("config.yaml", b"drawing:\n  scale: [not, a, number]\n", "application/x-yaml")
+    response = client.post("/predict", files=files)
+    assert response.status_code == 422
+    assert "config_file" in response.json()["detail"]
+
+
+def test_unreadable_workbook_is_422(client):
+    files = {"excel_file": ("broken.xlsx", b"not a workbook", "application/octet-stream")}
+    response = client.post("/predict", files=files)
+    assert response.status_code == 422
+    assert "broken.xlsx" in response.json()["detail"]
+
+
+def test_non_numeric_parameter_is_422(client):
+    response = client.post("/predict/params", json={"parameters": {"SPAN1": "wide"}})
+    assert response.status_code == 422
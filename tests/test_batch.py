@@ -0,0 +1,120 @@
+"""/jobs/batch upload expansion and the results ZIP."""
+
+import io
+import json
+import zipfile
+
+import pytest
+from fastapi import HTTPException
+
+from bridge_gad import api
+
+
+def _zip(members):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+# ── Upload expansion ──────────────────────────────────────────────────────────
+
+def test_zip_members_are_filtered():
+    archive = _zip({
+        "a.xlsx": b"A",
+        "sub/dir/b.XLSM": b"B",
+        "sub/": b"",
+        ".hidden.xlsx": b"H",
+        "__MACOSX/sub/._b.xlsm": b"M",
+        "notes.txt": b"T",
+    })
+    workbooks = api._expand_uploads([("set.zip", archive), ("c.xls", b"C")])
+    assert workbooks == [("a.xlsx", b"A"), ("b.XLSM", b"B"), ("c.xls", b"C")]
+
+
+def test_zip_member_paths_are_stripped():
+    workbooks = api._expand_uploads([("set.zip", _zip({"../../etc/evil.xlsx": b"E"}))])
+    assert workbooks == [("evil.xlsx", b"E")]
+
+
+@pytest.mark.parametrize("uploads, status", [
+    ([("readme.txt", b"x")], 400),
+    ([("broken.zip", b"not a zip")], 400),
+    ([("empty.zip", _zip({"notes.txt": b"x"}))], 400),
+])
+def test_rejected_uploads(uploads, status):
+    with pytest.raises(HTTPException) as exc:
+        api._expand_uploads(uploads)
+    assert exc.value.status_code == status
+
+
+def test_file_count_limit(monkeypatch):
+    monkeypatch.setattr(api, "_BATCH_MAX_FILES", 2)
+    api._expand_uploads([("a.xlsx", b"1"), ("b.xlsx", b"2")])
+    with pytest.raises(HTTPException) as exc:
+        api._expand_uploads([("set.zip", _zip({"a.xlsx": b"1", "b.xlsx": b"2", "c.xlsx": b"3"}))])
+    assert exc.value.status_code == 413
+
+
+def test_size_limit_checked_before_decompressing(monkeypatch):
+    monkeypatch.setattr(api, "_BATCH_MAX_BYTES", 1000)
+    bomb = _zip({"big.xlsx": b"\0" * 100_000})  # compresses far below the limit
+    assert len(bomb) < 1000
+    read = []
+    real_read = zipfile.ZipFile.read
+    monkeypatch.setattr(zipfile.ZipFile, "read", lambda self, info: read.append(info) or real_read(self, info))
+    with pytest.raises(HTTPException) as exc:
+        api._expand_uploads([("bomb.zip", bomb)])
+    assert exc.value.status_code == 413
+    assert read == []
+
+
+def test_size_limit_over_plain_uploads(monkeypatch):
+    monkeypatch.setattr(api, "_BATCH_MAX_BYTES", 10)
+    with pytest.raises(HTTPException) as exc:
+        api._expand_uploads([("a.xlsx", b"x" * 6), ("b.xlsx", b"y" * 6)])
+    assert exc.value.status_code == 413
+
+
+# ── Results ZIP ───────────────────────────────────────────────────────────────
+
+def test_results_zip_names_duplicates_and_lists_failures(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from bridge_gad.job_store import MemoryJobStore
+
+    store = MemoryJobStore()
+    monkeypatch.setattr(api, "_jobs", store)
+    jobs = [("j1", "bridge.xlsx", b"one"), ("j2", "bridge.xlsx", b"two"), ("j3", "other/bridge.xlsm", b"three")]
+    for job_id, filename, data in jobs:
+        store.create(job_id, filename=filename, output_format="dxf")
+        store.set_result(job_id, data, status="complete")
+    store.create("j4", filename="bad.xlsx", status="failed", error="Could not read drawing parameters")
+    store.create_batch("b1", ["j1", "j2", "j3", "j4", "gone"])
+
+    with TestClient(api.app) as client:
+        response = client.get("/jobs/batch/b1/results")
+    assert response.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
+        assert zf.namelist() == ["bridge.dxf", "bridge_2.dxf", "bridge_3.dxf", "manifest.json"]
+        assert [zf.read(n) for n in zf.namelist()[:3]] == [b"one", b"two", b"three"]
+        manifest = json.loads(zf.read("manifest.json"))
+    records = {r["job_id"]: r for r in manifest["jobs"]}
+    assert records["j2"]["file"] == "bridge_2.dxf"
+    assert records["j4"]["error"] == "Could not read drawing parameters"
+    assert records["gone"]["status"] == "evicted"
+
+
+def test_results_wait_for_pending_jobs_unless_partial(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from bridge_gad.job_store import MemoryJobStore
+
+    store = MemoryJobStore()
+    monkeypatch.setattr(api, "_jobs", store)
+    store.create("j1", filename="a.xlsx", status="running")
+    store.create_batch("b1", ["j1"])
+    with TestClient(api.app) as client:
+        assert client.get("/jobs/batch/b1/results").status_code == 409
+        assert client.get("/jobs/batch/b1/results?partial=true").status_code == 200
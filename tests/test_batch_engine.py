@@ -0,0 +1,138 @@
+"""Process-pool batch engine: ordering, chunking, lazy input and timeouts."""
+
+import multiprocessing
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from bridge_gad import bridge_canvas_features
+from bridge_gad.batch_engine import _chunked, iter_batch_generate
+
+INPUTS = Path(__file__).resolve().parent.parent / "inputs"
+
+# The stand-in renderer is patched into the parent and inherited by forked workers
+pytestmark = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork", reason="needs fork-started workers"
+)
+
+
+def _fake_generate_single(filename, file_bytes, acad_version="R2010"):
+    """Sleep for the seconds in ``file_bytes`` ("hang" = a minute), report the worker PID."""
+    pid = os.getpid()
+    if file_bytes == b"hang":
+        Path(os.environ["BATCH_TEST_DIR"], f"{filename}.pid").write_text(str(pid))
+        time.sleep(60)
+    time.sleep(float(file_bytes))
+    return {"filename": filename, "success": True, "dxf_bytes": str(pid).encode(), "error": None}
+
+
+@pytest.fixture(autouse=True)
+def fake_render(monkeypatch, tmp_path):
+    monkeypatch.setenv("BATCH_TEST_DIR", str(tmp_path))
+    monkeypatch.setattr(bridge_canvas_features, "generate_single", _fake_generate_single)
+
+
+def _names(results):
+    return [r["filename"] for r in results]
+
+
+def _gone(pid, wait=5.0):
+    """True once ``pid`` has exited (reaped or zombie)."""
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        try:
+            state = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()[0]
+        except (FileNotFoundError, ProcessLookupError):
+            return True
+        if state in ("Z", "X"):
+            return True
+        time.sleep(0.05)
+    return False
+
+
+# ── Ordering ──────────────────────────────────────────────────────────────────
+
+SLOWEST_FIRST = [("a", b"0.6"), ("b", b"0.4"), ("c", b"0.2"), ("d", b"0")]
+
+
+def test_ordered_results_follow_input_order():
+    assert _names(iter_batch_generate(SLOWEST_FIRST, max_workers=4)) == ["a", "b", "c", "d"]
+
+
+def test_unordered_results_arrive_as_completed():
+    assert _names(iter_batch_generate(SLOWEST_FIRST, max_workers=4, ordered=False)) == ["d", "c", "b", "a"]
+
+
+def test_serial_mode_renders_in_process():
+    results = list(iter_batch_generate([("a", b"0"), ("b", b"0")], max_workers=1))
+    assert _names(results) == ["a", "b"]
+    assert {r["dxf_bytes"] for r in results} == {str(os.getpid()).encode()}
+
+
+# ── Chunking and lazy input ───────────────────────────────────────────────────
+
+def test_chunks_keep_input_indices():
+    chunks = list(_chunked(((str(i), b"") for i in range(7)), 3))
+    assert [[idx for idx, _, _ in c] for c in chunks] == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_chunk_renders_in_one_worker():
+    files = [(str(i), b"0") for i in range(6)]
+    results = list(iter_batch_generate(files, max_workers=2, chunksize=3))
+    assert _names(results) == [str(i) for i in range(6)]
+    pids = [r["dxf_bytes"] for r in results]
+    assert len(set(pids[:3])) == 1 and len(set(pids[3:])) == 1
+
+
+def test_input_is_consumed_lazily():
+    pulled = []
+
+    def files():
+        for i in range(40):
+            pulled.append(i)
+            yield str(i), b"0"
+
+    results = iter_batch_generate(files(), max_workers=2, chunksize=2)
+    assert pulled == []                       # nothing read before iteration
+    next(results)
+    assert len(pulled) <= 2 * 2 * 2           # the initial slots, then one refill per slot
+    assert len(list(results)) == 39 and len(pulled) == 40
+
+
+def test_short_batch_renders_serially():
+    # One chunk is all there is: no pool for a single task
+    results = list(iter_batch_generate([("a", b"0"), ("b", b"0")], max_workers=8, chunksize=5))
+    assert {r["dxf_bytes"] for r in results} == {str(os.getpid()).encode()}
+
+
+# ── Timeouts ──────────────────────────────────────────────────────────────────
+
+def test_hung_file_times_out_and_others_finish(tmp_path):
+    start = time.monotonic()
+    results = list(iter_batch_generate(
+        [("hung", b"hang"), ("a", b"0"), ("b", b"0"), ("c", b"0")], max_workers=2, timeout=0.5,
+    ))
+    assert time.monotonic() - start < 10
+    assert _names(results) == ["hung", "a", "b", "c"]
+    assert results[0]["success"] is False and results[0]["error"] == "Timed out after 0.5s"
+    assert all(r["success"] for r in results[1:])
+    assert _gone(int((tmp_path / "hung.pid").read_text()))
+
+
+def test_pool_is_recycled_when_every_worker_hangs(tmp_path):
+    results = list(iter_batch_generate(
+        [("h1", b"hang"), ("h2", b"hang"), ("a", b"0"), ("b", b"0")], max_workers=2, timeout=0.5,
+    ))
+    assert [r["success"] for r in results] == [False, False, True, True]
+    assert _gone(int((tmp_path / "h1.pid").read_text()))
+    assert _gone(int((tmp_path / "h2.pid").read_text()))
+
+
+def test_real_workbooks_render(monkeypatch):
+    monkeypatch.undo()
+    files = [(p.name, p.read_bytes()) for p in sorted(INPUTS.glob("*.xlsx"))[:3]]
+    results = list(iter_batch_generate(files, max_workers=2))
+    assert _names(results) == [name for name, _ in files]
+    assert all(r["success"] and r["dxf_bytes"].lstrip().startswith(b"0") for r in results)
@@ -0,0 +1,78 @@
+"""BridgeParams conversion, validation and per-stage defaults."""
+
+import re
+
+import pytest
+
+from bridge_gad.bridge_generator import BridgeGADGenerator
+from bridge_gad.bridge_params import BridgeParams
+
+
+def _stage_points(variables, stage):
+    gen = BridgeGADGenerator(use_cache=False)
+    assert gen.load_variables(variables)
+    gen.setup_document()
+    getattr(gen, stage)()
+    return [
+        [tuple(round(v, 6) for v in p[:2]) for p in e.get_points()]
+        for e in gen.msp.query("LWPOLYLINE")
+    ]
+
+
+# ── Conversion ────────────────────────────────────────────────────────────────
+
+def test_values_are_converted_once():
+    params = BridgeParams.from_variables({"NSPAN": "4", "SPAN1": 15, "SCALE1": "200", "PROJECT_CODE": 42})
+    assert params.nspan == 4 and isinstance(params.nspan, int)
+    assert params.span1 == 15.0 and params.scale1 == 200.0
+    assert params.project_code == "42"
+    assert params.sc == pytest.approx(2.0)
+
+
+def test_missing_variables_take_defaults():
+    params = BridgeParams.from_variables({})
+    assert params.nspan == 3 and params.rtl == 110.98 and params.capt == 110.0
+    assert params == BridgeParams.from_variables({"RTL": 110.98})._replace(deck_rtl=110.0)
+
+
+# ── Validation ────────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("name, raw", [
+    ("SPAN1", "twelve"),
+    ("NSPAN", "3 spans"),
+    ("RTL", None),
+    ("SKEW", [15]),
+    ("NSPAN", float("inf")),
+])
+def test_bad_value_is_rejected_with_its_variable_name(name, raw):
+    with pytest.raises(ValueError, match="^" + re.escape(f"{name}: expected a number, got {raw!r}")):
+        BridgeParams.from_variables({"SPAN1": 12, name: raw})
+
+
+def test_zero_scale2_is_rejected():
+    with pytest.raises(ValueError, match="^SCALE2"):
+        BridgeParams.from_variables({"SCALE2": 0})
+
+
+def test_generator_refuses_bad_workbook_values():
+    gen = BridgeGADGenerator(use_cache=False)
+    assert gen.load_variables({"SPAN1": "twelve"}) is False
+
+
+# ── Per-stage RTL default ─────────────────────────────────────────────────────
+
+def test_deck_rtl_follows_rtl_when_given():
+    assert BridgeParams.from_variables({"RTL": 112.5}).deck_rtl == 112.5
+    assert BridgeParams.from_variables({}).deck_rtl == 110.0
+
+
+def test_superstructure_without_rtl_draws_at_110():
+    # The superstructure stage always fell back to RTL 110, the others to 110.98
+    assert _stage_points({}, "draw_bridge_superstructure") == \
+        _stage_points({"RTL": 110}, "draw_bridge_superstructure")
+    assert _stage_points({}, "draw_bridge_superstructure") != \
+        _stage_points({"RTL": 110.98}, "draw_bridge_superstructure")
+
+
+def test_abutments_without_rtl_draw_at_110_98():
+    assert _stage_points({}, "draw_left_abutment") == _stage_points({"RTL": 110.98}, "draw_left_abutment")
@@ -0,0 +1,151 @@
+"""CalcEngine: compiler whitelist, dependency propagation, cycles and sweeps."""
+
+import logging
+
+import numpy as np
+import pytest
+
+from bridge_gad.calc_engine import CalcEngine, FormulaError, compile_formula
+
+
+# ── Compiler ──────────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("formula", [
+    "SPAN1.real",
+    "SPAN1[0]",
+    "(lambda: 1)()",
+    "open('x')",
+    "SPAN1 + 'a'",
+    "__import__",
+    "[SPAN1]",
+    "SPAN1 +",
+])
+def test_whitelist_rejects(formula):
+    with pytest.raises(FormulaError):
+        compile_formula(formula, "X")
+
+
+def test_rejected_formula_leaves_engine_unchanged():
+    engine = CalcEngine()
+    engine.register_formula("A", "B + 1")
+    with pytest.raises(FormulaError):
+        engine.register_formula("A", "B.__class__")
+    engine.set("B", 1)
+    assert engine.recalculate()["A"] == 2
+
+
+def test_names_are_upper_cased_and_builtins_excluded():
+    compiled = compile_formula("Sqrt(span1) + MAX(nspan, 2) * pi")
+    assert compiled.names == {"SPAN1", "NSPAN"}
+    assert eval(compiled.code, {"__builtins__": {}, "sqrt": np.sqrt, "max": max, "pi": np.pi},
+                {"SPAN1": 16.0, "NSPAN": 1.0}) == pytest.approx(4 + 2 * np.pi)
+
+
+# ── Propagation ───────────────────────────────────────────────────────────────
+
+def _bridge_engine():
+    engine = CalcEngine.with_bridge_defaults()
+    engine.load({"SPAN1": 20, "NSPAN": 3, "LEFT": 0, "TOPRL": 110, "SLBTHE": 0.75, "DATUM": 100})
+    engine.recalculate()
+    return engine
+
+
+def test_change_propagates_transitively():
+    engine = _bridge_engine()
+    assert engine.get("RIGHT") == 60
+    engine.set("SPAN1", 25)
+    values = engine.recalculate()
+    assert values["LBRIDGE"] == 75 and values["RIGHT"] == 75
+
+
+def test_only_affected_formulas_are_evaluated():
+    engine = _bridge_engine()
+    calls = []
+    for name in ("LBRIDGE", "RIGHT", "CAPT", "SOFL"):
+        engine.register_callback(name, lambda value, name=name: calls.append(name))
+    engine.set("LEFT", 5)
+    engine.recalculate()
+    assert calls == ["RIGHT"]
+    engine.set("NSPAN", 3)  # unchanged value: nothing is dirty
+    engine.recalculate()
+    assert calls == ["RIGHT"]
+
+
+def test_unchanged_intermediate_stops_propagation():
+    engine = CalcEngine()
+    engine.register_formula("B", "min(A, 10)")
+    engine.register_formula("C", "B * 2")
+    engine.set("A", 20)
+    engine.recalculate()
+    calls = []
+    engine.register_callback("C", calls.append)
+    engine.set("A", 30)  # B stays 10, so C is not re-evaluated
+    engine.recalculate()
+    assert calls == [] and engine.get("C") == 20
+
+
+def test_setting_a_formula_output_is_recomputed():
+    engine = _bridge_engine()
+    engine.set("LBRIDGE", 1000)
+    values = engine.recalculate()
+    assert values["LBRIDGE"] == 60 and values["RIGHT"] == 60
+
+
+def test_cycle_is_left_out_and_rest_evaluated(caplog):
+    engine = CalcEngine()
+    engine.register_formula("A", "B + 1")
+    engine.register_formula("B", "A + 1")
+    engine.register_formula("C", "D * 2")
+    engine.set("D", 4)
+    with caplog.at_level(logging.WARNING, logger="bridge_gad.calc_engine"):
+        values = engine.recalculate()
+    assert values["C"] == 8
+    assert "A" not in values and "B" not in values
+    assert "Circular dependency" in caplog.text
+
+
+def test_reregistering_updates_the_graph():
+    engine = CalcEngine()
+    engine.register_formula("A", "B + 1")
+    engine.set("B", 1)
+    engine.set("C", 10)
+    engine.recalculate()
+    engine.register_formula("A", "C + 1")
+    assert engine.recalculate()["A"] == 11
+    engine.set("B", 100)  # no longer read by A
+    assert engine.recalculate()["A"] == 11
+    engine.set("C", 20)
+    assert engine.recalculate()["A"] == 21
+
+
+# ── Sweep ─────────────────────────────────────────────────────────────────────
+
+def _scalar(engine, inputs):
+    for name, value in inputs.items():
+        engine.set(name, float(value))
+    return engine.recalculate()
+
+
+def test_sweep_matches_scalar_results():
+    engine = _bridge_engine()
+    engine.register_formula("CLASS", "2 if LBRIDGE > 60 and not NSPAN == 4 else (1 if 10 < SPAN1 <= 20 else 0)")
+    engine.register_formula("ROOT", "sqrt(max(LBRIDGE, 50)) + round(abs(LEFT - 1.5))")
+    engine.recalculate()
+    spans, nspans = np.arange(8, 31, 3), [2, 3, 4]
+    df = engine.sweep({"SPAN1": spans, "NSPAN": nspans}, grid=True)
+    assert len(df) == len(spans) * len(nspans)
+
+    scalar = _bridge_engine()
+    scalar.register_formula("CLASS", engine._formulas["CLASS"])
+    scalar.register_formula("ROOT", engine._formulas["ROOT"])
+    for _, row in df.iterrows():
+        expected = _scalar(scalar, {"SPAN1": row["SPAN1"], "NSPAN": row["NSPAN"]})
+        for name in ("LBRIDGE", "RIGHT", "CLASS", "ROOT"):
+            assert row[name] == pytest.approx(expected[name]), name
+
+
+def test_sweep_broadcasts_and_leaves_engine_alone():
+    engine = _bridge_engine()
+    df = engine.sweep({"SPAN1": [10, 20, 30], "NSPAN": 2})
+    assert list(df["LBRIDGE"]) == [20, 40, 60]
+    assert engine.get("LBRIDGE") == 60 and engine.get("SPAN1") == 20
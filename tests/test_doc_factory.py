@@ -0,0 +1,139 @@
+"""Prototype DXF documents: copies are independent and match a freshly built document."""
+
+import datetime
+import io
+import re
+import types
+
+import ezdxf
+import pytest
+from ezdxf.tools.juliandate import juliandate
+
+from bridge_gad import doc_factory
+from bridge_gad.doc_factory import clear_prototypes, new_document, new_gad_document, new_sheet_document
+
+# Julian dates, GUIDs and the ezdxf writer stamp differ between any two builds
+_VOLATILE = re.compile(r"^(24\d{5}\.\d+|\{[0-9A-F-]{36}\}|\S+ @ \d{4}-\d\d-\d\dT\S+)$", re.M)
+
+
+@pytest.fixture(autouse=True)
+def fresh_prototypes():
+    clear_prototypes()
+    yield
+    clear_prototypes()
+
+
+def _legacy_gad_document(acad_version):
+    """What BridgeGADGenerator.setup_document built before the factory."""
+    doc = ezdxf.new(acad_version, setup=True)
+    if "Arial" not in doc.styles:
+        doc.styles.new("Arial", dxfattribs={'font': 'Arial.ttf'})
+    if "PMB100" not in doc.dimstyles:
+        dimstyle = doc.dimstyles.new('PMB100')
+        dimstyle.dxf.dimasz = 150
+        dimstyle.dxf.dimtdec = 0
+        dimstyle.dxf.dimexe = 400
+        dimstyle.dxf.dimexo = 400
+        dimstyle.dxf.dimlfac = 1
+        dimstyle.dxf.dimtxsty = "Arial"
+        dimstyle.dxf.dimtxt = 400
+        dimstyle.dxf.dimtad = 0
+    return doc
+
+
+def _table(table):
+    return {
+        entry.dxf.name: {k: v for k, v in entry.dxf.all_existing_dxf_attribs().items() if k not in ("handle", "owner")}
+        for entry in table
+    }
+
+
+def _dxf_text(doc):
+    stream = io.StringIO()
+    doc.write(stream)
+    return _VOLATILE.sub("*", stream.getvalue())
+
+
+# ── Same content as a fresh build ─────────────────────────────────────────────
+
+@pytest.mark.parametrize("acad_version", ["R2010", "R2018"])
+def test_gad_copies_match_a_fresh_build(acad_version):
+    new_gad_document(acad_version)                    # builds the prototype
+    copy = new_gad_document(acad_version)             # served from the pickle
+    legacy = _legacy_gad_document(acad_version)
+    assert copy.dxfversion == legacy.dxfversion
+    for name in ("styles", "dimstyles", "linetypes", "layers"):
+        assert _table(getattr(copy, name)) == _table(getattr(legacy, name)), name
+    assert _dxf_text(copy) == _dxf_text(legacy)
+
+
+def test_sheet_copies_match_a_fresh_build():
+    new_sheet_document("R2010")
+    assert _dxf_text(new_sheet_document("R2010")) == _dxf_text(ezdxf.new("R2010"))
+
+
+# ── Copies are independent ────────────────────────────────────────────────────
+
+def test_copies_do_not_share_state():
+    first = new_gad_document("R2010")
+    first.modelspace().add_line((0, 0), (1, 1))
+    first.layers.add("ONLY_FIRST")
+    first.styles.get("Arial").dxf.font = "changed.ttf"
+
+    second = new_gad_document("R2010")
+    second.modelspace().add_circle((0, 0), 1)
+    third = new_gad_document("R2010")
+
+    assert len(third.modelspace()) == 0
+    assert "ONLY_FIRST" not in second.layers and "ONLY_FIRST" not in third.layers
+    assert third.styles.get("Arial").dxf.font == "Arial.ttf"
+    assert third.entitydb is not second.entitydb
+    assert not third.audit().has_errors
+
+
+def test_copies_get_their_own_identity(monkeypatch):
+    prototype = new_gad_document("R2010")
+    later = datetime.datetime(2031, 5, 6, 7, 8, 9)
+
+    class _Clock(datetime.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return later
+
+    monkeypatch.setattr(doc_factory, "datetime", types.SimpleNamespace(datetime=_Clock))
+    copies = [new_gad_document("R2010") for _ in range(2)]
+
+    for doc in copies:
+        assert doc.header["$TDCREATE"] == pytest.approx(juliandate(later))
+    for key in ("$FINGERPRINTGUID", "$VERSIONGUID"):
+        assert len({doc.header[key] for doc in [prototype, *copies]}) == 3, key
+
+
+def test_prototypes_are_per_version_and_kind():
+    assert new_gad_document("R2010").dxfversion == "AC1024"
+    assert new_gad_document("R2018").dxfversion == "AC1032"
+    assert "PMB100" not in new_sheet_document("R2010").dimstyles
+
+
+# ── Builder calls ─────────────────────────────────────────────────────────────
+
+def test_builder_runs_once_per_key():
+    calls = []
+    for _ in range(3):
+        new_document("counted", lambda: calls.append(1) or ezdxf.new("R2010"))
+    assert len(calls) == 1
+
+
+def test_unpicklable_prototype_is_rebuilt_per_use(monkeypatch):
+    calls = []
+
+    def build():
+        calls.append(1)
+        doc = ezdxf.new("R2010")
+        doc.unpicklable = lambda: None
+        return doc
+
+    docs = [new_document("unpicklable", build) for _ in range(3)]
+    assert len(calls) == 3
+    assert doc_factory._prototypes["unpicklable"] is None
+    assert len({id(doc) for doc in docs}) == 3
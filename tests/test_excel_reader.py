@@ -0,0 +1,208 @@
+"""Workbook reader: the xlsx XML fast path, its fallbacks, and parity with pd.read_excel."""
+
+import io
+import math
+import struct
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from bridge_gad import excel_reader
+from bridge_gad.excel_reader import read_parameters, read_rows
+
+INPUTS = Path(__file__).resolve().parent.parent / "inputs"
+
+
+def _legacy_parameters(source):
+    """The reader this module replaced: pd.read_excel → set_index('Variable')['Value']."""
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    df = pd.read_excel(source, header=None)
+    if str(df.iloc[0, 0]).strip().lower() in ("value", "variable"):
+        df = df.iloc[1:].reset_index(drop=True)
+    if df.shape[1] < 3:
+        return None
+    df = df.iloc[:, :3]
+    df.columns = ["Value", "Variable", "Description"]
+    # Rows without a variable name were NaN keys nobody could look up
+    return {k: v for k, v in df.set_index("Variable")["Value"].to_dict().items() if not pd.isna(k)}
+
+
+def _same(a, b):
+    """Equal as the drawing code sees them: NaN == NaN, numpy scalars == Python numbers."""
+    if isinstance(a, float) and math.isnan(a):
+        return pd.isna(b)
+    return a == b
+
+
+def _assert_parity(source):
+    legacy = _legacy_parameters(source)
+    fast = read_parameters(source)
+    assert list(fast) == list(legacy)
+    mismatched = {k: (fast[k], legacy[k]) for k in legacy if not _same(fast[k], legacy[k])}
+    assert not mismatched
+
+
+# ── Parity with pd.read_excel ─────────────────────────────────────────────────
+
+@pytest.mark.parametrize("path", sorted(INPUTS.glob("*.xlsx")), ids=lambda p: p.name)
+def test_input_workbooks_match_pandas(path):
+    _assert_parity(path)
+    _assert_parity(path.read_bytes())
+
+
+_CONTENT_TYPES = (
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/data.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/sharedStrings.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+    '</Types>'
+)
+_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PACKAGE_RELS = (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Id="rId1" Type="{_REL}/officeDocument" Target="xl/workbook.xml"/></Relationships>'
+)
+_WORKBOOK = (
+    f'<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns:r="{_REL}">'
+    '<sheets><sheet name="Params" sheetId="1" r:id="rId7"/></sheets></workbook>'
+)
+_WORKBOOK_RELS = (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Id="rId7" Type="{_REL}/worksheet" Target="worksheets/data.xml"/>'
+    f'<Relationship Id="rId8" Type="{_REL}/sharedStrings" Target="sharedStrings.xml"/></Relationships>'
+)
+# Plain, rich-text (two runs) and phonetic-hinted shared strings
+_SHARED_STRINGS = (
+    '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<si><t>SPAN1</t></si>'
+    '<si><r><t>Span </t></r><r><rPr><b/></rPr><t>length</t></r><rPh sb="0" eb="4"><t>x</t></rPh></si>'
+    '<si><t>TOL</t></si></sst>'
+)
+
+
+def _cell(ref, kind, inner):
+    return f'<c r="{ref}"' + (f' t="{kind}"' if kind else "") + f">{inner}</c>"
+
+
+def _inline(ref, text):
+    return _cell(ref, "inlineStr", f"<is><t>{text}</t></is>")
+
+
+def _hand_written_xlsx() -> bytes:
+    """An xlsx as other tools write it: inline strings, a non-default sheet path, a gap row."""
+    rows = [
+        (1, [_inline("A1", "Value"), _inline("B1", "Variable"), _inline("C1", "Description")]),
+        (2, [_cell("A2", None, "<v>12</v>"), _cell("B2", "s", "<v>0</v>"), _cell("C2", "s", "<v>1</v>")]),
+        (3, [_inline("A3", "R2010"), _inline("B3", "ACAD"), _inline("C3", "Version")]),
+        (4, [_cell("A4", "b", "<v>1</v>"), _cell("B4", "str", '<f>UPPER("flag")</f><v>FLAG</v>'),
+             _inline("C4", "Formula string")]),
+        (5, [_cell("A5", None, "<v>1.5E-05</v>"), _cell("B5", "s", "<v>2</v>"), _inline("C5", "Exponent")]),
+        (7, [_cell("A7", None, "<v>-3.25</v>"), _inline("B7", "LEFT"), _inline("C7", "After a gap")]),
+        (8, [_inline("B8", "BLANK"), _inline("C8", "No value")]),
+        (9, [_cell("A9", None, "<v>4</v>"), _inline("C9", "No variable")]),
+    ]
+    sheet = (
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+        + "".join(f'<row r="{n}">{"".join(cells)}</row>' for n, cells in rows)
+        + "</sheetData></worksheet>"
+    )
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, xml in [
+            ("[Content_Types].xml", _CONTENT_TYPES), ("_rels/.rels", _PACKAGE_RELS),
+            ("xl/workbook.xml", _WORKBOOK), ("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS),
+            ("xl/sharedStrings.xml", _SHARED_STRINGS), ("xl/worksheets/data.xml", sheet),
+        ]:
+            zf.writestr(name, xml)
+    return buf.getvalue()
+
+
+def test_shared_inline_and_formula_strings_match_pandas():
+    data = _hand_written_xlsx()
+    _assert_parity(data)
+    assert read_rows(data)[1] == [12, "SPAN1", "Span length"]  # rich-text runs joined, phonetics skipped
+    assert read_rows(data)[5] == []                           # the gap row is kept
+    params = read_parameters(data)
+    assert params["ACAD"] == "R2010" and params["FLAG"] is True and params["TOL"] == 1.5e-05
+    assert math.isnan(params["BLANK"]) and 4 not in params.values()
+
+
+def test_number_formats_yield_stored_values(tmp_path):
+    wb = Workbook()
+    ws = wb.active
+    for value, name, number_format in [
+        (0.125, "RATIO", "0.00%"), (12345.678, "LENGTH", "#,##0.00"), (0.00042, "EPS", "0.00E+00"),
+        (7, "COUNT", "0"), (110.98, "RTL", "0.000"), (-2.5, "OFFSET", "0.0;[Red]-0.0"),
+    ]:
+        ws.append([value, name, number_format])
+        ws.cell(ws.max_row, 1).number_format = number_format
+    path = tmp_path / "formats.xlsx"
+    wb.save(path)
+    _assert_parity(path)
+    assert read_parameters(path) == {
+        "RATIO": 0.125, "LENGTH": 12345.678, "EPS": 0.00042, "COUNT": 7, "RTL": 110.98, "OFFSET": -2.5,
+    }
+
+
+def test_dates_are_read_as_serial_numbers(tmp_path):
+    # Documented difference: the fast path does not apply date formats
+    wb = Workbook()
+    wb.active.append([datetime(2024, 1, 1), "DATE", "Survey date"])
+    path = tmp_path / "date.xlsx"
+    wb.save(path)
+    assert read_parameters(path) == {"DATE": 45292}
+
+
+# ── Fallbacks ─────────────────────────────────────────────────────────────────
+
+def test_unreadable_xml_falls_back_to_openpyxl(monkeypatch):
+    data = (INPUTS / "sample_input.xlsx").read_bytes()
+    expected = read_rows(data)
+
+    def broken(source):
+        source.read(10)  # the fallback must rewind the stream
+        raise KeyError("first worksheet not found")
+
+    monkeypatch.setattr(excel_reader, "_read_rows_xml", broken)
+    stream = io.BytesIO(data)
+    assert read_rows(stream) == expected
+    assert read_parameters(data) == _legacy_parameters(data)
+
+
+def _biff_record(record_type, data):
+    return struct.pack("<HH", record_type, len(data)) + data
+
+
+def _xls(rows) -> bytes:
+    """A BIFF2 worksheet stream (legacy .xls) with NUMBER and LABEL cells."""
+    records = [_biff_record(0x0009, struct.pack("<HH", 7, 0x10)), _biff_record(0x0042, struct.pack("<H", 1252))]
+    for r, row in enumerate(rows):
+        for c, value in enumerate(row):
+            if isinstance(value, str):
+                text = value.encode("cp1252")
+                records.append(_biff_record(0x0004, struct.pack("<HH3sB", r, c, b"\0\0\0", len(text)) + text))
+            else:
+                records.append(_biff_record(0x0003, struct.pack("<HH3sd", r, c, b"\0\0\0", value)))
+    records.append(_biff_record(0x000A, b""))
+    return b"".join(records)
+
+
+def test_xls_goes_through_pandas(monkeypatch):
+    data = _xls([["Value", "Variable", "Description"], [12.0, "SPAN1", "Span"], [3.0, "NSPAN", "Spans"],
+                 ["R2010", "ACAD", "Version"]])
+    calls = []
+    monkeypatch.setattr(excel_reader, "_read_rows_pandas",
+                        lambda source, _read=excel_reader._read_rows_pandas: calls.append(1) or _read(source))
+    _assert_parity(data)
+    assert read_parameters(data) == {"SPAN1": 12, "NSPAN": 3, "ACAD": "R2010"}
+    assert calls
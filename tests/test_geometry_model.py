@@ -0,0 +1,34 @@
+"""Per-document geometry cache invalidation."""
+
+import ezdxf
+
+from bridge_gad.geometry_model import get_geometry, invalidate_geometry
+
+
+def test_cached_until_the_modelspace_changes():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 1))
+    first = get_geometry(doc)
+    assert get_geometry(doc) is first
+    msp.add_line((0, 0), (5, 5))
+    assert len(get_geometry(doc).lines) == 2
+
+
+def test_add_and_delete_with_unchanged_count_is_detected():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    old = msp.add_line((0, 0), (1, 1))
+    assert get_geometry(doc).bounds == (0, 0, 1, 1)
+    msp.delete_entity(old)
+    msp.add_line((0, 0), (9, 9))
+    assert get_geometry(doc).bounds == (0, 0, 9, 9)
+
+
+def test_in_place_edit_needs_explicit_invalidation():
+    doc = ezdxf.new()
+    line = doc.modelspace().add_line((0, 0), (1, 1))
+    get_geometry(doc)
+    line.dxf.end = (4, 4)
+    invalidate_geometry(doc)
+    assert get_geometry(doc).bounds == (0, 0, 4, 4)
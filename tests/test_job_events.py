@@ -0,0 +1,197 @@
+"""Redis job event relay: per-event handler tasks, failures and reconnects."""
+
+import asyncio
+import json
+
+from bridge_gad.job_events import REDIS_CHANNEL_PREFIX, JobEventBus, RedisEventRelay
+
+
+class _FakePubSub:
+    """Replays queued messages; ``None`` in the queue ends the subscription."""
+
+    def __init__(self, redis):
+        self._redis = redis
+
+    async def psubscribe(self, pattern):
+        self._redis.subscriptions += 1
+        if self._redis.fail_subscribes:
+            self._redis.fail_subscribes -= 1
+            raise ConnectionError("connection refused")
+
+    async def listen(self):
+        while True:
+            message = await self._redis.messages.get()
+            if message is None:
+                return
+            if isinstance(message, Exception):
+                raise message
+            yield message
+
+    async def close(self):
+        pass
+
+
+class _FakeRedis:
+    def __init__(self, fail_subscribes=0):
+        self.messages: asyncio.Queue = asyncio.Queue()
+        self.subscriptions = 0
+        self.fail_subscribes = fail_subscribes
+
+    def pubsub(self):
+        return _FakePubSub(self)
+
+    def send(self, job_id, data):
+        if not isinstance(data, (str, bytes)):
+            data = json.dumps(data)
+        self.messages.put_nowait({
+            "type": "pmessage",
+            "channel": f"{REDIS_CHANNEL_PREFIX}{job_id}".encode(),
+            "data": data,
+        })
+
+
+class _RecordingBus(JobEventBus):
+    def __init__(self):
+        super().__init__()
+        self.received = []
+
+    def publish(self, job_id, event):
+        self.received.append((job_id, event))
+        super().publish(job_id, event)
+
+
+async def _until(predicate, timeout=2.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_slow_handler_does_not_block_other_jobs():
+    async def scenario():
+        release = asyncio.Event()
+
+        async def on_event(job_id, event):
+            if job_id == "slow":
+                await release.wait()
+
+        bus = _RecordingBus()
+        received = bus.received
+        redis = _FakeRedis()
+        relay = RedisEventRelay(bus, on_event=on_event)
+        relay.start(redis)
+        redis.send("slow", {"status": "complete"})
+        redis.send("fast", {"status": "running", "progress": 10})
+        await _until(lambda: any(jid == "fast" for jid, _ in received))
+        assert not any(jid == "slow" for jid, _ in received)
+        release.set()
+        await _until(lambda: any(jid == "slow" for jid, _ in received))
+        await relay.stop()
+
+    _run(scenario())
+
+
+def test_malformed_message_is_skipped():
+    async def scenario():
+        bus = _RecordingBus()
+        received = bus.received
+        redis = _FakeRedis()
+        relay = RedisEventRelay(bus)
+        relay.start(redis)
+        redis.send("j1", "{not json")
+        redis.send("j1", "[1, 2]")
+        redis.send("j1", {"status": "running"})
+        await _until(lambda: received)
+        await relay.stop()
+        assert received == [("j1", {"status": "running"})]
+
+    _run(scenario())
+
+
+def test_handler_failure_still_publishes():
+    async def scenario():
+        def on_event(job_id, event):
+            raise RuntimeError("store unavailable")
+
+        bus = _RecordingBus()
+        received = bus.received
+        redis = _FakeRedis()
+        relay = RedisEventRelay(bus, on_event=on_event)
+        relay.start(redis)
+        redis.send("j1", {"status": "complete"})
+        await _until(lambda: received)
+        await relay.stop()
+        assert received == [("j1", {"status": "complete"})]
+
+    _run(scenario())
+
+
+def test_handler_can_replace_event():
+    async def scenario():
+        async def on_event(job_id, event):
+            return {**event, "status": "failed", "error": "no result"}
+
+        bus = _RecordingBus()
+        received = bus.received
+        redis = _FakeRedis()
+        relay = RedisEventRelay(bus, on_event=on_event)
+        relay.start(redis)
+        redis.send("j1", {"status": "complete", "progress": 100})
+        await _until(lambda: received)
+        await relay.stop()
+        assert received == [("j1", {"status": "failed", "progress": 100, "error": "no result"})]
+
+    _run(scenario())
+
+
+def test_relay_resubscribes_after_connection_loss():
+    async def scenario():
+        bus = _RecordingBus()
+        received = bus.received
+        redis = _FakeRedis(fail_subscribes=1)
+        relay = RedisEventRelay(bus, retry_delay=0.01)
+        relay.start(redis)
+        redis.messages.put_nowait(ConnectionError("connection reset"))
+        redis.send("j1", {"status": "running"})
+        await _until(lambda: received)
+        assert relay.running
+        assert redis.subscriptions == 3  # refused, dropped, then up
+        assert relay.reconnects == 2
+        await relay.stop()
+        assert not relay.running
+
+    _run(scenario())
+
+
+# ── API handler ───────────────────────────────────────────────────────────────
+
+def _worker_event(monkeypatch, fetch):
+    from bridge_gad import api
+
+    monkeypatch.setattr(api, "_fetch_arq_result", fetch)
+    api._jobs.create("arq-job", status="running")
+    relayed = _run(api._on_worker_event("arq-job", {"status": "complete", "progress": 100}))
+    return relayed, api._jobs.get("arq-job")
+
+
+def test_unfetchable_result_fails_the_job(monkeypatch):
+    async def fetch(job_id):
+        raise TimeoutError("result not stored")
+
+    relayed, meta = _worker_event(monkeypatch, fetch)
+    assert meta["status"] == "failed" and "TimeoutError" in meta["error"]
+    assert relayed["status"] == "failed" and relayed["progress"] == 100
+
+
+def test_fetched_result_completes_the_job(monkeypatch):
+    async def fetch(job_id):
+        return {"success": True, "output_bytes": b"0\nEOF\n"}
+
+    relayed, meta = _worker_event(monkeypatch, fetch)
+    assert relayed is None
+    assert meta["status"] == "complete" and meta["result_size"] == 6
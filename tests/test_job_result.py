@@ -0,0 +1,118 @@
+"""GET/HEAD /jobs/{id}/result: ETag, Range, If-Range and evicted results."""
+
+import hashlib
+
+import pytest
+
+from bridge_gad.job_store import MemoryJobStore
+
+DATA = bytes(range(256)) * 4  # 1024 bytes
+ETAG = f'"{hashlib.sha256(DATA).hexdigest()}"'
+URL = "/jobs/j1/result"
+
+
+@pytest.fixture
+def store(monkeypatch):
+    from bridge_gad import api
+
+    store = MemoryJobStore()
+    monkeypatch.setattr(api, "_jobs", store)
+    store.create("j1", status="running", output_format="dxf")
+    store.set_result("j1", DATA, status="complete")
+    return store
+
+
+@pytest.fixture
+def client(store):
+    from fastapi.testclient import TestClient
+
+    from bridge_gad import api
+
+    return TestClient(api.app)
+
+
+def test_full_body_with_etag(client):
+    response = client.get(URL)
+    assert response.status_code == 200
+    assert response.content == DATA
+    assert response.headers["ETag"] == ETAG
+    assert response.headers["Content-Length"] == str(len(DATA))
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert response.headers["Content-Type"] == "application/dxf"
+
+
+def test_matching_if_none_match_is_304(client):
+    response = client.get(URL, headers={"If-None-Match": f'"other", {ETAG}'})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == ETAG
+    assert client.get(URL, headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_single_range_is_206(client):
+    response = client.get(URL, headers={"Range": "bytes=100-199"})
+    assert response.status_code == 206
+    assert response.content == DATA[100:200]
+    assert response.headers["Content-Range"] == f"bytes 100-199/{len(DATA)}"
+    assert response.headers["Content-Length"] == "100"
+
+
+def test_open_ended_range_runs_to_the_end(client):
+    response = client.get(URL, headers={"Range": "bytes=1000-5000"})
+    assert response.status_code == 206
+    assert response.content == DATA[1000:]
+    assert response.headers["Content-Range"] == f"bytes 1000-1023/{len(DATA)}"
+    assert client.get(URL, headers={"Range": "bytes=1000-"}).content == DATA[1000:]
+
+
+def test_suffix_range_is_the_last_bytes(client):
+    response = client.get(URL, headers={"Range": "bytes=-24"})
+    assert response.status_code == 206
+    assert response.content == DATA[-24:]
+    assert response.headers["Content-Range"] == f"bytes 1000-1023/{len(DATA)}"
+    # A suffix longer than the result is the whole result
+    assert client.get(URL, headers={"Range": "bytes=-5000"}).content == DATA
+
+
+@pytest.mark.parametrize("header", ["bytes=1024-", "bytes=200-100", "bytes=-0"])
+def test_unsatisfiable_range_is_416(client, header):
+    response = client.get(URL, headers={"Range": header})
+    assert response.status_code == 416
+    assert response.headers["Content-Range"] == f"bytes */{len(DATA)}"
+
+
+def test_multi_range_is_answered_with_the_whole_body(client):
+    response = client.get(URL, headers={"Range": "bytes=0-9,20-29"})
+    assert response.status_code == 200
+    assert response.content == DATA
+
+
+def test_if_range_mismatch_ignores_the_range(client):
+    response = client.get(URL, headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+    assert response.status_code == 200
+    assert response.content == DATA
+    response = client.get(URL, headers={"Range": "bytes=0-9", "If-Range": ETAG})
+    assert response.status_code == 206
+    assert response.content == DATA[:10]
+
+
+def test_head_sends_headers_only(client):
+    response = client.head(URL, headers={"Range": "bytes=0-99"})
+    assert response.status_code == 206
+    assert response.content == b""
+    assert response.headers["Content-Length"] == "100"
+    assert response.headers["Content-Range"] == f"bytes 0-99/{len(DATA)}"
+    assert client.head(URL).headers["Content-Length"] == str(len(DATA))
+
+
+def test_evicted_result_is_410(client, store):
+    store._delete_blob("j1")  # metadata outlived the blob (e.g. evicted over budget)
+    response = client.get(URL)
+    assert response.status_code == 410
+    assert "evicted" in response.json()["detail"]
+
+
+def test_unfinished_and_unknown_jobs(client, store):
+    store.create("j2", status="running")
+    assert client.get("/jobs/j2/result").status_code == 409
+    assert client.get("/jobs/missing/result").status_code == 404
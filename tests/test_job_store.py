@@ -0,0 +1,140 @@
+"""Job store eviction (TTL, byte budget) and restart handling, both backends."""
+
+import pytest
+
+from bridge_gad.job_store import MemoryJobStore, SQLiteJobStore
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_store(request, tmp_path):
+    def make(**kwargs):
+        if request.param == "sqlite":
+            return SQLiteJobStore(tmp_path, **kwargs)
+        return MemoryJobStore(**kwargs)
+
+    return make
+
+
+def _age(store, job_id, seconds):
+    """Move a job's last update ``seconds`` into the past."""
+    if isinstance(store, SQLiteJobStore):
+        store._db.execute("UPDATE jobs SET updated_at = updated_at - ? WHERE job_id = ?", (seconds, job_id))
+        store._db.commit()
+    else:
+        store._meta[job_id]["updated_at"] -= seconds
+
+
+# ── TTL ───────────────────────────────────────────────────────────────────────
+
+def test_ttl_expires_finished_jobs_only(make_store):
+    store = make_store(ttl=60)
+    for job_id, status in [("done", "complete"), ("failed", "failed"), ("queued", "queued"), ("running", "running")]:
+        store.create(job_id, status=status)
+        _age(store, job_id, 120)
+    store.set_result("done", b"dxf")
+    _age(store, "done", 120)
+
+    assert store.evict(force=True) == 2
+    assert store.get("done") is None and store.get_result("done") is None
+    assert store.get("failed") is None
+    assert store.get("queued")["status"] == "queued"  # e.g. a batch tail still waiting
+    assert store.get("running")["status"] == "running"
+    assert store.stored_bytes() == 0
+
+
+def test_ttl_keeps_recent_finished_jobs(make_store):
+    store = make_store(ttl=60)
+    store.create("recent", status="complete")
+    assert store.evict(force=True) == 0
+    assert store.get("recent") is not None
+
+
+# ── Byte budget ───────────────────────────────────────────────────────────────
+
+def test_budget_evicts_oldest_finished_results(make_store):
+    store = make_store(ttl=0, max_bytes=10)
+    for n, job_id in enumerate(["a", "b", "c"]):
+        store.create(job_id, status="running")
+        store.set_result(job_id, b"x" * 4, status="complete")
+        _age(store, job_id, 30 - n)  # a oldest
+    store.create("busy", status="running")
+    store.set_result("busy", b"y" * 4)  # still running: never evicted
+
+    store.evict(force=True)
+    assert store.get("busy") is not None
+    assert store.get("a") is None and store.get("b") is None
+    assert store.get("c") is not None
+    assert store.stored_bytes() <= 10
+
+
+def test_routine_eviction_is_throttled_unless_over_budget(make_store):
+    store = make_store(ttl=60, max_bytes=1000)
+    store.create("old", status="complete")  # runs a routine pass
+    _age(store, "old", 120)
+    store.create("new")                     # within a second: skipped
+    assert store.get("old") is not None
+    assert store.evict(force=True) == 1
+    assert store.get("old") is None
+
+
+# ── Restart (SQLite) ──────────────────────────────────────────────────────────
+
+def test_restart_fails_only_jobs_of_exited_processes(tmp_path):
+    first = SQLiteJobStore(tmp_path)
+    first.create("mine", status="running")
+    first.create("arq", status="queued", backend="arq")
+
+    # Another worker process starting on the same database
+    second = SQLiteJobStore(tmp_path)
+    assert second.get("mine")["status"] == "running"
+
+    first._owner_lock.close()  # the first process exits
+    third = SQLiteJobStore(tmp_path)
+    assert third.get("mine")["status"] == "failed"
+    assert third.get("arq")["status"] == "queued"
+    assert not (tmp_path / "owners" / f"{first.owner}.lock").exists()
+    assert (tmp_path / "owners" / f"{second.owner}.lock").exists()
+
+
+def test_jobs_without_owner_are_failed_on_restart(tmp_path):
+    store = SQLiteJobStore(tmp_path)
+    store.create("legacy", status="running")
+    store._db.execute("UPDATE jobs SET owner = NULL")
+    store._db.commit()
+    assert SQLiteJobStore(tmp_path).get("legacy")["status"] == "failed"
+
+
+# ── Batches ───────────────────────────────────────────────────────────────────
+
+def _age_batch(store, batch_id, seconds):
+    if isinstance(store, SQLiteJobStore):
+        store._db.execute("UPDATE batches SET created_at = created_at - ? WHERE batch_id = ?", (seconds, batch_id))
+        store._db.commit()
+    else:
+        store._batches[batch_id]["created_at"] -= seconds
+
+
+def test_batch_outlives_ttl_while_a_job_is_pending(make_store):
+    store = make_store(ttl=60)
+    store.create("done", status="complete")
+    store.create("waiting", status="queued")
+    store.create_batch("b1", ["done", "waiting"])
+    _age_batch(store, "b1", 120)
+    _age(store, "done", 120)
+    _age(store, "waiting", 120)
+
+    store.evict(force=True)
+    assert store.get("done") is None
+    assert store.get_batch("b1")["job_ids"] == ["done", "waiting"]
+
+    store.update("waiting", status="complete")
+    _age(store, "waiting", 120)
+    store.evict(force=True)
+    assert store.get("waiting") is None and store.get_batch("b1") is None
+
+
+def test_young_batch_is_kept_even_when_its_jobs_are_gone(make_store):
+    store = make_store(ttl=60)
+    store.create_batch("b1", ["evicted-early"])
+    store.evict(force=True)
+    assert store.get_batch("b1") is not None
@@ -0,0 +1,61 @@
+"""Exported figures keep every label: title block, section captions, pier labels."""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+from matplotlib.collections import PathCollection  # noqa: E402
+import pytest  # noqa: E402
+
+from bridge_gad.bridge_generator import BridgeGADGenerator  # noqa: E402
+from bridge_gad.ultimate_exporter import UltimateExporter  # noqa: E402
+
+WORKBOOK = "inputs/23_span_bridge_input.xlsx"
+LABELS = ("GENERAL ARRANGEMENT DRAWING", "SECTION A-A", "SECTION B-B (TYPICAL PIER)", "A1", "A2")
+
+
+@pytest.fixture(scope="module")
+def exporter():
+    gen = BridgeGADGenerator(use_cache=False)
+    assert gen.generate_bytes(WORKBOOK) is not None
+    return UltimateExporter(gen)
+
+
+def _inside(bbox, outer):
+    return outer.x0 - 1 <= bbox.x0 and bbox.x1 <= outer.x1 + 1 and outer.y0 - 1 <= bbox.y0 and bbox.y1 <= outer.y1 + 1
+
+
+def test_glyph_labels_are_inside_the_axes(exporter):
+    fig, ax = exporter._render_figure()
+    try:
+        fig.canvas.draw()
+        x0, x1 = ax.get_xlim()
+        y0, y1 = ax.get_ylim()
+        for text, x, y, _, _ in exporter.geometry.texts():
+            if text in LABELS:
+                assert x0 <= x <= x1 and y0 <= y <= y1, text
+        glyphs = ax.collections[-1]  # added last by draw_geometry
+        assert isinstance(glyphs, PathCollection) and not glyphs.get_clip_on()
+    finally:
+        plt.close(fig)
+
+
+def test_vector_labels_are_text_inside_the_figure(exporter):
+    fig, ax = exporter._render_figure(text_artists=True)
+    try:
+        fig.canvas.draw()
+        renderer = fig.canvas.get_renderer()
+        drawn = {t.get_text(): t for t in ax.texts}
+        for label in LABELS:
+            assert _inside(drawn[label].get_window_extent(renderer), fig.bbox), label
+    finally:
+        plt.close(fig)
+
+
+def test_svg_and_pdf_labels_are_searchable(exporter, tmp_path):
+    paths = exporter.export_all_formats(tmp_path / "gad", formats=["svg", "pdf"])
+    svg = paths["svg"].read_text(encoding="utf-8")
+    for label in LABELS:
+        assert f">{label}<" in svg
+    assert b"/FontFile2" in paths["pdf"].read_bytes()  # TrueType text, not Type 3 glyph procedures
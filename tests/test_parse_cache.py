@@ -0,0 +1,169 @@
+"""Parse cache keys, LRU eviction, copy isolation and per-parser entries."""
+
+import io
+import shutil
+from pathlib import Path
+
+import pytest
+
+from bridge_gad import parse_cache
+from bridge_gad.bridge_generator import BridgeGADGenerator
+from bridge_gad.enhanced_io_utils import SmartInputProcessor
+from bridge_gad.excel_reader import read_parameters
+from bridge_gad.lisp_mirror import _parse_lisp_sheet, read_lisp_sheet
+from bridge_gad.parse_cache import ParseCache, cached_parameters, source_bytes
+
+INPUTS = Path(__file__).resolve().parent.parent / "inputs"
+# Each parser reads this workbook differently, so a shared entry would show
+LISP_PARAMS = INPUTS / "lisp_params.xlsx"
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    cache = ParseCache()
+    monkeypatch.setattr(parse_cache, "_cache", cache)
+    return cache
+
+
+class _Counting:
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    def __call__(self, source):
+        self.calls += 1
+        return self.result
+
+
+# ── Keys ──────────────────────────────────────────────────────────────────────
+
+def test_key_is_content_hash_plus_parser():
+    key = ParseCache.make_key(b"abc", "lisp")
+    assert key == ParseCache.make_key(b"abc", "lisp")
+    assert key != ParseCache.make_key(b"abd", "lisp")
+    assert key != ParseCache.make_key(b"abc", "parameters")
+
+
+def test_renamed_copy_hits_and_changed_content_misses(tmp_path):
+    cache = ParseCache()
+    parse = _Counting({"SPAN1": 12})
+    original = tmp_path / "a.xlsx"
+    original.write_bytes(b"workbook v1")
+    renamed = tmp_path / "renamed.xlsx"
+    shutil.copy(original, renamed)
+
+    cache.get_or_parse(original, "parameters", parse)
+    cache.get_or_parse(renamed, "parameters", parse)
+    cache.get_or_parse(b"workbook v1", "parameters", parse)
+    assert parse.calls == 1 and cache.hits == 2
+
+    original.write_bytes(b"workbook v2")
+    cache.get_or_parse(original, "parameters", parse)
+    assert parse.calls == 2
+
+
+def test_parser_gets_path_or_bytes(tmp_path):
+    seen = []
+    path = tmp_path / "in.xlsx"
+    path.write_bytes(b"xlsx")
+    ParseCache().get_or_parse(path, "a", lambda s: seen.append(s) or {})
+    ParseCache().get_or_parse(io.BytesIO(b"xlsx"), "a", lambda s: seen.append(s) or {})
+    assert seen == [path, b"xlsx"]
+
+
+def test_stream_position_is_preserved():
+    stream = io.BytesIO(b"0123456789")
+    stream.seek(4)
+    assert source_bytes(stream) == b"456789"
+    assert stream.tell() == 4
+
+
+def test_failed_parse_is_not_cached():
+    cache = ParseCache()
+    parse = _Counting(None)
+    assert cache.get_or_parse(b"bad", "parameters", parse) is None
+    assert cache.get_or_parse(b"bad", "parameters", parse) is None
+    assert parse.calls == 2 and cache.stats()["entries"] == 0
+
+
+# ── LRU ───────────────────────────────────────────────────────────────────────
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ParseCache(max_entries=2)
+    cache.put("a", {"v": 1})
+    cache.put("b", {"v": 2})
+    assert cache.get("a") == {"v": 1}   # "b" is now the oldest
+    cache.put("c", {"v": 3})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1} and cache.get("c") == {"v": 3}
+    assert cache.stats()["evictions"] == 1 and cache.stats()["entries"] == 2
+
+
+def test_zero_entries_disables_cache():
+    cache = ParseCache(max_entries=0)
+    parse = _Counting({"v": 1})
+    cache.get_or_parse(b"x", "parameters", parse)
+    cache.get_or_parse(b"x", "parameters", parse)
+    assert parse.calls == 2 and cache.stats()["entries"] == 0
+
+
+# ── Copy isolation ────────────────────────────────────────────────────────────
+
+def test_callers_get_independent_copies():
+    cache = ParseCache()
+    stored = {"SPANS": [10.0, 12.0], "META": {"unit": "m"}}
+    cache.put("k", stored)
+    stored["SPANS"].append(99.0)                 # mutating the input after put
+
+    first = cache.get("k")
+    first["SPANS"].append(14.0)                  # mutating a result, nested
+    first["META"]["unit"] = "mm"
+    first["NEW"] = 1
+
+    assert cache.get("k") == {"SPANS": [10.0, 12.0], "META": {"unit": "m"}}
+
+
+def test_generator_mutation_does_not_leak(fresh_cache):
+    gen = BridgeGADGenerator()
+    assert gen.read_variables_from_excel(INPUTS / "sample_input.xlsx")
+    gen.variables["SCALE1"] = -1
+    assert cached_parameters(INPUTS / "sample_input.xlsx") == read_parameters(INPUTS / "sample_input.xlsx")
+
+
+# ── Parser separation ─────────────────────────────────────────────────────────
+
+def _read_all_three():
+    smart = SmartInputProcessor().read_input(LISP_PARAMS)
+    gen = BridgeGADGenerator()
+    gen.read_variables_from_excel(LISP_PARAMS)
+    generator = cached_parameters(LISP_PARAMS)
+    lisp = read_lisp_sheet(LISP_PARAMS)
+    return smart, generator, lisp
+
+
+def test_parsers_keep_separate_entries(fresh_cache):
+    smart, generator, lisp = _read_all_three()
+    # Ground truth, parsed without the cache
+    assert smart == SmartInputProcessor()._read_by_suffix(LISP_PARAMS)
+    assert generator == read_parameters(LISP_PARAMS)
+    assert lisp == _parse_lisp_sheet(LISP_PARAMS)
+    assert smart != generator and generator != lisp and smart != lisp
+
+    entries = fresh_cache.stats()["entries"]
+    assert entries == 3
+
+    # Warm cache: every parser gets its own shape back, nothing is re-parsed
+    assert _read_all_three() == (smart, generator, lisp)
+    assert fresh_cache.stats()["entries"] == entries
+    assert fresh_cache.hits >= 3
+
+
+def test_smart_reader_separates_by_suffix(fresh_cache, tmp_path):
+    as_csv = tmp_path / "params.csv"
+    as_csv.write_text("key,value\nSPAN1,12\n")
+    as_txt = tmp_path / "params.txt"
+    as_txt.write_bytes(as_csv.read_bytes())
+    processor = SmartInputProcessor()
+    processor.read_input(as_csv)
+    processor.read_input(as_txt)
+    assert fresh_cache.hits == 0 and fresh_cache.stats()["entries"] == 2
@@ -0,0 +1,18 @@
+"""Stage histograms see every pipeline stage, including the file write."""
+
+from bridge_gad.bridge_generator import BridgeGADGenerator
+from bridge_gad.profiling import get_stage_histograms
+
+
+def _count(stage):
+    return get_stage_histograms().snapshot().get(stage, {}).get("count", 0)
+
+
+def test_file_write_reaches_stage_histograms(tmp_path):
+    before = {stage: _count(stage) for stage in ("read", "serialize", "write", "total")}
+    gen = BridgeGADGenerator(use_cache=False)
+    assert gen.generate_complete_drawing({"NSPAN": 2, "SPAN1": 15}, tmp_path / "out.dxf")
+    assert (tmp_path / "out.dxf").stat().st_size > 0
+    assert gen.profile.stages[-1].name == "write"
+    for stage, count in before.items():
+        assert _count(stage) == count + 1, stage
@@ -0,0 +1,45 @@
+"""Redis broker: connect lock per event loop and the circuit breaker."""
+
+import asyncio
+
+from bridge_gad.redis_pool import RedisBroker
+
+
+class _Broker(RedisBroker):
+    """Broker whose connect step is a counted sleep instead of a Redis pool."""
+
+    def __init__(self, fail=False, **kwargs):
+        super().__init__(url="redis://test", **kwargs)
+        self.connects = 0
+        self.fail = fail
+
+    async def _connect(self):
+        self.connects += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise ConnectionError("refused")
+        return object()
+
+
+async def _concurrent_clients(broker, n=5):
+    return await asyncio.gather(*(broker.client() for _ in range(n)))
+
+
+def test_broker_is_usable_from_successive_event_loops():
+    broker = _Broker()
+    first = asyncio.run(_concurrent_clients(broker))
+    assert len({id(c) for c in first}) == 1 and broker.connects == 1
+
+    broker._redis = None  # e.g. closed at shutdown, reconnected by the next app/loop
+    second = asyncio.run(_concurrent_clients(broker))
+    assert len({id(c) for c in second}) == 1 and broker.connects == 2
+
+
+def test_failure_opens_breaker_for_cooldown():
+    broker = _Broker(fail=True, cooldown=60)
+    assert asyncio.run(_concurrent_clients(broker)) == [None] * 5
+    assert broker.connects == 1 and broker.is_open
+    assert asyncio.run(broker.client()) is None and broker.connects == 1
+    broker.record_success()
+    broker.fail = False
+    assert asyncio.run(broker.client()) is not None
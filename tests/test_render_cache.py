@@ -0,0 +1,133 @@
+"""Render cache keys, LRU eviction and the disk tier."""
+
+import re
+
+import pytest
+
+from bridge_gad import render_cache
+from bridge_gad.bridge_generator import BridgeGADGenerator
+from bridge_gad.bridge_params import BridgeParams
+from bridge_gad.render_cache import RenderCache
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    cache = RenderCache()
+    monkeypatch.setattr(render_cache, "_cache", cache)
+    return cache
+
+
+def _render(params):
+    gen = BridgeGADGenerator(use_cache=True)
+    data = gen.generate_bytes(params)
+    assert data is not None
+    return data
+
+
+def _uncached(params):
+    return BridgeGADGenerator(use_cache=False).generate_bytes(params)
+
+
+# Header dates, document GUIDs and the writer stamp change on every save
+_VOLATILE = re.compile(rb"^(24\d{5}\.\d+|\{[0-9A-F-]{36}\}|\S+ @ \d{4}-\d\d-\d\dT\S+)\r?$", re.M)
+
+
+def _stable(data):
+    return _VOLATILE.sub(b"*", data)
+
+
+# ── Keys ──────────────────────────────────────────────────────────────────────
+
+def test_key_follows_what_the_drawing_reads():
+    # The generator reads upper-case keys only: 'span1' is ignored (SPAN1 defaults)
+    a = BridgeParams.from_variables({"NSPAN": 2, "span1": 30})
+    b = BridgeParams.from_variables({"NSPAN": 2, "SPAN1": 30})
+    assert RenderCache.make_key(a, "R2010") != RenderCache.make_key(b, "R2010")
+
+
+def test_key_keeps_text_fields_verbatim():
+    a = BridgeParams.from_variables({"PROJECT_NAME": "7"})
+    b = BridgeParams.from_variables({"PROJECT_NAME": "007"})
+    assert RenderCache.make_key(a, "R2010") != RenderCache.make_key(b, "R2010")
+
+
+def test_key_equal_for_equivalent_inputs():
+    # Same drawing: int vs float value, unused extra variable
+    a = BridgeParams.from_variables({"NSPAN": 3, "SPAN1": 12})
+    b = BridgeParams.from_variables({"NSPAN": 3.0, "SPAN1": 12.0, "NOTES": "x"})
+    assert RenderCache.make_key(a, "R2010") == RenderCache.make_key(b, "R2010")
+    assert RenderCache.make_key(a, "R2010") != RenderCache.make_key(a, "R2010", "pdf")
+
+
+def test_plain_dict_keys_are_not_folded():
+    assert RenderCache.make_key({"span1": 30}, "R2010") != RenderCache.make_key({"SPAN1": 30}, "R2010")
+    assert RenderCache.make_key({"X": "7"}, "R2010") != RenderCache.make_key({"X": "007"}, "R2010")
+
+
+def test_case_collision_not_served_from_cache(fresh_cache):
+    first = {"NSPAN": 2, "span1": 30}
+    second = {"NSPAN": 2, "SPAN1": 30}
+    _render(first)
+    served = _render(second)
+    assert fresh_cache.hits == 0
+    assert _stable(served) == _stable(_uncached(second))
+
+
+def test_text_collision_not_served_from_cache(fresh_cache):
+    _render({"PROJECT_NAME": "007"})
+    served = _render({"PROJECT_NAME": "7"})
+    assert fresh_cache.hits == 0
+    assert b"Project: 7\n" in served and b"Project: 007" not in served
+
+
+def test_repeat_render_is_a_hit(fresh_cache):
+    first = _render({"NSPAN": 2, "SPAN1": 30})
+    assert _render({"NSPAN": 2.0, "SPAN1": 30.0}) == first
+    assert fresh_cache.hits == 1 and fresh_cache.misses == 1
+
+
+# ── Memory tier ───────────────────────────────────────────────────────────────
+
+def test_lru_evicts_oldest_by_entry_count():
+    cache = RenderCache(max_entries=2)
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    assert cache.get("a") == b"1"  # 'a' becomes most recent
+    cache.put("c", b"3")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1" and cache.get("c") == b"3"
+    assert cache.evictions == 1
+
+
+def test_lru_evicts_by_byte_budget():
+    cache = RenderCache(max_bytes=10, max_entries=100)
+    cache.put("a", b"x" * 6)
+    cache.put("b", b"y" * 6)
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 6
+    cache.put("big", b"z" * 11)  # larger than the budget: not stored
+    assert cache.get("big") is None and cache.get("b") == b"y" * 6
+
+
+# ── Disk tier ─────────────────────────────────────────────────────────────────
+
+def test_disk_tier_serves_after_memory_clear(tmp_path):
+    cache = RenderCache(disk_dir=tmp_path)
+    cache.put("k1", b"payload")
+    cache.clear()
+    assert cache.get("k1") == b"payload"
+    assert cache.disk_hits == 1
+    assert cache.stats()["entries"] == 1  # promoted back to memory
+
+
+def test_disk_tier_prunes_oldest_over_budget(tmp_path):
+    import os
+
+    cache = RenderCache(disk_dir=tmp_path, max_disk_bytes=10, max_bytes=0)
+    cache.put("old", b"a" * 6)
+    old_path = cache._disk_path("old")
+    os.utime(old_path, (1, 1))
+    cache.put("new", b"b" * 6)
+    assert not old_path.exists()
+    assert cache.get("new") == b"b" * 6
+    assert cache.get("old") is None
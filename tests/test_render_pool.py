@@ -0,0 +1,173 @@
+"""Render pool admission control, timeouts, stuck workers and cache counters."""
+
+import asyncio
+import io
+import signal
+import uuid
+import zipfile
+from concurrent.futures import Future
+
+import pytest
+
+from bridge_gad import render_pool
+from bridge_gad.render_pool import PoolSaturated, RenderPool, RenderTask, RenderTimeout
+
+
+def _params():
+    # Unique per call so no render cache inherited from the parent can serve it
+    return {"NSPAN": 2, "SPAN1": 20, "PROJECT_NAME": uuid.uuid4().hex}
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def make(**kwargs):
+        kwargs.setdefault("warm", False)
+        pool = RenderPool(**kwargs)
+        pools.append(pool)
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.shutdown()
+
+
+# ── Admission ─────────────────────────────────────────────────────────────────
+
+def test_admits_workers_plus_queue_then_rejects(make_pool):
+    pool = make_pool(workers=1, queue=1)
+    first = pool.submit(_params())
+    second = pool.submit(_params())
+    with pytest.raises(PoolSaturated) as exc:
+        pool.submit(_params())
+    assert exc.value.retry_after >= 1
+    assert pool.rejected == 1 and pool.in_flight == 2
+
+    async def drain():
+        return [await pool.wait(first), await pool.wait(second)]
+
+    results = asyncio.run(drain())
+    assert all(r.dxf_bytes for r in results)
+    assert pool.in_flight == 0
+    assert pool.submit(_params()) is not None  # capacity is back
+
+
+# ── Timeouts ──────────────────────────────────────────────────────────────────
+
+def test_render_over_budget_times_out_and_worker_survives(make_pool):
+    pool = make_pool(workers=1, timeout=0.001)
+    with pytest.raises(RenderTimeout):
+        asyncio.run(pool.run(_params()))
+    assert pool.timeouts == 1
+    result = asyncio.run(pool.run(_params(), timeout=60))
+    assert result.dxf_bytes and pool.recycled == 0
+
+
+def test_alarm_during_disarm_is_reported_as_timeout(monkeypatch):
+    calls = []
+
+    def setitimer(which, seconds, interval=0.0):
+        calls.append(seconds)
+        if seconds == 0 and len(calls) == 2:
+            raise render_pool._Interrupted("timeout")  # the alarm beat the disarm
+
+    monkeypatch.setattr(signal, "setitimer", setitimer)
+    previous = signal.getsignal(signal.SIGALRM)
+    try:
+        outcome, payload, _, _ = render_pool._render(1, _params(), "R2010", 30.0)
+    finally:
+        signal.signal(signal.SIGALRM, previous)
+    assert (outcome, payload) == ("timeout", None)
+    assert calls == [30.0, 0]
+
+
+def test_written_off_worker_is_freed_when_its_render_finishes():
+    pool = RenderPool(workers=2, warm=False)
+    future = Future()
+    pool._write_off(RenderTask(1, future, timeout=1.0))
+    assert pool.stuck == 1 and pool.recycled == 0
+    future.set_result(None)
+    assert pool.stuck == 0
+    # A second write-off alone must not count the finished one again
+    pool._write_off(RenderTask(2, Future(), timeout=1.0))
+    assert pool.stuck == 1 and pool.recycled == 0
+
+
+# ── Worker cache counters ─────────────────────────────────────────────────────
+
+def test_worker_cache_lookups_reach_the_parent(make_pool):
+    pool = make_pool(workers=1)
+    params = _params()
+
+    async def twice():
+        return [await pool.run(params), await pool.run(params)]
+
+    first, second = asyncio.run(twice())
+    assert first.cache_counts["render_cache"] == {"hits": 0, "misses": 1, "disk_hits": 0}
+    assert second.cache_counts["render_cache"]["hits"] == 1
+    assert second.profile.cache_hit
+    assert pool.stats()["worker_caches"]["render_cache"]["hits"] == 1
+    assert pool.stats()["worker_caches"]["render_cache"]["misses"] == 1
+
+
+# ── API ───────────────────────────────────────────────────────────────────────
+
+@pytest.fixture
+def api_client(monkeypatch, make_pool):
+    from fastapi.testclient import TestClient
+
+    from bridge_gad import api
+
+    def client(**pool_kwargs):
+        pool = make_pool(**pool_kwargs)
+        monkeypatch.setattr(api, "_pool", pool)
+        return TestClient(api.app), pool
+
+    return client
+
+
+def test_full_pool_answers_429(api_client):
+    client, pool = api_client(workers=1, queue=0)
+    with client as c:
+        busy = pool.submit(_params())
+        response = c.post("/predict/params", json={"parameters": _params()})
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+        asyncio.run(pool.wait(busy))
+
+
+def test_bundle_renders_in_the_pool(api_client):
+    from pathlib import Path
+
+    workbook = Path(__file__).resolve().parent.parent / "inputs" / "sample_input.xlsx"
+    upload = {"excel_file": (workbook.name, workbook.read_bytes())}
+    client, pool = api_client(workers=1, queue=0)
+    with client as c:
+        busy = pool.submit(_params())
+        assert c.post("/bundle", params={"formats": "json"}, files=upload).status_code == 429
+        asyncio.run(pool.wait(busy))
+
+        response = c.post("/bundle", params={"formats": "dxf,json"}, files=upload)
+        assert response.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
+        assert zf.namelist() == ["bridge_drawing.dxf", "bridge_drawing.json"]
+    assert pool.completed == 2
+
+
+def test_render_over_budget_answers_504(api_client):
+    client, _ = api_client(workers=1, timeout=0.001)
+    with client as c:
+        response = c.post("/predict/params", json={"parameters": _params()})
+    assert response.status_code == 504
+
+
+def test_metrics_count_worker_cache_lookups(api_client):
+    client, _ = api_client(workers=1)
+    body = {"parameters": _params()}
+    with client as c:
+        for _ in range(2):
+            assert c.post("/predict/params", json=body).status_code == 200
+        render_cache = c.get("/metrics").json()["render_cache"]
+    assert render_cache["workers"]["hits"] == 1 and render_cache["workers"]["misses"] == 1
+    assert render_cache["hits"] >= 1 and render_cache["misses"] >= 1
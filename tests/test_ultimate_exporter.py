@@ -0,0 +1,54 @@
+"""UltimateExporter.export_all_formats: every format written, document read on one thread."""
+
+import json
+import threading
+import zipfile
+
+import ezdxf
+import matplotlib
+
+matplotlib.use("Agg")
+
+import pytest  # noqa: E402
+
+from bridge_gad.bridge_generator import BridgeGADGenerator  # noqa: E402
+from bridge_gad.ultimate_exporter import UltimateExporter  # noqa: E402
+
+FORMATS = ["dxf", "pdf", "svg", "png", "html", "json"]
+
+
+@pytest.fixture
+def exporter():
+    gen = BridgeGADGenerator(use_cache=False)
+    assert gen.generate_bytes({"NSPAN": 3, "SPAN1": 20}) is not None
+    return UltimateExporter(gen)
+
+
+def test_exports_every_format(exporter, tmp_path):
+    results = exporter.export_all_formats(tmp_path / "gad", formats=FORMATS)
+    assert list(results) == FORMATS + ["zip"]
+    assert all(path and path.stat().st_size for path in results.values())
+
+    doc = ezdxf.readfile(results["dxf"])
+    assert not doc.audit().has_errors
+    assert len(doc.modelspace()) == exporter.geometry.entity_count
+    payload = json.loads(results["json"].read_text(encoding="utf-8"))
+    assert payload["statistics"]["total_elements"] == exporter.geometry.entity_count
+    with zipfile.ZipFile(results["zip"]) as zf:
+        assert sorted(zf.namelist()) == sorted(f"gad.{fmt}" for fmt in FORMATS)
+
+
+def test_document_is_only_read_on_the_calling_thread(exporter, tmp_path, monkeypatch):
+    threads = []
+    for name in ("_format_bytes", "_json_payload", "_extract_drawing_elements"):
+        original = getattr(exporter, name)
+
+        def record(*args, _original=original, **kwargs):
+            threads.append(threading.current_thread())
+            return _original(*args, **kwargs)
+
+        monkeypatch.setattr(exporter, name, record)
+
+    results = exporter.export_all_formats(tmp_path / "gad", formats=["dxf", "json", "html", "png"])
+    assert all(results.values())
+    assert threads and set(threads) == {threading.current_thread()}
@@ -0,0 +1,52 @@
+"""Worker warm-up: the report, the prebuilt prototypes and warm render-pool workers."""
+
+import time
+
+from bridge_gad import doc_factory, warmup
+from bridge_gad.render_pool import RenderPool
+
+
+def test_report_has_every_step_and_builds_the_prototype():
+    doc_factory.clear_prototypes()
+    report = warmup.warm_up()
+    assert list(report) == [name for name, _ in warmup._STEPS] + ["total"]
+    assert all(ms >= 0 for ms in report.values())
+    assert report["total"] >= max(ms for name, ms in report.items() if name != "total")
+    assert doc_factory._prototypes.get(("gad", "R2010"))
+
+
+def test_failing_step_is_skipped(monkeypatch, caplog):
+    ran = []
+
+    def broken():
+        raise RuntimeError("no fonts")
+
+    monkeypatch.setattr(warmup, "_STEPS", (("broken", broken), ("next", lambda: ran.append(1))))
+    report = warmup.warm_up()
+    assert set(report) == {"broken", "next", "total"} and ran == [1]
+    assert "Warm-up step broken failed: no fonts" in caplog.text
+
+
+def test_started_pool_reports_warm_workers():
+    pool = RenderPool(workers=2, warm=True)
+    try:
+        pool.start()
+        deadline = time.monotonic() + 60
+        while len(pool.warmups) < 2:
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+        stats = pool.stats()
+        assert stats["warm_workers"] == 2 and len(stats["warmup_ms"]) == 2
+        assert all("template_documents" in report for report in pool.warmups.values())
+    finally:
+        pool.shutdown()
+
+
+def test_cold_pool_reports_nothing():
+    pool = RenderPool(workers=1, warm=False)
+    try:
+        pool.start()
+        time.sleep(0.5)
+        assert pool.warmups == {} and pool.stats()["warm_workers"] == 0
+    finally:
+        pool.shutdown()
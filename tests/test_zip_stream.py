@@ -0,0 +1,57 @@
+"""Streaming ZIP writer: compression level, stored suffixes and /bundle formats."""
+
+import io
+import random
+import zipfile
+
+from bridge_gad.zip_stream import zip_bytes
+
+
+def _text(n=200_000):
+    rng = random.Random(0)
+    words = ["SPAN", "PIER", "ABUTMENT", "LINE", "10.5", "0.0", "LAYER", "DIMENSION"]
+    return " ".join(rng.choice(words) for _ in range(n // 6)).encode()
+
+
+def _sizes(archive):
+    with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+        assert zf.testzip() is None
+        return {i.filename: (i.compress_type, i.compress_size) for i in zf.infolist()}
+
+
+def test_compression_level_is_honoured():
+    data = _text()
+    fast = _sizes(zip_bytes([("a.dxf", data)], compresslevel=1))["a.dxf"]
+    best = _sizes(zip_bytes([("a.dxf", data)], compresslevel=9))["a.dxf"]
+    assert fast[0] == best[0] == zipfile.ZIP_DEFLATED
+    assert best[1] < fast[1]
+
+
+def test_stored_suffixes_and_level_zero():
+    sizes = _sizes(zip_bytes([("a.png", b"x" * 1000), ("b.dxf", b"y" * 1000)]))
+    assert sizes["a.png"] == (zipfile.ZIP_STORED, 1000)
+    assert sizes["b.dxf"][0] == zipfile.ZIP_DEFLATED
+    assert _sizes(zip_bytes([("b.dxf", b"y" * 1000)], compresslevel=0))["b.dxf"] == (zipfile.ZIP_STORED, 1000)
+
+
+def test_bundle_renders_each_format_once(monkeypatch):
+    from pathlib import Path
+
+    from fastapi.testclient import TestClient
+
+    from bridge_gad import api
+    from bridge_gad.ultimate_exporter import UltimateExporter
+
+    seen = []
+    monkeypatch.setattr(
+        UltimateExporter, "iter_zip_bundle",
+        lambda self, name, formats, compresslevel=None: seen.append(formats) or iter([b""]),
+    )
+    workbook = Path(__file__).resolve().parent.parent / "inputs" / "sample_input.xlsx"
+    with TestClient(api.app) as client:
+        response = client.post(
+            "/bundle", params={"formats": "dxf, DXF,json,dxf"},
+            files={"excel_file": (workbook.name, workbook.read_bytes())},
+        )
+    assert response.status_code == 200
+    assert seen == [["dxf", "json"]]